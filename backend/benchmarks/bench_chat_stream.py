@@ -0,0 +1,99 @@
+"""Time to first byte of POST /chat vs POST /chat/stream.
+
+Serves the backend (SQLite) and the mock LLM locally, fully offline:
+    uv run python -m benchmarks.bench_chat_stream --requests 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.mock_llm import _free_port, create_app, serve
+
+LLM_PORT = _free_port()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+os.environ["LLM_API_URL"] = f"http://127.0.0.1:{LLM_PORT}/v1/chat/completions"
+os.environ.setdefault("GROQ_API_KEY", "mock")
+# The mock has no rate limit; don't throttle to Groq's
+os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "100000000")
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+
+from src.database import engine, init_db  # noqa: E402
+from src.main import app  # noqa: E402
+
+USER_ID = "bench-user"
+
+
+def _auth_headers() -> dict[str, str]:
+    token = jwt.encode(
+        {"sub": USER_ID, "exp": int(time.time()) + 3600},
+        os.environ["BETTER_AUTH_SECRET"],
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _measure(base_url: str, path: str, n: int) -> dict[str, list[float]]:
+    """Time to first byte, to first reply text, and total, for n requests."""
+    timings: dict[str, list[float]] = {"ttfb": [], "first_text": [], "total": []}
+    async with httpx.AsyncClient(base_url=base_url, headers=_auth_headers()) as client:
+        for _ in range(n):
+            start = time.perf_counter()
+            first_byte = first_text = None
+            async with client.stream(
+                "POST", path, json={"message": "How am I doing this week?"}
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_raw():
+                    now = time.perf_counter()
+                    first_byte = first_byte or now
+                    # /chat sends the whole reply at once; /chat/stream sends
+                    # a start event first, then token events
+                    if first_text is None and (
+                        b"event: token" in chunk or not path.endswith("/stream")
+                    ):
+                        first_text = now
+            timings["ttfb"].append(first_byte - start)
+            timings["first_text"].append(first_text - start)
+            timings["total"].append(time.perf_counter() - start)
+    return timings
+
+
+def _ms(values: list[float]) -> str:
+    return f"p50 {statistics.median(values) * 1000:7.1f} ms"
+
+
+async def _setup_db() -> None:
+    await init_db()
+    # Pooled connections belong to this event loop, not the server's
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--token-delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    asyncio.run(_setup_db())
+    llm = create_app(latency=args.latency, token_delay=args.token_delay)
+    with serve(llm, port=LLM_PORT), serve(app) as base_url:
+        for path in (f"/api/{USER_ID}/chat", f"/api/{USER_ID}/chat/stream"):
+            t = asyncio.run(_measure(base_url, path, args.requests))
+            print(
+                f"{path:<28} TTFB {_ms(t['ttfb'])}   first text "
+                f"{_ms(t['first_text'])}   total {_ms(t['total'])}"
+            )
+
+
+if __name__ == "__main__":
+    main()
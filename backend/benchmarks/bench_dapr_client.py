@@ -0,0 +1,111 @@
+"""Task mutation latency and event delivery to the Dapr sidecar.
+
+Creates, updates and deletes tasks through the API (in process) while the
+outbox relay publishes their events to a fake sidecar on loopback, fully
+offline:
+    uv run python -m benchmarks.bench_dapr_client --tasks 200 --latency 0.005
+
+Reports mutation latency, sidecar requests for all events, and the time
+from commit to publication (outbox lag).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.fake_sidecar import create_app
+from benchmarks.mock_llm import _free_port, serve
+
+SIDECAR_PORT = _free_port()
+os.environ["DAPR_HTTP_PORT"] = str(SIDECAR_PORT)
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+
+from src.database import engine, init_db  # noqa: E402
+from src.http_clients import close_http_clients  # noqa: E402
+from src.main import app  # noqa: E402
+from src.outbox import outbox_lag, outbox_relay  # noqa: E402
+
+USER_ID = "bench-user"
+
+
+async def _mutations(n: int) -> list[float]:
+    token = jwt.encode(
+        {"sub": USER_ID, "exp": int(time.time()) + 3600},
+        os.environ["BETTER_AUTH_SECRET"],
+        algorithm="HS256",
+    )
+    timings = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        url = f"/api/{USER_ID}/tasks"
+        for i in range(n):
+            for request in (
+                lambda: client.post(url, json={"title": f"task {i}"}),
+                lambda: client.put(f"{url}/{task_id}", json={"title": "renamed"}),
+                lambda: client.delete(f"{url}/{task_id}"),
+            ):
+                start = time.perf_counter()
+                response = await request()
+                timings.append(time.perf_counter() - start)
+                response.raise_for_status()
+                if response.status_code == 201:
+                    task_id = response.json()["id"]
+    return timings
+
+
+async def _run(sidecar, tasks: int) -> None:
+    await init_db()
+    await _mutations(10)  # Warm up
+    await outbox_relay.relay_once()
+
+    outbox_relay.start()
+    lag_count, lag_sum = outbox_lag.count(), outbox_lag.sum()
+    sidecar.state.published = sidecar.state.publish_requests = 0
+    timings = await _mutations(tasks)
+    while sidecar.state.published < 3 * tasks:
+        await asyncio.sleep(0.01)
+    await outbox_relay.stop()
+
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    lag = (outbox_lag.sum() - lag_sum) / (outbox_lag.count() - lag_count)
+    print(
+        f"mutation         mean {statistics.mean(ms):6.2f} ms   "
+        f"p50 {statistics.median(ms):6.2f} ms   p95 {p95:6.2f} ms"
+    )
+    print(
+        f"delivery         {sidecar.state.published} events in "
+        f"{sidecar.state.publish_requests} requests, "
+        f"mean outbox lag {lag * 1000:.1f} ms"
+    )
+
+    await close_http_clients()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="fake sidecar latency per request (seconds)")
+    args = parser.parse_args()
+
+    sidecar = create_app(args.latency)
+    with serve(sidecar, port=SIDECAR_PORT):
+        asyncio.run(_run(sidecar, args.tasks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Fast-path intent router: hit rate on the bundled corpus and latency saved.
+
+Runs TodoAgent.chat on every corpus phrasing with the router on and off,
+against SQLite and the mock LLM, fully offline:
+    uv run python -m benchmarks.bench_intent_router --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.mock_llm import _free_port, create_app, serve
+
+LLM_PORT = _free_port()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+os.environ["LLM_API_URL"] = f"http://127.0.0.1:{LLM_PORT}/v1/chat/completions"
+os.environ.setdefault("GROQ_API_KEY", "mock")
+# The mock has no rate limit; don't throttle to Groq's
+os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "100000000")
+
+from benchmarks.intent_corpus import CORPUS  # noqa: E402
+from src.agent import TodoAgent  # noqa: E402
+from src.database import async_session_maker, engine, init_db  # noqa: E402
+from src.http_clients import close_http_clients  # noqa: E402
+from src.intent_router import route  # noqa: E402
+from src.models import Task  # noqa: E402
+
+USER_ID = "bench-user"
+
+
+async def _seed() -> None:
+    async with async_session_maker() as session:
+        for i in range(25):
+            session.add(Task(title=f"task {i}", user_id=USER_ID, completed=i % 3 == 0))
+        await session.commit()
+
+
+async def _chat_latency(message: str, fast_path: bool) -> float:
+    agent = TodoAgent(USER_ID)
+    agent.fast_path = fast_path
+    start = time.perf_counter()
+    await agent.chat(message, [])
+    return time.perf_counter() - start
+
+
+async def _run(rounds: int) -> None:
+    await init_db()
+    await _seed()
+
+    expected_hits = [phrase for phrase, intent in CORPUS if intent is not None]
+    hits = [phrase for phrase, _ in CORPUS if route(phrase) is not None]
+    correct = sum(route(phrase) == intent for phrase, intent in CORPUS)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for phrase, _ in CORPUS:
+            route(phrase)
+    per_route = (time.perf_counter() - start) / (rounds * len(CORPUS))
+
+    print(f"corpus: {len(CORPUS)} phrasings, {len(expected_hits)} routable")
+    print(f"hit rate: {len(hits)}/{len(CORPUS)} = {len(hits) / len(CORPUS):.0%}")
+    print(f"accuracy: {correct}/{len(CORPUS)} (matches expected intent or fallback)")
+    print(f"router cost: {per_route * 1e6:.1f} us per message")
+
+    routed = [await _chat_latency(phrase, True) for phrase in hits]
+    llm = [await _chat_latency(phrase, False) for phrase in hits]
+    print(
+        f"routable messages: fast path p50 {statistics.median(routed) * 1000:.1f} ms"
+        f" vs LLM p50 {statistics.median(llm) * 1000:.1f} ms"
+        " (mock LLM answers in one round; tool turns take two)"
+    )
+    await close_http_clients()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    with serve(create_app(latency=args.latency), port=LLM_PORT):
+        asyncio.run(_run(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
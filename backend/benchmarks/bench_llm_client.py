@@ -0,0 +1,73 @@
+"""Latency of LLM calls: new client per call vs the shared pooled client.
+
+Runs against the local mock LLM (no network, no API key):
+    uv run python -m benchmarks.bench_llm_client --requests 200
+
+The mock is plain HTTP on loopback, so this measures connection setup and
+pool reuse only; against Groq each new client also pays a TLS handshake.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+
+import httpx  # noqa: E402
+
+from benchmarks.mock_llm import create_app, serve  # noqa: E402
+from src.http_clients import create_llm_client  # noqa: E402
+
+PAYLOAD = {
+    "model": "mock",
+    "messages": [{"role": "user", "content": "What's pending?"}],
+}
+
+
+async def _per_call_client(url: str, n: int) -> list[float]:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            (await client.post(url, json=PAYLOAD)).raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def _shared_client(url: str, n: int) -> list[float]:
+    timings = []
+    async with create_llm_client() as client:
+        for _ in range(n):
+            start = time.perf_counter()
+            (await client.post(url, json=PAYLOAD)).raise_for_status()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: list[float]) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{name:<18} mean {statistics.mean(ms):7.2f} ms   "
+        f"p50 {statistics.median(ms):7.2f} ms   p95 {p95:7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with serve(create_app()) as base_url:
+        url = f"{base_url}/v1/chat/completions"
+        # Warm up the server before timing
+        asyncio.run(_shared_client(url, 10))
+        _report("client per call", asyncio.run(_per_call_client(url, args.requests)))
+        _report("shared client", asyncio.run(_shared_client(url, args.requests)))
+
+
+if __name__ == "__main__":
+    main()
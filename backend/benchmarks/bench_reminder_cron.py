@@ -0,0 +1,131 @@
+"""Reminder cron: one unbounded scan with inline publishes vs chunked claims.
+
+Seeds due reminders, then delivers them all to a fake sidecar on loopback,
+fully offline:
+    uv run python -m benchmarks.bench_reminder_cron --reminders 5000 --latency 0.001
+
+- inline: the old handler, one SELECT of every due task and one publish
+  request per reminder, committed at the end
+- chunked: process_due_reminders (chunks claimed with SKIP LOCKED, events
+  written to the outbox) with the outbox relay bulk publishing them
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.fake_sidecar import create_app
+from benchmarks.mock_llm import _free_port, serve
+
+SIDECAR_PORT = _free_port()
+os.environ["DAPR_HTTP_PORT"] = str(SIDECAR_PORT)
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+
+from sqlalchemy import update  # noqa: E402
+from sqlmodel import select  # noqa: E402
+
+from src.database import async_session_maker, engine, init_db  # noqa: E402
+from src.events import ReminderEvent, event_publisher  # noqa: E402
+from src.http_clients import close_http_clients  # noqa: E402
+from src.models import Task  # noqa: E402
+from src.outbox import outbox_relay  # noqa: E402
+from src.routes.dapr_events import process_due_reminders  # noqa: E402
+
+DUE = datetime(2026, 1, 1)
+
+
+async def _seed(reminders: int) -> None:
+    async with async_session_maker() as session:
+        session.add_all(
+            Task(
+                title=f"task {i}",
+                user_id=f"user-{i % 50}",
+                reminder_at=DUE + timedelta(seconds=i),
+            )
+            for i in range(reminders)
+        )
+        await session.commit()
+
+
+async def _rearm() -> None:
+    async with async_session_maker() as session:
+        await session.execute(update(Task).values(reminder_at=DUE))
+        await session.commit()
+
+
+async def _inline(now: datetime) -> None:
+    """reminder_cron_handler before chunking and the outbox."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Task).where(
+                Task.reminder_at <= now,
+                Task.completed == False,  # noqa: E712
+            )
+        )
+        tasks_due = result.scalars().all()
+        for task in tasks_due:
+            event = ReminderEvent(
+                task_id=task.id,
+                user_id=task.user_id,
+                title=task.title,
+                due_at=task.reminder_at,
+            )
+            await event_publisher.publish("reminders", event.model_dump(mode="json"))
+            task.reminder_at = None
+        await session.commit()
+
+
+async def _chunked(now: datetime) -> None:
+    while True:
+        _, more = await process_due_reminders(
+            now, chunk_size=500, max_reminders=5000
+        )
+        if not more:
+            return
+
+
+async def _run(sidecar, reminders: int) -> None:
+    await init_db()
+    await _seed(reminders)
+    now = datetime.utcnow()
+    outbox_relay.start()
+
+    for name, run in (("inline", _inline), ("chunked", _chunked)):
+        await _rearm()
+        sidecar.state.published = sidecar.state.publish_requests = 0
+        start = time.perf_counter()
+        await run(now)
+        claimed = time.perf_counter() - start
+        while sidecar.state.published < reminders:
+            await asyncio.sleep(0.005)
+        delivered = time.perf_counter() - start
+        print(
+            f"{name:<8} cron run {claimed * 1000:7.0f} ms   all delivered "
+            f"{delivered * 1000:7.0f} ms   ({sidecar.state.publish_requests} requests)"
+        )
+
+    await outbox_relay.stop()
+    await close_http_clients()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reminders", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="fake sidecar latency per request (seconds)")
+    args = parser.parse_args()
+
+    sidecar = create_app(args.latency)
+    with serve(sidecar, port=SIDECAR_PORT):
+        asyncio.run(_run(sidecar, args.reminders))
+
+
+if __name__ == "__main__":
+    main()
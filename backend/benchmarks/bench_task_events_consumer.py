@@ -0,0 +1,86 @@
+"""task-events consumer throughput: one event per delivery vs bulk.
+
+Delivers TaskCompleted events for recurring tasks (each creates the next
+instance) to the consumer in process, as Dapr would with and without
+bulkSubscribe, against SQLite:
+    uv run python -m benchmarks.bench_task_events_consumer --events 1000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+
+import httpx  # noqa: E402
+
+from src.database import engine, init_db  # noqa: E402
+from src.main import app  # noqa: E402
+
+
+def _event(i: int) -> dict:
+    return {
+        "event_type": "TaskCompleted",
+        "task_id": i,
+        "user_id": f"user-{i % 20}",
+        "title": f"task {i}",
+        "recurrence": "daily",
+        "timestamp": "2026-01-01T00:00:00",
+    }
+
+
+async def _single(client: httpx.AsyncClient, events: list[dict]) -> None:
+    for event in events:
+        response = await client.post("/events/task-events", json=event)
+        response.raise_for_status()
+
+
+async def _bulk(client: httpx.AsyncClient, events: list[dict], size: int) -> None:
+    for start in range(0, len(events), size):
+        entries = [
+            {"entryId": str(i), "event": event}
+            for i, event in enumerate(events[start:start + size])
+        ]
+        response = await client.post(
+            "/events/task-events/bulk", json={"entries": entries}
+        )
+        assert all(s["status"] == "SUCCESS" for s in response.json()["statuses"])
+
+
+async def _run(n: int, size: int) -> None:
+    await init_db()
+    events = [_event(i) for i in range(n)]
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await _single(client, events[:20])  # Warm up
+        for name, deliver in (
+            ("single", _single(client, events)),
+            (f"bulk {size}", _bulk(client, events, size)),
+        ):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):  # Audit log lines
+                await deliver
+            elapsed = time.perf_counter() - start
+            print(f"{name:<10} {n / elapsed:8.0f} events/s   ({elapsed:.2f} s)")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(_run(args.events, args.batch))
+
+
+if __name__ == "__main__":
+    main()
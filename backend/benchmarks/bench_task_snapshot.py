@@ -0,0 +1,143 @@
+"""Task snapshot in the prompt: LLM round trips saved on a question corpus.
+
+Runs TodoAgent.chat on every question with CHAT_TASK_SNAPSHOT off and on,
+against SQLite and the mock LLM (which, like a compliant model, answers
+pending-task questions from a complete snapshot), fully offline:
+    uv run python -m benchmarks.bench_task_snapshot --tasks 20
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from benchmarks.mock_llm import ScriptRule, _free_port, create_app, serve
+
+LLM_PORT = _free_port()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+os.environ["LLM_API_URL"] = f"http://127.0.0.1:{LLM_PORT}/v1/chat/completions"
+os.environ.setdefault("GROQ_API_KEY", "mock")
+# The mock has no rate limit; don't throttle to Groq's
+os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "100000000")
+
+from src.agent import TodoAgent  # noqa: E402
+from src.cache import LRUCache  # noqa: E402
+from src.database import async_session_maker, engine, init_db  # noqa: E402
+from src.http_clients import close_http_clients  # noqa: E402
+from src.intent_router import route  # noqa: E402
+from src.models import Priority, Task  # noqa: E402
+
+USER_ID = "bench-user"
+
+PENDING = {"name": "list_tasks", "arguments": {"status": "pending"}}
+SCRIPT = [
+    ScriptRule(r"finished|completed|done last", [
+        {"name": "list_tasks", "arguments": {"status": "completed"}},
+    ]),
+    ScriptRule(r"^add ", [{"name": "add_task", "arguments": {"title": "x"}}]),
+    ScriptRule(r"overdue|late|behind", [
+        {"name": "list_tasks", "arguments": {"status": "pending", "due": "overdue"}},
+    ]),
+    ScriptRule(r"today|tonight", [
+        {"name": "list_tasks", "arguments": {"status": "pending", "due": "today"}},
+    ]),
+    ScriptRule(r"week", [
+        {"name": "list_tasks", "arguments": {"status": "pending", "due": "week"}},
+    ]),
+    ScriptRule(r"urgent|important|high", [
+        {"name": "list_tasks", "arguments": {"status": "pending", "priority": "high"}},
+    ]),
+    ScriptRule(r"plate|left|next|how many|busy|focus|first|remind", [PENDING]),
+]
+
+# Questions the intent router leaves to the model
+QUESTIONS = [
+    "what's on my plate?",
+    "what should I focus on first?",
+    "anything overdue?",
+    "am I behind on anything?",
+    "what's due today?",
+    "anything I need to do tonight?",
+    "what's coming up this week?",
+    "how busy is my week?",
+    "anything urgent?",
+    "what are my high priority items?",
+    "how many tasks do I have left?",
+    "what's next?",
+    "remind me what I still need to do",
+    "what did I get done last week?",   # Needs completed tasks
+    "which ones have I finished?",      # Needs completed tasks
+    "add buy stamps",                   # A write
+    "hi there!",                        # No tasks needed
+]
+
+
+async def _seed(tasks: int) -> None:
+    now = datetime.utcnow()
+    async with async_session_maker() as session:
+        for i in range(tasks):
+            session.add(Task(
+                title=f"task {i}",
+                user_id=USER_ID,
+                completed=i % 4 == 0,
+                priority=Priority.HIGH if i % 5 == 0 else Priority.MEDIUM,
+                due_date=now + timedelta(days=i - 3) if i % 2 else None,
+            ))
+        await session.commit()
+
+
+async def _ask(llm, question: str, snapshot: bool) -> tuple[int, int]:
+    """LLM requests and prompt tokens for one question."""
+    requests, tokens = llm.state.requests, llm.state.prompt_tokens
+    # No reply cache, so every run reaches the model
+    agent = TodoAgent(USER_ID, reply_cache=LRUCache(maxsize=0))
+    agent.task_snapshot = snapshot
+    await agent.chat(question, [])
+    return llm.state.requests - requests, llm.state.prompt_tokens - tokens
+
+
+async def _run(llm, tasks: int) -> None:
+    await init_db()
+    await _seed(tasks)
+    assert not any(route(q) for q in QUESTIONS), "corpus must bypass the router"
+
+    totals = {}
+    print(f"{'question':<40} {'off':>4} {'on':>4}")
+    for question in QUESTIONS:
+        off = await _ask(llm, question, snapshot=False)
+        on = await _ask(llm, question, snapshot=True)
+        print(f"{question:<40} {off[0]:>4} {on[0]:>4}")
+        for name, (calls, tokens) in (("off", off), ("on", on)):
+            total_calls, total_tokens = totals.get(name, (0, 0))
+            totals[name] = (total_calls + calls, total_tokens + tokens)
+
+    (off_calls, off_tokens), (on_calls, on_tokens) = totals["off"], totals["on"]
+    n = len(QUESTIONS)
+    print(
+        f"\n{n} questions, {tasks} tasks seeded: {off_calls} -> {on_calls} "
+        f"LLM round trips ({off_calls - on_calls} saved, "
+        f"{(off_calls - on_calls) / off_calls:.0%})"
+    )
+    print(
+        f"prompt tokens per question: {off_tokens / n:.0f} -> {on_tokens / n:.0f}"
+    )
+    await close_http_clients()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20)
+    args = parser.parse_args()
+
+    llm = create_app(script=SCRIPT)
+    with serve(llm, port=LLM_PORT):
+        asyncio.run(_run(llm, args.tasks))
+
+
+if __name__ == "__main__":
+    main()
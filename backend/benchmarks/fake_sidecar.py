@@ -0,0 +1,65 @@
+"""Local stand-in for the Dapr sidecar's HTTP API.
+
+Accepts pub/sub publishes, single and bulk (and answers service
+invocation, secrets and jobs calls) so event publishing can be benchmarked
+without Dapr or Kafka:
+    uv run python -m benchmarks.fake_sidecar --port 3500 --latency 0.001
+then run the backend with DAPR_HTTP_PORT=3500.
+"""
+
+import argparse
+import asyncio
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+
+def create_app(latency: float = 0.0) -> FastAPI:
+    """Build the fake sidecar; every call waits `latency` seconds."""
+    app = FastAPI(title="Fake Dapr sidecar")
+    app.state.published = 0
+    app.state.publish_requests = 0
+
+    @app.post("/v1.0/publish/{pubsub}/{topic}")
+    async def publish(pubsub: str, topic: str, request: Request) -> Response:
+        await request.body()
+        if latency:
+            await asyncio.sleep(latency)
+        app.state.published += 1
+        app.state.publish_requests += 1
+        return Response(status_code=204)
+
+    @app.post("/v1.0-alpha1/publish/bulk/{pubsub}/{topic}")
+    async def publish_bulk(pubsub: str, topic: str, request: Request) -> Response:
+        entries = await request.json()
+        if latency:
+            await asyncio.sleep(latency)
+        app.state.published += len(entries)
+        app.state.publish_requests += 1
+        return Response(status_code=204)
+
+    @app.api_route("/v1.0/invoke/{app_id}/method/{method}", methods=["GET", "POST"])
+    async def invoke(app_id: str, method: str) -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/v1.0/secrets/{store}/{name}")
+    async def secret(store: str, name: str) -> dict[str, str]:
+        return {}
+
+    @app.api_route("/v1.0-alpha1/jobs/{name}", methods=["POST", "DELETE"])
+    async def job(name: str) -> Response:
+        return Response(status_code=204)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=3500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
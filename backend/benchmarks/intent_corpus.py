@@ -0,0 +1,83 @@
+"""Chat phrasings with the fast-path intent each should (or shouldn't) get.
+
+Used by bench_intent_router and tests/test_intent_router.py. Entries with
+None must fall through to the LLM: they need dates, titles, several tools,
+or context the router can't resolve.
+"""
+
+from src.intent_router import Intent
+
+PENDING = Intent("list_tasks", {"status": "pending"})
+COMPLETED = Intent("list_tasks", {"status": "completed"})
+ALL = Intent("list_tasks", {"status": "all"})
+
+
+def complete(task_id: int) -> Intent:
+    return Intent("complete_task", {"task_id": task_id})
+
+
+def delete(task_id: int) -> Intent:
+    return Intent("delete_task", {"task_id": task_id})
+
+
+CORPUS: list[tuple[str, Intent | None]] = [
+    # Listing
+    ("show my tasks", ALL),
+    ("Show my tasks", ALL),
+    ("show me all my tasks!", ALL),
+    ("list tasks", ALL),
+    ("list my todos", ALL),
+    ("what are my tasks?", ALL),
+    ("my tasks", ALL),
+    ("view my to-do list", ALL),
+    ("Can you show my tasks please?", ALL),
+    ("what's pending?", PENDING),
+    ("What’s pending", PENDING),
+    ("whats pending", PENDING),
+    ("what is still pending?", PENDING),
+    ("what's left to do?", PENDING),
+    ("what do I still have to do?", PENDING),
+    ("show pending tasks", PENDING),
+    ("list my open tasks", PENDING),
+    ("show me my incomplete todos", PENDING),
+    ("pending", PENDING),
+    ("show completed tasks", COMPLETED),
+    ("list my done tasks", COMPLETED),
+    ("what have I finished?", COMPLETED),
+    ("what did I complete", COMPLETED),
+    # Completing
+    ("complete task 12", complete(12)),
+    ("Complete 3", complete(3)),
+    ("finish task #7", complete(7)),
+    ("mark task 3 as done", complete(3)),
+    ("mark 5 complete", complete(5)),
+    ("task 8 is done", complete(8)),
+    ("#2 done", complete(2)),
+    ("I finished task 4", complete(4)),
+    ("check off task 10", complete(10)),
+    # Deleting
+    ("delete 4", delete(4)),
+    ("delete task 4", delete(4)),
+    ("remove task #19", delete(19)),
+    ("please drop task 6", delete(6)),
+    ("trash 21.", delete(21)),
+    # Needs the model
+    ("add a task to buy milk", None),
+    ("add high priority task finish report due tomorrow", None),
+    ("remind me to call mom at 5pm", None),
+    ("add three tasks: milk, eggs, bread and show pending", None),
+    ("complete task 12 and 13", None),
+    ("delete all completed tasks", None),
+    ("delete 4 tasks", None),
+    ("mark the grocery task as done", None),
+    ("rename task 3 to call the bank", None),
+    ("what's due this week?", None),
+    ("which tasks are high priority?", None),
+    ("delete it", None),
+    ("yes, do that", None),
+    ("thanks!", None),
+    ("hi", None),
+    ("how do I use this app?", None),
+    ("show my tasks about the garden", None),
+    ("I didn't finish task 4", None),
+]
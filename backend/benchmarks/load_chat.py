@@ -0,0 +1,192 @@
+"""End-to-end chat load test: N concurrent conversations against POST /chat.
+
+Serves the backend and the mock LLM locally, fully offline:
+    uv run python -m benchmarks.load_chat --conversations 50 --turns 5 \\
+        --latency 0.5 --tokens-per-second 80
+
+Uses a throwaway SQLite database unless DATABASE_URL is set; point it at
+Postgres for pool numbers that match production. Reports per-turn latency
+percentiles, throughput, LLM requests per turn, and how long requests
+waited to check out a pooled DB connection. Admission is unthrottled
+unless LLM_TOKENS_PER_MINUTE is set (e.g. 14000 to simulate Groq's limit).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+from benchmarks.mock_llm import (
+    _free_port,
+    add_mock_arguments,
+    app_from_arguments,
+    serve,
+)
+
+LLM_PORT = _free_port()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/load.db"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "benchmark")
+os.environ["LLM_API_URL"] = f"http://127.0.0.1:{LLM_PORT}/v1/chat/completions"
+os.environ.setdefault("GROQ_API_KEY", "mock")
+# The mock has no rate limit; don't throttle to Groq's
+os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "100000000")
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+from sqlalchemy.pool import Pool  # noqa: E402
+
+from src.database import engine, init_db  # noqa: E402
+from src.main import app  # noqa: E402
+
+# One conversation cycles through these, starting at its own offset; the
+# first three go to the (mock) model, "show my tasks" takes the fast path
+TURNS = [
+    "add a task to buy milk",
+    "what's on my plate today?",
+    "anything high priority?",
+    "show my tasks",
+    "thanks, that's all for now",
+]
+
+
+def _auth_headers(user_id: str) -> dict[str, str]:
+    token = jwt.encode(
+        {"sub": user_id, "exp": int(time.time()) + 3600},
+        os.environ["BETTER_AUTH_SECRET"],
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class PoolWaits:
+    """Record how long each checkout from a connection pool takes."""
+
+    def __init__(self, pool: Pool):
+        self.pool = pool
+        self.waits: list[float] = []
+        self.peak_checked_out = 0
+
+    def __enter__(self) -> "PoolWaits":
+        do_get = self.pool._do_get
+
+        def timed_do_get():
+            start = time.perf_counter()
+            try:
+                return do_get()
+            finally:
+                self.waits.append(time.perf_counter() - start)
+                self.peak_checked_out = max(
+                    self.peak_checked_out, self.pool.checkedout()
+                )
+
+        self.pool._do_get = timed_do_get
+        return self
+
+    def __exit__(self, *exc) -> None:
+        del self.pool._do_get
+
+
+@dataclass
+class LoadResult:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+
+async def _conversation(
+    client: httpx.AsyncClient,
+    index: int,
+    turns: int,
+    result: LoadResult,
+) -> None:
+    user_id = f"load-user-{index}"
+    headers = _auth_headers(user_id)
+    conversation_id = None
+    for turn in range(turns):
+        body = {"message": TURNS[(index + turn) % len(TURNS)]}
+        if conversation_id is not None:
+            body["conversation_id"] = conversation_id
+        start = time.perf_counter()
+        try:
+            response = await client.post(
+                f"/api/{user_id}/chat", json=body, headers=headers
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"conversation {index} turn {turn}: {e!r}")
+            result.errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - start)
+        conversation_id = response.json()["conversation_id"]
+
+
+async def _load(base_url: str, conversations: int, turns: int) -> LoadResult:
+    result = LoadResult()
+    limits = httpx.Limits(max_connections=conversations)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120.0
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _conversation(client, i, turns, result) for i in range(conversations)
+        ))
+        result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _percentiles(values: list[float]) -> str:
+    if len(values) < 2:
+        return "n/a"
+    q = statistics.quantiles(values, n=100, method="inclusive")
+    return " / ".join(f"{v * 1000:.0f}" for v in (q[49], q[94], q[98])) + " ms"
+
+
+async def _setup_db() -> None:
+    await init_db()
+    # Pooled connections belong to this event loop, not the server's
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=5)
+    add_mock_arguments(parser)
+    parser.set_defaults(latency=0.3, tokens_per_second=100.0)
+    args = parser.parse_args()
+
+    asyncio.run(_setup_db())
+    llm = app_from_arguments(args)
+    pool = engine.sync_engine.pool
+    with (
+        serve(llm, port=LLM_PORT),
+        serve(app) as base_url,
+        PoolWaits(pool) as pool_waits,
+    ):
+        result = asyncio.run(_load(base_url, args.conversations, args.turns))
+
+    turns = len(result.latencies)
+    waits = pool_waits.waits
+    print(
+        f"{args.conversations} conversations x {args.turns} turns, mock LLM "
+        f"{args.latency * 1000:.0f} ms + {args.tokens_per_second:g} tokens/s"
+    )
+    print(f"turns ok: {turns}   errors: {result.errors}")
+    print(f"latency p50 / p95 / p99: {_percentiles(result.latencies)}")
+    print(f"throughput: {turns / result.elapsed:.1f} turns/s")
+    print(f"LLM requests per turn: {llm.state.requests / max(turns, 1):.2f}")
+    print(
+        f"DB pool (size {pool.size()}): {len(waits)} checkouts, "
+        f"peak {pool_waits.peak_checked_out} in use, "
+        f"wait p50 / p95 / p99: {_percentiles(waits)}, "
+        f"max {max(waits, default=0) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
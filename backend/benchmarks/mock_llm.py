@@ -0,0 +1,280 @@
+"""Local stand-in for the OpenAI-compatible chat completions API.
+
+Lets the agent be exercised and benchmarked offline, without Groq.
+
+Run standalone:
+    uv run python -m benchmarks.mock_llm --port 9100 --latency 0.2 \\
+        --tokens-per-second 50 --script script.json
+then point the backend at it:
+    LLM_API_URL=http://127.0.0.1:9100/v1/chat/completions
+
+When the request offers `tools`, replies follow a script: the first rule
+whose `match` regex is found in the latest user message answers with its
+tool calls; once tool results come back the mock answers with text. A
+script file is a JSON list of rules, e.g.
+    [{"match": "add (?:a )?task (?P<title>.+)",
+      "tool_calls": [{"name": "add_task", "arguments": {"title": "{title}"}}]}]
+where "{group}" in a string argument is replaced by that regex group.
+
+Like a compliant model, the mock answers pending-task listings from a
+complete task snapshot in the system context (CHAT_TASK_SNAPSHOT) instead
+of calling list_tasks.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import socket
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+DEFAULT_REPLY = (
+    "You have 3 pending tasks: buy milk (high priority, due tomorrow), "
+    "call the plumber, and finish the quarterly report. Want me to mark "
+    "any of them as done or add a reminder?"
+)
+
+
+@dataclass
+class ScriptRule:
+    """Answer user messages matching `match` with these tool calls."""
+    match: str
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def calls_for(self, text: str) -> list[dict[str, Any]] | None:
+        found = re.search(self.match, text, re.IGNORECASE)
+        if found is None:
+            return None
+        groups = {k: v or "" for k, v in found.groupdict().items()}
+        return [
+            {
+                "name": call["name"],
+                "arguments": {
+                    key: value.format(**groups) if isinstance(value, str) else value
+                    for key, value in call.get("arguments", {}).items()
+                },
+            }
+            for call in self.tool_calls
+        ]
+
+
+# Phrasings the intent router leaves to the model
+DEFAULT_SCRIPT = [
+    ScriptRule(r"add (?:a )?task (?:to )?(?P<title>.+?)(?: and show .*)?$", [
+        {"name": "add_task", "arguments": {"title": "{title}"}},
+    ]),
+    ScriptRule(r"(?:on my plate|to do today|agenda)", [
+        {"name": "list_tasks", "arguments": {"status": "pending"}},
+    ]),
+    ScriptRule(r"high priority", [
+        {"name": "list_tasks", "arguments": {"status": "pending", "priority": "high"}},
+    ]),
+]
+
+
+# Opening of src/task_snapshot.SNAPSHOT_PROMPT, and its truncation note
+SNAPSHOT_MARKER = "The user's pending tasks as of"
+SNAPSHOT_TRUNCATED = "are shown."
+
+
+def _answerable_from_snapshot(
+    messages: list[dict[str, Any]],
+    calls: list[dict[str, Any]],
+) -> bool:
+    snapshots = [
+        m["content"] for m in messages
+        if m["role"] == "system" and (m["content"] or "").startswith(SNAPSHOT_MARKER)
+    ]
+    if not snapshots or SNAPSHOT_TRUNCATED in snapshots[-1]:
+        return False
+    return all(
+        call["name"] == "list_tasks"
+        and call["arguments"].get("status", "pending") == "pending"
+        for call in calls
+    )
+
+
+def load_script(path: str) -> list[ScriptRule]:
+    with open(path, encoding="utf-8") as f:
+        return [ScriptRule(**rule) for rule in json.load(f)]
+
+
+def create_app(
+    latency: float = 0.0,
+    token_delay: float = 0.0,
+    reply: str = DEFAULT_REPLY,
+    script: list[ScriptRule] | None = None,
+) -> FastAPI:
+    """
+    Build the mock app.
+
+    Every completion waits `latency` seconds before the first token, then
+    `token_delay` per word-token (streamed as they are produced, or all
+    before a non-streamed response). Tool calls follow `script`
+    (default DEFAULT_SCRIPT) when the request offers tools.
+    """
+    app = FastAPI(title="Mock LLM")
+    rules = DEFAULT_SCRIPT if script is None else script
+    app.state.requests = 0
+    app.state.prompt_tokens = 0
+
+    def tool_calls_for(body: dict[str, Any]) -> list[dict[str, Any]] | None:
+        messages = body["messages"]
+        if not body.get("tools") or body.get("tool_choice") == "none":
+            return None
+        if messages[-1]["role"] != "user":
+            return None  # Tool results are in: answer with text
+        for rule in rules:
+            calls = rule.calls_for(messages[-1]["content"] or "")
+            if calls and _answerable_from_snapshot(messages, calls):
+                return None
+            if calls:
+                return [
+                    {
+                        "id": f"call_{time.time_ns()}_{i}",
+                        "type": "function",
+                        "function": {
+                            "name": call["name"],
+                            "arguments": json.dumps(call["arguments"]),
+                        },
+                    }
+                    for i, call in enumerate(calls)
+                ]
+        return None
+
+    def usage(body: dict[str, Any], completion: str) -> dict[str, int]:
+        prompt_tokens = len(json.dumps(body["messages"])) // 4
+        completion_tokens = len(completion) // 4
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def stream_reply(
+        body: dict[str, Any],
+        calls: list[dict[str, Any]] | None,
+    ) -> AsyncIterator[str]:
+        model = body.get("model", "mock")
+
+        def chunk(delta: dict[str, Any]) -> str:
+            data = {
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": delta}],
+            }
+            return f"data: {json.dumps(data)}\n\n"
+
+        if calls:
+            for i, call in enumerate(calls):
+                await asyncio.sleep(token_delay)
+                yield chunk({"tool_calls": [{"index": i, **call}]})
+        else:
+            for token in re.findall(r"\S+\s*", reply):
+                await asyncio.sleep(token_delay)
+                yield chunk({"content": token})
+        # Final chunk carries usage, as with stream_options.include_usage
+        completion = json.dumps(calls) if calls else reply
+        last = {"object": "chat.completion.chunk", "model": model, "choices": [],
+                "usage": usage(body, completion)}
+        yield f"data: {json.dumps(last)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    @app.post("/v1/chat/completions")
+    async def completions(request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        app.state.prompt_tokens += len(json.dumps(body["messages"])) // 4
+        calls = tool_calls_for(body)
+        if latency:
+            await asyncio.sleep(latency)
+        model = body.get("model", "mock")
+        if body.get("stream"):
+            return StreamingResponse(
+                stream_reply(body, calls), media_type="text/event-stream"
+            )
+
+        if calls:
+            message = {"role": "assistant", "content": None, "tool_calls": calls}
+            completion = json.dumps(calls)
+            await asyncio.sleep(token_delay * len(calls))
+        else:
+            message = {"role": "assistant", "content": reply}
+            completion = reply
+            await asyncio.sleep(token_delay * len(reply.split()))
+        return {
+            "id": f"mock-{time.time_ns()}",
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if calls else "stop",
+            }],
+            "usage": usage(body, completion),
+        }
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve(app: FastAPI, port: int | None = None) -> Iterator[str]:
+    """Serve app on 127.0.0.1 in a background thread; yields the base URL."""
+    port = port or _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser) -> None:
+    """CLI options shared by the mock and the benchmarks that start it."""
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="generation rate after the first token (0 = instant)")
+    parser.add_argument("--script", help="JSON file of tool-call rules")
+
+
+def app_from_arguments(args: argparse.Namespace) -> FastAPI:
+    rate = args.tokens_per_second
+    return create_app(
+        latency=args.latency,
+        token_delay=1 / rate if rate else 0.0,
+        script=load_script(args.script) if args.script else None,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=9100)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(app_from_arguments(args), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,129 +4,520 @@ Reference: @specs/features/chatbot.md
 Uses Groq API with Llama model - generous free tier (14,000 tokens/min).
 """
 
+import asyncio
+import hashlib
+import itertools
 import json
-import os
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.mcp_tools import MCPToolExecutor
+from src import crud
+from src.cache import (
+    LRUCache,
+    ReplyCacheKey,
+    chat_reply_cache,
+    chat_reply_cache_requests,
+)
+from src.chat_trace import phase, record_usage
+from src.config import get_settings
+from src.database import async_session_maker
+from src.http_clients import get_llm_client
+from src.intent_router import (
+    Intent,
+    intent_router_requests,
+    normalize,
+    render_reply,
+    route,
+)
+from src.llm_scheduler import (
+    LLMQueueFullError,
+    LLMScheduler,
+    estimate_request_tokens,
+    llm_scheduler,
+)
+from src.mcp_tools import READ_ONLY_TOOLS, TOOL_DEFINITIONS, MCPToolExecutor
+from src.task_snapshot import get_snapshot
+
+settings = get_settings()
 
 # System prompt for the AI agent - Phase V enabled
 SYSTEM_PROMPT = """You are a helpful Todo assistant. You help users manage their tasks through natural language.
 
-You have access to these tools:
-- add_task: Create a new task
-  - Required: title
-  - Optional: description, priority (high/medium/low), due_date (ISO format), reminder_at (ISO format)
-- list_tasks: List tasks (optional status filter: all, pending, completed)
-- complete_task: Mark a task as complete (requires task_id)
-- delete_task: Delete a task (requires task_id)  
-- update_task: Update a task (requires task_id, optional title/description)
+Use the provided tools to add, list, complete, delete and update tasks.
+For more than one task use the bulk tools with every task in a single call:
+add_tasks for "add milk, eggs and bread", complete_tasks for "complete 3, 5
+and 9", delete_tasks for deleting several. When a request needs several
+tools (for example adding tasks and then showing what's pending), call them
+all in the same response.
 
 When the user asks "What's pending?" call list_tasks with status="pending".
 When the user says "show my tasks" call list_tasks with status="all".
 When the user specifies priority (high/medium/low), due date, or reminder, include them in add_task.
-
-IMPORTANT: When calling a tool, respond ONLY with a JSON object in this exact format:
-{"tool": "tool_name", "args": {"arg1": "value1"}}
-
-Examples:
-- "Add high priority task to finish report due tomorrow" → {"tool": "add_task", "args": {"title": "finish report", "priority": "high", "due_date": "2025-12-21T23:59:59"}}
-- "Add task buy milk" → {"tool": "add_task", "args": {"title": "buy milk"}}
+Dates use ISO format, e.g. 2025-12-21T23:59:59.
 
 If no tool is needed, respond normally with text.
 Format task lists nicely showing: ✅/❌ status, 📌 priority, 📅 due date if set.
 """
 
 
+# History messages (before the new one) that key a cached reply
+REPLY_CACHE_HISTORY_MESSAGES = 4
+
+BUSY_MESSAGE = (
+    "Sorry, I'm handling too many requests right now. "
+    "Please try again in a moment."
+)
+
+
+def _call_arguments(call: dict[str, Any]) -> dict[str, Any]:
+    """Decode a tool call's JSON arguments; raises ValueError if malformed."""
+    arguments = json.loads(call["function"].get("arguments") or "{}")
+    if not isinstance(arguments, dict):
+        raise ValueError("arguments must be a JSON object")
+    return arguments
+
+
+def _tool_message(call: dict[str, Any], result: Any) -> dict[str, Any]:
+    return {
+        "role": "tool",
+        "tool_call_id": call["id"],
+        "content": json.dumps(result, default=str),
+    }
+
+
 class TodoAgent:
-    """Groq-powered Todo Agent using Llama model."""
+    """Groq-powered Todo Agent using Llama model.
+
+    The agent holds no database session: each batch of tool calls runs in
+    its own short transaction, so no pooled connection is held while the
+    model is generating.
+
+    Replies to turns that only read tasks (through tools) are cached per
+    user and recent history until any of the user's tasks change, so
+    repeated questions skip the model. With
+    task_snapshot on, pending tasks are sent up front so questions about
+    them are answered in one completion.
+    """
 
-    def __init__(self, session: AsyncSession, user_id: str):
-        self.session = session
+    def __init__(
+        self,
+        user_id: str,
+        http_client: httpx.AsyncClient | None = None,
+        session_factory: Callable[[], AsyncSession] = async_session_maker,
+        scheduler: LLMScheduler = llm_scheduler,
+        reply_cache: LRUCache[ReplyCacheKey, tuple[str, list[str]]] = (
+            chat_reply_cache
+        ),
+    ):
         self.user_id = user_id
-        self.tool_executor = MCPToolExecutor(session, user_id)
-        self.api_key = os.getenv("GROQ_API_KEY")
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.reply_cache = reply_cache
+        self.session_factory = session_factory
+        # Token-bucket admission shared by all agents (see src/llm_scheduler.py)
+        self.scheduler = scheduler
+        # Shared keep-alive pool from the app lifespan (see src/http_clients.py)
+        self.http_client = http_client or get_llm_client()
+        self.api_key = settings.groq_api_key
+        self.api_url = settings.llm_api_url
+        self.model = settings.llm_model
+        self.max_tool_rounds = settings.chat_max_tool_rounds
+        self.fast_path = settings.chat_fast_path
+        self.task_snapshot = settings.chat_task_snapshot
+
+    def _payload(
+        self,
+        messages: list[dict[str, Any]],
+        final: bool,
+    ) -> dict[str, Any]:
+        """Request body; the final round may not call tools."""
+        return {
+            "model": self.model,
+            "messages": messages,
+            "tools": TOOL_DEFINITIONS,
+            "tool_choice": "none" if final else "auto",
+            "temperature": 0.7,
+            "max_tokens": 1024,
+        }
+
+    async def _complete(
+        self,
+        messages: list[dict[str, Any]],
+        final: bool = False,
+    ) -> httpx.Response:
+        """
+        Request one chat completion from the LLM.
+
+        Admitted by the rate-limit scheduler; 429/5xx responses are retried
+        with backoff, and the last one is returned if retries run out.
+        """
+        payload = self._payload(messages, final)
+        cost = estimate_request_tokens(payload)
+        for attempt in itertools.count():
+            with phase("llm_queue"):
+                await self.scheduler.admit(self.user_id, cost)
+            with phase("llm"):
+                response = await self.http_client.post(
+                    self.api_url,
+                    json=payload,
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json"
+                    }
+                )
+            delay = self.scheduler.retry_delay(response, attempt)
+            if delay is None:
+                break
+            with phase("llm_queue"):
+                await asyncio.sleep(delay)
+
+        if response.status_code == 200:
+            usage = response.json().get("usage") or {}
+            record_usage(usage)
+            if "total_tokens" in usage:
+                self.scheduler.settle(cost, usage["total_tokens"])
+        return response
+
+    async def _stream_completion(
+        self,
+        messages: list[dict[str, Any]],
+        final: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream one chat completion, yielding deltas as they arrive.
+
+        Rate-limit and server errors are retried before anything is yielded.
+        Token usage is read from the final chunk when the server sends it
+        (`usage`, or Groq's `x_groq.usage`).
+        """
+        payload = {**self._payload(messages, final), "stream": True}
+        cost = estimate_request_tokens(payload)
+        for attempt in itertools.count():
+            with phase("llm_queue"):
+                await self.scheduler.admit(self.user_id, cost)
+            with phase("llm"):
+                async with self.http_client.stream(
+                    "POST",
+                    self.api_url,
+                    json=payload,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                ) as response:
+                    if response.status_code == 200:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[len("data:"):].strip()
+                            if data == "[DONE]":
+                                break
+                            chunk = json.loads(data)
+                            usage = chunk.get("usage") or (
+                                chunk.get("x_groq") or {}
+                            ).get("usage")
+                            if usage:
+                                record_usage(usage)
+                            for choice in chunk.get("choices") or []:
+                                yield choice.get("delta", {})
+                        return
+
+                    error_text = (await response.aread()).decode(errors="replace")
+                    delay = self.scheduler.retry_delay(response, attempt)
+                    if delay is None:
+                        print(f"Groq API error: {response.status_code} - {error_text}")
+                        raise httpx.HTTPStatusError(
+                            error_text[:200],
+                            request=response.request,
+                            response=response,
+                        )
+            with phase("llm_queue"):
+                await asyncio.sleep(delay)
+
+    async def _run_tool(
+        self,
+        executor: MCPToolExecutor,
+        call: dict[str, Any],
+    ) -> dict | list:
+        name = call["function"]["name"]
+        try:
+            return await executor.execute_tool(name, _call_arguments(call))
+        except (TypeError, ValueError) as e:
+            return {"error": f"Invalid arguments for {name}: {e}"}
+
+    async def _run_read_only(self, call: dict[str, Any]) -> dict | list:
+        async with self.session_factory() as session:
+            return await self._run_tool(MCPToolExecutor(session, self.user_id), call)
+
+    async def run_tool_calls(self, calls: list[dict[str, Any]]) -> list[dict | list]:
+        """
+        Execute one round of tool calls; results are returned in call order.
+
+        The round runs in one transaction that is committed before the next
+        LLM request. Writes run in order; consecutive read-only calls run
+        concurrently on their own sessions until the round first writes,
+        after which reads use the round's session so they see its changes.
+        """
+        results: list[dict | list] = []
+        wrote = False
+        with phase("tools"):
+            async with self.session_factory() as session:
+                executor = MCPToolExecutor(session, self.user_id)
+                i = 0
+                while i < len(calls):
+                    j = i
+                    while (
+                        not wrote
+                        and j < len(calls)
+                        and calls[j]["function"]["name"] in READ_ONLY_TOOLS
+                    ):
+                        j += 1
+                    if j - i > 1:
+                        results.extend(await asyncio.gather(
+                            *(self._run_read_only(call) for call in calls[i:j])
+                        ))
+                        i = j
+                        continue
+
+                    call = calls[i]
+                    results.append(await self._run_tool(executor, call))
+                    if call["function"]["name"] not in READ_ONLY_TOOLS:
+                        wrote = True
+                    i += 1
+                await session.commit()
+        return results
+
+    async def _run_intent(self, intent: Intent) -> dict | list:
+        """Execute a fast-path intent in its own short transaction."""
+        with phase("tools"):
+            async with self.session_factory() as session:
+                executor = MCPToolExecutor(session, self.user_id)
+                result = await executor.execute_tool(intent.tool, intent.args)
+                await session.commit()
+        return result
+
+    def _route(self, user_message: str) -> Intent | None:
+        """Fast-path intent for an unambiguous command (see src/intent_router.py)."""
+        if not self.fast_path:
+            return None
+        intent = route(user_message)
+        outcome = "miss" if intent is None else "hit"
+        intent_router_requests.inc(outcome=outcome)
+        return intent
+
+    async def _cache_key(
+        self,
+        user_message: str,
+        history: list[dict[str, str]],
+    ) -> ReplyCacheKey | None:
+        """
+        Taken before the turn runs, so writes during it invalidate the entry.
+
+        The last few history messages are hashed into the key, so a follow-up
+        ("yes", "the second one") is only reused after the same exchange.
+        The task state is read from the database, so a write on any replica
+        invalidates. None when the cache is disabled.
+        """
+        if self.reply_cache.maxsize == 0:
+            return None
+        recent = json.dumps(history[-REPLY_CACHE_HISTORY_MESSAGES:], sort_keys=True)
+        with phase("context"):
+            async with self.session_factory() as session:
+                state = await crud.get_task_state(session, self.user_id)
+        return (
+            self.user_id,
+            normalize(user_message),
+            hashlib.sha256(recent.encode()).hexdigest(),
+            state,
+        )
+
+    def _cached_reply(self, key: ReplyCacheKey | None) -> tuple[str, list[str]] | None:
+        if key is None:
+            return None
+        cached = self.reply_cache.get(key)
+        chat_reply_cache_requests.inc(outcome="miss" if cached is None else "hit")
+        return cached
+
+    def _store_reply(
+        self,
+        key: ReplyCacheKey | None,
+        reply: str,
+        tool_calls: list[str],
+    ) -> None:
+        """Cache the reply if the turn looked tasks up and changed nothing."""
+        if key is None or not reply or not tool_calls:
+            return
+        if READ_ONLY_TOOLS.issuperset(tool_calls):
+            self.reply_cache.set(key, (reply, list(tool_calls)))
+
+    async def _build_messages(
+        self,
+        user_message: str,
+        history: list[dict[str, str]],
+    ) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = [{"role": "system", "content": SYSTEM_PROMPT}]
+        if self.task_snapshot:
+            with phase("context"):
+                async with self.session_factory() as session:
+                    snapshot = await get_snapshot(session, self.user_id)
+            messages.append({"role": "system", "content": snapshot})
+        messages.extend(history)
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    async def chat_stream(
+        self,
+        user_message: str,
+        history: list[dict[str, str]],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Process a chat message, yielding events as the reply is generated.
+
+        Events: {"event": "token", "text"}, {"event": "tool_call", "name",
+        "args"}, {"event": "tool_result", "name", "result"}, and finally
+        {"event": "done", "response", "tool_calls"}.
+        """
+        intent = self._route(user_message)
+        if intent is not None:
+            yield {"event": "tool_call", "name": intent.tool, "args": intent.args}
+            result = await self._run_intent(intent)
+            yield {"event": "tool_result", "name": intent.tool, "result": result}
+            reply_text = render_reply(intent, result)
+            yield {"event": "token", "text": reply_text}
+            yield {"event": "done", "response": reply_text, "tool_calls": [intent.tool]}
+            return
+
+        cache_key = await self._cache_key(user_message, history)
+        cached = self._cached_reply(cache_key)
+        if cached is not None:
+            reply_text, tool_calls = cached
+            yield {"event": "token", "text": reply_text}
+            yield {"event": "done", "response": reply_text, "tool_calls": tool_calls}
+            return
+
+        tool_calls_made: list[str] = []
+        reply: list[str] = []
+        messages = await self._build_messages(user_message, history)
+
+        try:
+            for round_ in range(self.max_tool_rounds + 1):
+                final = round_ == self.max_tool_rounds
+                content: list[str] = []
+                # Tool calls arrive in fragments keyed by index
+                fragments: dict[int, dict[str, Any]] = {}
+                async for delta in self._stream_completion(messages, final):
+                    if delta.get("content"):
+                        content.append(delta["content"])
+                        yield {"event": "token", "text": delta["content"]}
+                    for fragment in delta.get("tool_calls") or []:
+                        index = fragment.get("index", 0)
+                        call = fragments.setdefault(index, {
+                            "id": f"call_{round_}_{index}",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        })
+                        call["id"] = fragment.get("id") or call["id"]
+                        function = fragment.get("function") or {}
+                        call["function"]["name"] += function.get("name") or ""
+                        call["function"]["arguments"] += function.get("arguments") or ""
+                reply.extend(content)
+                if not fragments or final:
+                    break
+
+                calls = [fragments[index] for index in sorted(fragments)]
+                messages.append({
+                    "role": "assistant",
+                    "content": "".join(content) or None,
+                    "tool_calls": calls,
+                })
+                for call in calls:
+                    try:
+                        arguments = _call_arguments(call)
+                    except ValueError:
+                        arguments = {}
+                    yield {
+                        "event": "tool_call",
+                        "name": call["function"]["name"],
+                        "args": arguments,
+                    }
+                results = await self.run_tool_calls(calls)
+                for call, result in zip(calls, results):
+                    tool_calls_made.append(call["function"]["name"])
+                    messages.append(_tool_message(call, result))
+                    yield {
+                        "event": "tool_result",
+                        "name": call["function"]["name"],
+                        "result": result,
+                    }
+            assistant_message = "".join(reply)
+            self._store_reply(cache_key, assistant_message, tool_calls_made)
+        except httpx.HTTPError as e:
+            assistant_message = f"Sorry, I encountered an error: {e}"
+            yield {"event": "error", "message": assistant_message}
+        except LLMQueueFullError:
+            assistant_message = BUSY_MESSAGE
+            yield {"event": "error", "message": assistant_message}
+
+        yield {
+            "event": "done",
+            "response": assistant_message,
+            "tool_calls": tool_calls_made,
+        }
 
     async def chat(
         self,
         user_message: str,
         history: list[dict[str, str]],
     ) -> tuple[str, list[str]]:
-        """Process a chat message and return response with tool calls."""
+        """
+        Process a chat message and return response with tool calls.
+
+        Each round the model may request several tool calls, which are all
+        executed before the next round; after max_tool_rounds the model
+        must answer with text. Unambiguous commands, and repeats of a
+        read-only question while the tasks are unchanged, skip the LLM.
+        """
+        intent = self._route(user_message)
+        if intent is not None:
+            result = await self._run_intent(intent)
+            return render_reply(intent, result), [intent.tool]
+
+        cache_key = await self._cache_key(user_message, history)
+        cached = self._cached_reply(cache_key)
+        if cached is not None:
+            reply_text, tool_calls = cached
+            return reply_text, list(tool_calls)
+
         tool_calls_made: list[str] = []
-        
-        # Build messages array
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-        messages.extend(history)
-        messages.append({"role": "user", "content": user_message})
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Make request to Groq
-            response = await client.post(
-                self.api_url,
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": messages,
-                    "temperature": 0.7,
-                    "max_tokens": 1024,
-                },
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            
+        messages = await self._build_messages(user_message, history)
+
+        for round_ in range(self.max_tool_rounds + 1):
+            final = round_ == self.max_tool_rounds
+            # Make request to Groq (reuses the pooled connection)
+            try:
+                response = await self._complete(messages, final)
+            except LLMQueueFullError:
+                return BUSY_MESSAGE, tool_calls_made
+
             if response.status_code != 200:
                 error_text = response.text
                 print(f"Groq API error: {response.status_code} - {error_text}")
-                return f"Sorry, I encountered an error: {error_text[:200]}", []
-            
-            result = response.json()
-            assistant_message = result["choices"][0]["message"]["content"]
-            
-            # Check if the response is a tool call (JSON format)
-            try:
-                # Try to parse as JSON tool call
-                if assistant_message.strip().startswith("{"):
-                    tool_data = json.loads(assistant_message)
-                    if "tool" in tool_data:
-                        tool_name = tool_data["tool"]
-                        arguments = tool_data.get("args", {})
-                        tool_calls_made.append(tool_name)
-                        
-                        # Execute the tool
-                        tool_result = await self.tool_executor.execute_tool(tool_name, arguments)
-                        
-                        # Add tool result to messages and get final response
-                        messages.append({"role": "assistant", "content": assistant_message})
-                        messages.append({
-                            "role": "user", 
-                            "content": f"Tool result: {json.dumps(tool_result)}\n\nPlease provide a friendly response to the user based on this result."
-                        })
-                        
-                        # Get final response
-                        response = await client.post(
-                            self.api_url,
-                            json={
-                                "model": "llama-3.3-70b-versatile",
-                                "messages": messages,
-                                "temperature": 0.7,
-                                "max_tokens": 1024,
-                            },
-                            headers={
-                                "Authorization": f"Bearer {self.api_key}",
-                                "Content-Type": "application/json"
-                            }
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            return result["choices"][0]["message"]["content"], tool_calls_made
-            except json.JSONDecodeError:
-                pass
-            
-            return assistant_message, tool_calls_made
+                message = f"Sorry, I encountered an error: {error_text[:200]}"
+                return message, tool_calls_made
+
+            message = response.json()["choices"][0]["message"]
+            calls = message.get("tool_calls")
+            if not calls or final:
+                break
+
+            messages.append({
+                "role": "assistant",
+                "content": message.get("content"),
+                "tool_calls": calls,
+            })
+            results = await self.run_tool_calls(calls)
+            for call, result in zip(calls, results):
+                tool_calls_made.append(call["function"]["name"])
+                messages.append(_tool_message(call, result))
+
+        reply_text = message.get("content") or ""
+        self._store_reply(cache_key, reply_text, tool_calls_made)
+        return reply_text, tool_calls_made
@@ -0,0 +1,179 @@
+"""Streaming bulk import of tasks from NDJSON or CSV.
+
+Reference: @specs/features/task-crud.md
+Rows are validated against TaskCreate exactly like POST /tasks, but are
+parsed incrementally from the request body and written in batches
+(COPY on PostgreSQL, multi-row INSERT elsewhere) inside one transaction.
+"""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import crud
+from src.cache import user_tag_cache
+from src.models import TaskCreate, TaskImportLineError, TaskImportResult
+from src.outbox import add_tasks_imported_event, outbox_relay
+
+ImportFormat = Literal["ndjson", "csv"]
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a byte stream into text lines without buffering the whole body.
+
+    Raises UnicodeDecodeError if the body is not valid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    # Pieces of the unfinished last line; only new text is searched for "\n"
+    pending: list[str] = []
+    async for chunk in chunks:
+        first, *rest = decoder.decode(chunk).split("\n")
+        pending.append(first)
+        for line in rest:
+            yield "".join(pending).rstrip("\r")
+            pending = [line]
+    pending.append(decoder.decode(b"", final=True))
+    last = "".join(pending)
+    if last:
+        yield last.rstrip("\r")
+
+
+async def iter_ndjson_rows(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """Yield (line number, row dict or error message) for each NDJSON line."""
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(row, dict):
+            yield line_no, "Expected a JSON object"
+            continue
+        yield line_no, row
+
+
+async def iter_csv_rows(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """
+    Yield (line number, row dict or error message) for each CSV record.
+
+    The first record is the header. Quoted fields may span lines; the
+    reported line number is where the record starts. Empty cells fall back
+    to the TaskCreate defaults and `tag_ids` is a `;`-separated list.
+    """
+    header: list[str] | None = None
+    line_no = 0
+    start = 0
+    buffer: list[str] = []
+    async for line in lines:
+        line_no += 1
+        if not buffer:
+            start = line_no
+        buffer.append(line)
+        record = "\n".join(buffer)
+        # An odd number of quotes means a quoted field continues on the next line
+        if record.count('"') % 2:
+            continue
+        buffer.clear()
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+
+        row: dict[str, Any] = {k: v for k, v in zip(header, values) if v != ""}
+        if "tag_ids" in row:
+            row["tag_ids"] = [t.strip() for t in row["tag_ids"].split(";") if t.strip()]
+        yield start, row
+
+    if buffer:
+        yield start, "Unterminated quoted field"
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """One line per failed field, e.g. 'title: String should have ...'."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+async def import_tasks(
+    session: AsyncSession,
+    user_id: str,
+    chunks: AsyncIterator[bytes],
+    fmt: ImportFormat,
+) -> TaskImportResult:
+    """
+    Validate and insert every row of an import stream for a user.
+
+    Invalid rows are skipped and reported by line number; valid rows are
+    written in batches of IMPORT_BATCH_SIZE and committed together at the end,
+    with one TasksImported event if any row was imported.
+    """
+    result = TaskImportResult()
+    batch: list[tuple[int, TaskCreate]] = []
+
+    def reject(line_no: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(TaskImportLineError(line=line_no, error=message))
+
+    async def flush() -> None:
+        # Unknown tag ids would abort the whole transaction on a FK violation,
+        # so they are checked once per batch and reported per line instead.
+        wanted = {tag_id for _, task in batch for tag_id in task.tag_ids}
+        existing = await crud.get_existing_tag_ids(session, wanted)
+        valid: list[TaskCreate] = []
+        for line_no, task in batch:
+            missing = [t for t in task.tag_ids if t not in existing]
+            if missing:
+                reject(line_no, f"tag_ids: unknown tag(s) {missing}")
+            else:
+                valid.append(task)
+        result.imported += await crud.bulk_insert_tasks(session, valid, user_id)
+        batch.clear()
+
+    parse_rows = iter_csv_rows if fmt == "csv" else iter_ndjson_rows
+    async for line_no, row in parse_rows(iter_lines(chunks)):
+        if isinstance(row, str):
+            reject(line_no, row)
+            continue
+        try:
+            batch.append((line_no, TaskCreate.model_validate(row)))
+        except ValidationError as e:
+            reject(line_no, format_validation_error(e))
+            continue
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await flush()
+
+    if batch:
+        await flush()
+
+    if result.imported:
+        add_tasks_imported_event(session, user_id, result.imported, result.failed)
+    await session.commit()
+    outbox_relay.notify()
+    user_tag_cache.pop(user_id)
+    return result
@@ -0,0 +1,76 @@
+"""In-process caches.
+
+These live in a single worker process: every replica keeps its own copy.
+Entries carry a TTL so a write handled by another replica is picked up
+after at most `ttl` seconds; writes on this replica invalidate directly.
+"""
+
+import time
+from collections import OrderedDict
+
+from src.config import get_settings
+from src.metrics import Counter
+from src.models import TagUsage
+
+settings = get_settings()
+
+
+class LRUCache[K, V]:
+    """Bounded least-recently-used cache with an optional per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self.ttl is not None and expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl or 0)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Drop a single entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# user_id -> (skip, limit) -> page of the tags used by that user's tasks, with
+# usage counts (see crud.get_user_tags). Only the /tags listing reads it.
+user_tag_cache: LRUCache[str, dict[tuple[int, int], list[TagUsage]]] = LRUCache(
+    maxsize=1024, ttl=300
+)
+
+
+# (user_id, normalized message, recent history hash, task state) -> (reply,
+# tool calls) of a chat turn that only read tasks (see agent.TodoAgent). The
+# task state comes from the database (crud.get_task_state), so this cache
+# stays correct across replicas.
+type ReplyCacheKey = tuple[str, str, str, str]
+chat_reply_cache: LRUCache[ReplyCacheKey, tuple[str, list[str]]] = LRUCache(
+    maxsize=settings.chat_reply_cache_size, ttl=settings.chat_reply_cache_ttl
+)
+chat_reply_cache_requests = Counter(
+    "chat_reply_cache_total",
+    "Chat turns answered from the reply cache (hit) or by the model (miss)",
+)
@@ -0,0 +1,132 @@
+"""Per-request latency breakdown and token accounting for chat.
+
+Reference: @docs/MONITORING.md
+Each chat request runs under a ChatTrace held in a context variable, so
+the agent and tool executor record into it without having it passed
+around. Time is summed per phase:
+- history: load the history and store the user message
+- context: build the task snapshot (CHAT_TASK_SNAPSHOT)
+- llm_queue: wait for rate-limit admission and retry backoff
+- llm: completion requests (streamed: until the last token)
+- tools: tool execution
+- persist: store the assistant reply
+Finished traces are exported as metrics and, with CHAT_SERVER_TIMING, as
+a Server-Timing header on POST /chat.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.history import estimate_tokens
+from src.metrics import Counter, Histogram
+
+PHASES = ("history", "context", "llm_queue", "llm", "tools", "persist")
+
+chat_phase_seconds = Histogram(
+    "chat_phase_seconds",
+    "Time per chat request spent in each phase, and in total",
+)
+chat_llm_tokens = Counter(
+    "chat_llm_tokens_total",
+    "Tokens reported by the LLM, by kind (prompt or completion)",
+)
+chat_history_messages = Histogram(
+    "chat_history_messages",
+    "History messages sent to the LLM per chat request",
+    buckets=(0, 2, 5, 10, 20, 50, 100),
+)
+chat_history_tokens = Histogram(
+    "chat_history_tokens",
+    "Estimated tokens of history sent to the LLM per chat request",
+    buckets=(0, 250, 500, 1000, 2000, 4000, 8000),
+)
+
+
+@dataclass
+class ChatTrace:
+    """Timings and token counts of one chat request."""
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    history_messages: int = 0
+    history_tokens: int = 0
+    total: float | None = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def finish(self) -> None:
+        """Export the trace as metrics; later calls are no-ops."""
+        if self.total is not None:
+            return
+        self.total = time.perf_counter() - self.started
+        for phase, seconds in self.phases.items():
+            chat_phase_seconds.observe(seconds, phase=phase)
+        chat_phase_seconds.observe(self.total, phase="total")
+        chat_history_messages.observe(self.history_messages)
+        chat_history_tokens.observe(self.history_tokens)
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, durations in milliseconds."""
+        entries = [
+            f"{phase};dur={self.phases[phase] * 1000:.1f}"
+            for phase in PHASES if phase in self.phases
+        ]
+        total = self.total if self.total is not None else (
+            time.perf_counter() - self.started
+        )
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[ChatTrace | None] = ContextVar("chat_trace", default=None)
+
+
+def start_trace(trace: ChatTrace | None = None) -> ChatTrace:
+    """Make `trace` (default: a new one) current for this context."""
+    trace = trace or ChatTrace()
+    _current.set(trace)
+    return trace
+
+
+def current_trace() -> ChatTrace | None:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the current trace, if any."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace = _current.get()
+        if trace is not None:
+            trace.add(name, time.perf_counter() - start)
+
+
+def record_usage(usage: dict[str, Any]) -> None:
+    """Count the token usage reported with an LLM response."""
+    prompt = usage.get("prompt_tokens") or 0
+    completion = usage.get("completion_tokens") or 0
+    chat_llm_tokens.inc(prompt, kind="prompt")
+    chat_llm_tokens.inc(completion, kind="completion")
+    trace = _current.get()
+    if trace is not None:
+        trace.prompt_tokens += prompt
+        trace.completion_tokens += completion
+
+
+def record_history(history: list[dict[str, str]]) -> None:
+    """Note the size of the history sent with this request."""
+    trace = _current.get()
+    if trace is not None:
+        trace.history_messages = len(history)
+        trace.history_tokens = sum(
+            estimate_tokens(message["content"] or "") for message in history
+        )
@@ -31,6 +31,89 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: str = "http://localhost:3000"
 
+    # LLM (Groq, OpenAI-compatible chat completions)
+    groq_api_key: str = ""
+    llm_api_url: str = "https://api.groq.com/openai/v1/chat/completions"
+    llm_model: str = "llama-3.3-70b-versatile"
+
+    # Shared LLM HTTP client (see src/http_clients.py)
+    llm_http2: bool = True
+    llm_max_connections: int = 20
+    llm_keepalive_expiry: float = 60.0
+    llm_connect_timeout: float = 5.0
+    llm_read_timeout: float = 30.0
+    llm_write_timeout: float = 10.0
+    llm_pool_timeout: float = 5.0
+
+    # Shared Dapr sidecar HTTP client (see src/http_clients.py); the
+    # sidecar is on localhost, so fail fast if it isn't there
+    dapr_max_connections: int = 50
+    dapr_keepalive_expiry: float = 30.0
+    dapr_connect_timeout: float = 1.0
+    dapr_timeout: float = 5.0
+    # Task events go through a transactional outbox (see src/outbox.py);
+    # sent and parked events are deleted after the retention window
+    outbox_batch_size: int = 100
+    outbox_poll_interval: float = 1.0
+    outbox_max_attempts: int = 10
+    outbox_retention_days: int = 7
+    # task-events are delivered in bulk (see src/routes/dapr_events.py):
+    # up to this many per request, or whatever arrived within the wait
+    event_bulk_max_messages: int = 100
+    event_bulk_max_await_ms: int = 40
+    # Bulk deliveries writing to the database at once
+    event_consumer_concurrency: int = 4
+    # Redelivered events are skipped by id (see src/event_dedup.py): ids
+    # seen recently in memory, ids with committed side effects in the
+    # database for the retention window
+    event_dedup_cache_size: int = 10000
+    event_dedup_cache_ttl: float = 3600.0
+    event_dedup_retention_days: int = 7
+
+    # LLM admission control (see src/llm_scheduler.py)
+    llm_tokens_per_minute: int = 14000
+    llm_expected_completion_tokens: int = 200
+    llm_queue_max: int = 200
+    llm_queue_max_per_user: int = 5
+    llm_max_retries: int = 3
+    llm_backoff_base: float = 0.5
+    llm_backoff_max: float = 8.0
+
+    # Chat history sent to the LLM (see src/history.py)
+    chat_history_token_budget: int = 2000
+    chat_history_max_messages: int = 20
+    chat_summary_max_tokens: int = 300
+    # Tool-calling rounds per chat turn before the model must answer
+    chat_max_tool_rounds: int = 4
+    # Answer unambiguous commands without the LLM (see src/intent_router.py)
+    chat_fast_path: bool = True
+    # Replies to read-only turns, reused until the user's tasks change
+    # (see src/cache.py); size 0 disables the cache
+    chat_reply_cache_size: int = 2048
+    chat_reply_cache_ttl: float = 300.0
+    # Send a snapshot of pending tasks with the prompt so questions about
+    # them need no list_tasks round trip (see src/task_snapshot.py)
+    chat_task_snapshot: bool = False
+    chat_snapshot_max_tokens: int = 400
+    # Add a Server-Timing header (per-phase milliseconds) to POST /chat
+    chat_server_timing: bool = False
+
+    # Reminder cron: due reminders are claimed this many per transaction,
+    # up to the cap per run (the rest wait for the next run)
+    reminder_chunk_size: int = 500
+    reminder_max_per_run: int = 5000
+
+    # Delta sync: how long deleted-task tombstones are kept, and how far
+    # behind the cursor changes are re-read in case they committed late
+    # (longest task write transaction plus clock skew between replicas)
+    tombstone_retention_days: int = 30
+    sync_safety_window: float = 30.0
+
+    # Chat retention: conversations idle this long are deleted; after
+    # compact days, messages already folded into the summary are dropped
+    conversation_retention_days: int = 180
+    conversation_compact_days: int = 30
+
     # API
     api_port: int = 8000
     api_title: str = "Todo Evolution API"
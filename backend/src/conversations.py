@@ -0,0 +1,174 @@
+"""Conversation and message history, with retention.
+
+Reference: @specs/api/rest-endpoints.md
+Both listings use keyset pagination: conversations by (updated_at, id)
+from the (user_id, updated_at) index and messages by (created_at, id) from
+the (conversation_id, created_at, id) index. The cursor is the position of
+the last item returned, so each page is one index range scan however deep
+the client scrolls.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, exists, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import (
+    Conversation,
+    ConversationPage,
+    ConversationRead,
+    Message,
+    MessagePage,
+    MessageRead,
+)
+
+# Messages deleted per transaction when compacting a conversation
+COMPACT_BATCH_SIZE = 500
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position of the last item of a page, by (timestamp, id)."""
+    at: datetime
+    id: int
+
+    def encode(self) -> str:
+        return f"{(self.at - _EPOCH) // _MICROSECOND}.{self.id}"
+
+    @classmethod
+    def decode(cls, value: str) -> "PageCursor":
+        """Parse a cursor; raises ValueError if malformed."""
+        micros, id = (int(part) for part in value.split("."))
+        try:
+            at = _EPOCH + micros * _MICROSECOND
+        except OverflowError:
+            raise ValueError(f"Invalid cursor timestamp: {micros}") from None
+        return cls(at, id)
+
+
+async def get_conversations(
+    session: AsyncSession,
+    user_id: str,
+    before: PageCursor | None,
+    *,
+    limit: int,
+) -> ConversationPage:
+    """Get a user's conversations, most recently active first."""
+    query = select(Conversation).where(Conversation.user_id == user_id)
+    if before is not None:
+        query = query.where(or_(
+            Conversation.updated_at < before.at,
+            and_(Conversation.updated_at == before.at, Conversation.id < before.id),
+        ))
+    result = await session.execute(
+        query.order_by(Conversation.updated_at.desc(), Conversation.id.desc())
+        .limit(limit + 1)
+    )
+    rows = list(result.scalars().all())
+
+    page = ConversationPage(
+        conversations=[ConversationRead.model_validate(c) for c in rows[:limit]]
+    )
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        page.next_cursor = PageCursor(last.updated_at, last.id).encode()
+    return page
+
+
+async def get_messages(
+    session: AsyncSession,
+    conversation_id: int,
+    before: PageCursor | None,
+    *,
+    limit: int,
+) -> MessagePage:
+    """
+    Get the `limit` messages preceding `before` (default: the latest).
+
+    The page is returned oldest first, ready to prepend to a chat view.
+    """
+    query = select(Message).where(Message.conversation_id == conversation_id)
+    if before is not None:
+        query = query.where(or_(
+            Message.created_at < before.at,
+            and_(Message.created_at == before.at, Message.id < before.id),
+        ))
+    result = await session.execute(
+        query.order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(limit + 1)
+    )
+    rows = list(result.scalars().all())
+
+    page = MessagePage(
+        messages=[MessageRead.model_validate(m) for m in reversed(rows[:limit])]
+    )
+    if len(rows) > limit:
+        oldest = rows[limit - 1]
+        page.next_cursor = PageCursor(oldest.created_at, oldest.id).encode()
+    return page
+
+
+async def prune_conversations(session: AsyncSession, idle_since: datetime) -> int:
+    """Delete conversations (and their messages) not active since the cutoff."""
+    idle = select(Conversation.id).where(Conversation.updated_at < idle_since)
+    await session.execute(
+        delete(Message).where(Message.conversation_id.in_(idle))
+    )
+    result = await session.execute(
+        delete(Conversation).where(Conversation.updated_at < idle_since)
+    )
+    await session.commit()
+    return result.rowcount or 0
+
+
+async def compact_conversations(
+    session: AsyncSession,
+    idle_since: datetime,
+    batch_size: int = COMPACT_BATCH_SIZE,
+) -> int:
+    """
+    Drop messages already folded into the summary of conversations not
+    active since the cutoff.
+
+    The summary (see src/history.py) keeps them in the model's context;
+    they just stop being available to the messages API. Only conversations
+    that still hold such messages are visited (one probe of the oldest
+    message each), and their messages are deleted oldest first in batches
+    from the (conversation_id, created_at, id) index, one commit per batch.
+    """
+    folded = (
+        Message.conversation_id == Conversation.id,
+        Message.id <= Conversation.summarized_until_id,
+    )
+    result = await session.execute(
+        select(Conversation.id, Conversation.summarized_until_id).where(
+            Conversation.updated_at < idle_since,
+            Conversation.summarized_until_id.is_not(None),
+            exists().where(*folded),
+        )
+    )
+    deleted = 0
+    for conversation_id, summarized_until_id in result.all():
+        while True:
+            batch = (
+                select(Message.id)
+                .where(
+                    Message.conversation_id == conversation_id,
+                    Message.id <= summarized_until_id,
+                )
+                .order_by(Message.created_at, Message.id)
+                .limit(batch_size)
+            )
+            removed = (await session.execute(
+                delete(Message).where(Message.id.in_(batch))
+            )).rowcount or 0
+            await session.commit()
+            deleted += removed
+            if removed < batch_size:
+                break
+    return deleted
@@ -9,21 +9,36 @@ Reference: @specs/features/task-crud.md
 - AC-004.3: Cannot delete another user's task
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
+from enum import Enum
 
-from sqlalchemy import func
+from sqlalchemy import case, func, insert, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.cache import user_tag_cache
 from src.models import (
     Priority,
     Tag,
     TagCreate,
+    TagMatchMode,
+    TagUsage,
     Task,
     TaskCreate,
+    TaskSortField,
     TaskTagLink,
+    TaskTombstone,
     TaskUpdate,
 )
+from src.outbox import add_task_event, outbox_relay
+
+# Only indexed columns may be used for ordering (see Task.__table_args__)
+SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+    "title": Task.title,
+}
 
 
 # ============================================================================
@@ -40,6 +55,8 @@ async def create_task(
     Create a new task for a specific user.
     
     Per AC-001.5: Task is associated with the logged-in user.
+
+    Phase V: TaskCreated is written to the outbox in the same transaction.
     """
     tag_ids = task_data.tag_ids
     task_dict = task_data.model_dump(exclude={"tag_ids"})
@@ -53,7 +70,11 @@ async def create_task(
             link = TaskTagLink(task_id=task.id, tag_id=tag_id)
             session.add(link)
 
+    add_task_event(session, "TaskCreated", task)
     await session.commit()
+    outbox_relay.notify()
+    if tag_ids:
+        user_tag_cache.pop(user_id)
     await session.refresh(task)
 
     result = await session.execute(select(Task).where(Task.id == task.id))
@@ -85,8 +106,9 @@ async def get_tasks(
     completed: bool | None = None,
     priority: Priority | None = None,
     search: str | None = None,
-    tag_id: int | None = None,
-    sort_by: str = "created_at",
+    tag_ids: list[list[int]] | None = None,
+    tag_mode: TagMatchMode = "any",
+    sort_by: TaskSortField = "created_at",
     sort_desc: bool = True,
 ) -> list[Task]:
     """
@@ -94,6 +116,10 @@ async def get_tasks(
     
     Per AC-002.1: Display all tasks belonging to current user.
     Per AC-002.4: Tasks are sorted by creation date (newest first).
+
+    tag_ids holds one group of ids per requested tag (a tag name may map to
+    several ids). "any" is a single semi-join on TaskTagLink over every id;
+    "all" intersects one semi-join per group.
     """
     # CRITICAL: Always filter by user_id
     query = select(Task).where(Task.user_id == user_id)
@@ -111,15 +137,26 @@ async def get_tasks(
             | (Task.description.ilike(search_pattern))
         )
 
-    if tag_id is not None:
-        query = query.join(TaskTagLink).where(TaskTagLink.tag_id == tag_id)
+    if tag_ids is not None:
+        if tag_mode == "all":
+            for group in tag_ids:
+                query = query.where(Task.id.in_(
+                    select(TaskTagLink.task_id).where(TaskTagLink.tag_id.in_(group))
+                ))
+        else:
+            any_ids = [tag_id for group in tag_ids for tag_id in group]
+            query = query.where(Task.id.in_(
+                select(TaskTagLink.task_id).where(TaskTagLink.tag_id.in_(any_ids))
+            ))
 
     # Sorting - default newest first per AC-002.4
-    sort_column = getattr(Task, sort_by, Task.created_at)
+    if sort_by not in SORT_COLUMNS:
+        raise ValueError(f"Cannot sort by {sort_by!r}")
+    sort_column = SORT_COLUMNS[sort_by]
     if sort_desc:
-        query = query.order_by(sort_column.desc())
+        query = query.order_by(sort_column.desc(), Task.id.desc())
     else:
-        query = query.order_by(sort_column.asc())
+        query = query.order_by(sort_column.asc(), Task.id.asc())
 
     query = query.offset(skip).limit(limit)
 
@@ -137,6 +174,8 @@ async def update_task(
     Update a task, filtered by user_id.
     
     Per AC-003.4: Cannot update another user's task.
+
+    Phase V: TaskUpdated is written to the outbox in the same transaction.
     """
     task = await get_task(session, task_id, user_id)
     if not task:
@@ -156,7 +195,11 @@ async def update_task(
             link = TaskTagLink(task_id=task_id, tag_id=tag_id)
             session.add(link)
 
+    add_task_event(session, "TaskUpdated", task)
     await session.commit()
+    outbox_relay.notify()
+    if task_data.tag_ids is not None:
+        user_tag_cache.pop(user_id)
     await session.refresh(task)
     return task
 
@@ -170,13 +213,23 @@ async def delete_task(
     Delete a task, filtered by user_id.
     
     Per AC-004.3: Cannot delete another user's task.
+
+    Leaves a tombstone so delta-sync clients learn about the delete.
+    Phase V: TaskDeleted is written to the outbox in the same transaction.
     """
     task = await get_task(session, task_id, user_id)
     if not task:
         return False
 
+    await session.execute(
+        TaskTagLink.__table__.delete().where(TaskTagLink.task_id == task_id)
+    )
     await session.delete(task)
+    session.add(TaskTombstone(task_id=task_id, user_id=user_id))
+    add_task_event(session, "TaskDeleted", task)
     await session.commit()
+    outbox_relay.notify()
+    user_tag_cache.pop(user_id)
     return True
 
 
@@ -189,6 +242,9 @@ async def toggle_task_complete(
     Toggle task completion, filtered by user_id.
     
     Per AC-005.4: Cannot toggle another user's task.
+
+    Phase V: TaskCompleted (which carries the recurrence, for the recurring
+    task handler) or, when reopened, TaskUpdated is written to the outbox.
     """
     task = await get_task(session, task_id, user_id)
     if not task:
@@ -197,7 +253,10 @@ async def toggle_task_complete(
     task.completed = not task.completed
     task.updated_at = datetime.utcnow()
 
+    event_type = "TaskCompleted" if task.completed else "TaskUpdated"
+    add_task_event(session, event_type, task)
     await session.commit()
+    outbox_relay.notify()
     await session.refresh(task)
     return task
 
@@ -227,6 +286,168 @@ async def get_task_stats(
     }
 
 
+async def get_agenda(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    now: datetime,
+    today_end: datetime,
+    window_end: datetime,
+    limit: int = 50,
+    include_counts: bool = False,
+) -> dict[str, tuple[list[Task], int | None]]:
+    """
+    Get pending tasks bucketed into overdue / today / upcoming windows.
+
+    Each bucket is a range scan on the (user_id, due_date) index; counts
+    for all buckets come from one aggregate over the same range.
+    """
+    windows = {
+        "overdue": (None, now),
+        "today": (now, today_end),
+        "upcoming": (today_end, window_end),
+    }
+    pending = (Task.user_id == user_id, Task.completed == False)  # noqa: E712
+
+    buckets: dict[str, tuple[list[Task], int | None]] = {}
+    for name, (start, end) in windows.items():
+        query = select(Task).where(*pending, Task.due_date < end)
+        query = query.where(
+            Task.due_date.is_not(None) if start is None else Task.due_date >= start
+        )
+        query = query.order_by(Task.due_date.asc(), Task.id.asc()).limit(limit)
+        result = await session.execute(query)
+        buckets[name] = (list(result.scalars().all()), None)
+
+    if include_counts:
+        row = (await session.execute(
+            select(
+                func.count(case((Task.due_date < now, 1))),
+                func.count(
+                    case(((Task.due_date >= now) & (Task.due_date < today_end), 1))
+                ),
+                func.count(case((Task.due_date >= today_end, 1))),
+            ).where(*pending, Task.due_date < window_end)
+        )).one()
+        for name, count in zip(windows, row):
+            buckets[name] = (buckets[name][0], count)
+
+    return buckets
+
+
+async def get_task_state(session: AsyncSession, user_id: str) -> str:
+    """
+    Fingerprint of a user's tasks, changed by task writes on any replica.
+
+    Count and latest updated_at, from the (user_id, updated_at) index:
+    creates and deletes change the count or the latest update, and every
+    update stamps updated_at. An update stamped by a replica whose clock
+    lags the latest one can go unnoticed.
+    """
+    count, last_update = (await session.execute(
+        select(func.count(), func.max(Task.updated_at)).where(Task.user_id == user_id)
+    )).one()
+    return f"{count}:{last_update.isoformat() if last_update else ''}"
+
+
+# ============================================================================
+# BULK IMPORT
+# ============================================================================
+
+# Columns written by COPY, in record order
+_COPY_COLUMNS = (
+    "title",
+    "description",
+    "completed",
+    "priority",
+    "due_date",
+    "recurrence",
+    "reminder_at",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """Normalize aware datetimes to naive UTC like datetime.utcnow()."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _task_row(task_data: TaskCreate, user_id: str, now: datetime) -> dict:
+    row = task_data.model_dump(exclude={"tag_ids"})
+    row["due_date"] = _naive_utc(row["due_date"])
+    row["reminder_at"] = _naive_utc(row["reminder_at"])
+    row.update(completed=False, user_id=user_id, created_at=now, updated_at=now)
+    return row
+
+
+async def bulk_insert_tasks(
+    session: AsyncSession,
+    tasks: list[TaskCreate],
+    user_id: str,
+) -> int:
+    """
+    Insert a batch of tasks for a user in as few round trips as possible.
+
+    On PostgreSQL untagged rows are streamed with COPY. Tagged rows (and all
+    rows on SQLite) use one multi-row INSERT, followed by one INSERT for the
+    tag links. Does not commit - the caller owns the transaction.
+    """
+    if not tasks:
+        return 0
+
+    now = datetime.utcnow()
+    conn = await session.connection()
+    use_copy = conn.dialect.name == "postgresql"
+
+    plain = [t for t in tasks if not t.tag_ids] if use_copy else []
+    tagged = [t for t in tasks if t.tag_ids] if use_copy else tasks
+
+    if plain:
+        records = []
+        for task_data in plain:
+            row = _task_row(task_data, user_id, now)
+            # asyncpg encodes enum columns by label, which SQLModel stores by name
+            records.append(tuple(
+                row[c].name if isinstance(row[c], Enum) else row[c]
+                for c in _COPY_COLUMNS
+            ))
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Task.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+
+    if tagged:
+        result = await session.execute(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            [_task_row(t, user_id, now) for t in tagged],
+        )
+        task_ids = list(result.scalars().all())
+        links = [
+            {"task_id": task_id, "tag_id": tag_id}
+            for task_id, task_data in zip(task_ids, tagged)
+            for tag_id in dict.fromkeys(task_data.tag_ids)
+        ]
+        if links:
+            await session.execute(insert(TaskTagLink), links)
+
+    return len(tasks)
+
+
+async def get_existing_tag_ids(
+    session: AsyncSession,
+    tag_ids: set[int],
+) -> set[int]:
+    """Return the subset of tag_ids that exist."""
+    if not tag_ids:
+        return set()
+    result = await session.execute(select(Tag.id).where(Tag.id.in_(tag_ids)))
+    return set(result.scalars().all())
+
+
 # ============================================================================
 # TAG CRUD
 # ============================================================================
@@ -238,22 +459,99 @@ async def create_tag(session: AsyncSession, tag_data: TagCreate) -> Tag:
     session.add(tag)
     await session.commit()
     await session.refresh(tag)
+    user_tag_cache.clear()
     return tag
 
 
-async def get_tags(session: AsyncSession) -> list[Tag]:
-    """Get all tags."""
-    result = await session.execute(select(Tag).order_by(Tag.name))
+async def get_tags(
+    session: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+) -> list[Tag]:
+    """Get all tags, alphabetically."""
+    result = await session.execute(
+        select(Tag).order_by(Tag.name, Tag.id).offset(skip).limit(limit)
+    )
     return list(result.scalars().all())
 
 
+async def get_user_tags(
+    session: AsyncSession,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 50,
+) -> list[TagUsage]:
+    """
+    Get a page of the tags used by a user's tasks, most used first.
+
+    Computed with one aggregate over TaskTagLink and cached per user and
+    page; tag and tag-link writes invalidate the user's pages.
+    """
+    pages = user_tag_cache.get(user_id) or {}
+    cached = pages.get((skip, limit))
+    if cached is not None:
+        return cached
+
+    task_count = func.count(TaskTagLink.task_id)
+    result = await session.execute(
+        select(Tag.id, Tag.name, Tag.color, task_count)
+        .join(TaskTagLink, TaskTagLink.tag_id == Tag.id)
+        .join(Task, Task.id == TaskTagLink.task_id)
+        .where(Task.user_id == user_id)
+        .group_by(Tag.id, Tag.name, Tag.color)
+        .order_by(task_count.desc(), Tag.name, Tag.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    tags = [
+        TagUsage(id=id, name=name, color=color, task_count=count)
+        for id, name, color, count in result.all()
+    ]
+    user_tag_cache.set(user_id, {**pages, (skip, limit): tags})
+    return tags
+
+
+async def get_tag_ids_by_name(
+    session: AsyncSession, names: set[str]
+) -> dict[str, list[int]]:
+    """
+    Map tag names to their ids (several tags may share a name).
+
+    Queried directly on the indexed name column rather than through the
+    per-process tag cache, so tags created on another replica match at once.
+    """
+    result = await session.execute(
+        select(Tag.id, Tag.name).where(Tag.name.in_(names))
+    )
+    ids_by_name: dict[str, list[int]] = {}
+    for tag_id, name in result.all():
+        ids_by_name.setdefault(name, []).append(tag_id)
+    return ids_by_name
+
+
 async def delete_tag(session: AsyncSession, tag_id: int) -> bool:
-    """Delete a tag by ID."""
+    """
+    Delete a tag by ID, unlinking it from every task.
+
+    The unlinked tasks count as updated, so delta sync picks the change up.
+    """
     result = await session.execute(select(Tag).where(Tag.id == tag_id))
     tag = result.scalar_one_or_none()
     if not tag:
         return False
 
+    await session.execute(
+        update(Task)
+        .where(Task.id.in_(
+            select(TaskTagLink.task_id).where(TaskTagLink.tag_id == tag_id)
+        ))
+        .values(updated_at=datetime.utcnow())
+    )
+    await session.execute(
+        TaskTagLink.__table__.delete().where(TaskTagLink.tag_id == tag_id)
+    )
     await session.delete(tag)
     await session.commit()
+    user_tag_cache.clear()
     return True
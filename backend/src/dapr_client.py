@@ -11,6 +11,8 @@ from typing import Any
 
 import httpx
 
+from src.http_clients import get_dapr_client
+
 
 class DaprServiceClient:
     """
@@ -41,24 +43,24 @@ class DaprServiceClient:
         """
         url = f"{self.base_url}/invoke/{app_id}/method/{method}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                if http_method == "GET":
-                    response = await client.get(url)
-                else:
-                    response = await client.post(
-                        url,
-                        json=data or {},
-                        headers={"Content-Type": "application/json"},
-                    )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"Service call failed: {response.status_code}"}
-            except httpx.RequestError as e:
-                print(f"[Dapr] Service invocation failed: {e}")
-                return {"error": str(e)}
+        client = get_dapr_client()
+        try:
+            if http_method == "GET":
+                response = await client.get(url)
+            else:
+                response = await client.post(
+                    url,
+                    json=data or {},
+                    headers={"Content-Type": "application/json"},
+                )
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return {"error": f"Service call failed: {response.status_code}"}
+        except httpx.RequestError as e:
+            print(f"[Dapr] Service invocation failed: {e}")
+            return {"error": str(e)}
 
     async def invoke_notification_service(
         self,
@@ -101,17 +103,17 @@ class DaprSecretsClient:
         """
         url = f"{self.base_url}/secrets/{self.store_name}/{secret_name}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"[Dapr] Secret not found: {secret_name}")
-                    return {}
-            except httpx.RequestError as e:
-                print(f"[Dapr] Secrets API not available: {e}")
+        client = get_dapr_client()
+        try:
+            response = await client.get(url)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"[Dapr] Secret not found: {secret_name}")
                 return {}
+        except httpx.RequestError as e:
+            print(f"[Dapr] Secrets API not available: {e}")
+            return {}
 
     async def get_database_url(self) -> str:
         """Get DATABASE_URL from Dapr secrets."""
@@ -166,17 +168,17 @@ class DaprJobsClient:
             "data": data,
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    json=job_spec,
-                    headers={"Content-Type": "application/json"},
-                )
-                return response.status_code in (200, 201, 204)
-            except httpx.RequestError as e:
-                print(f"[Dapr] Jobs API not available: {e}")
-                return False
+        client = get_dapr_client()
+        try:
+            response = await client.post(
+                url,
+                json=job_spec,
+                headers={"Content-Type": "application/json"},
+            )
+            return response.status_code in (200, 201, 204)
+        except httpx.RequestError as e:
+            print(f"[Dapr] Jobs API not available: {e}")
+            return False
 
     async def schedule_reminder(
         self,
@@ -202,12 +204,12 @@ class DaprJobsClient:
         """Delete a scheduled job."""
         url = f"{self.base_url}/jobs/{job_name}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.delete(url)
-                return response.status_code in (200, 204)
-            except httpx.RequestError:
-                return False
+        client = get_dapr_client()
+        try:
+            response = await client.delete(url)
+            return response.status_code in (200, 204)
+        except httpx.RequestError:
+            return False
 
 
 # Global instances
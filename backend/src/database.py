@@ -6,8 +6,10 @@ Reference: @specs/database/schema.md
 import ssl
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Connection, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -47,10 +49,48 @@ async_session_maker = sessionmaker(
 )
 
 
+# Columns added to tables that existed before them. create_all() only
+# creates missing tables, so upgrade_schema() adds these to deployed
+# databases. Keep in sync with specs/database/schema.md (Upgrades).
+ADDED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "conversation": ("summary", "summarized_until_id"),
+}
+# Indexes replaced by wider ones in the models
+DROPPED_INDEXES = ("ix_message_conversation_id",)
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """
+    Bring an existing database up to the models; a no-op once applied.
+
+    Adds missing columns, then creates every model index that is missing,
+    including new indexes on old tables. Run after create_all().
+    """
+    postgres = conn.dialect.name == "postgresql"
+    inspector = inspect(conn)
+    for table_name, column_names in ADDED_COLUMNS.items():
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for name in column_names:
+            if name in existing:
+                continue
+            column = SQLModel.metadata.tables[table_name].c[name]
+            conn.execute(text(
+                f"ALTER TABLE {table_name} ADD COLUMN"
+                f"{' IF NOT EXISTS' if postgres else ''} "
+                f"{name} {column.type.compile(conn.dialect)}"
+            ))
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+    for name in DROPPED_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
 async def init_db() -> None:
-    """Initialize database and create all tables."""
+    """Initialize database: create missing tables, then upgrade old ones."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
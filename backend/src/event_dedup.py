@@ -0,0 +1,106 @@
+"""Deduplication of consumed events.
+
+Reference: @specs/features/event-driven.md
+Pub/sub delivery is at least once: Kafka redelivers after a rebalance or
+a failed ack, and the outbox relay may publish twice. Events carry an
+event_id, checked before side effects in two tiers:
+- memory: ids handled recently by this replica (LRU, so repeats are
+  skipped without a query)
+- database: processed_event rows, written in the same transaction as the
+  side effects, so a duplicate is caught on any replica, and concurrent
+  deliveries of one event can't both commit (primary key)
+Events without an event_id (older producers) are never deduplicated.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.cache import LRUCache
+from src.config import get_settings
+from src.metrics import Counter
+from src.models import ProcessedEvent
+
+settings = get_settings()
+
+event_dedup_checks = Counter(
+    "event_dedup_total",
+    "Consumed event ids checked, by tier (memory or db) and result "
+    "(new or duplicate)",
+)
+
+
+class EventDeduplicator:
+    """Two-tier record of consumed event ids."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.recent: LRUCache[str, bool] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def seen(self, event_id: str | None) -> bool:
+        """True if this replica recently handled the event (memory tier)."""
+        if event_id is None:
+            return False
+        if self.recent.get(event_id):
+            event_dedup_checks.inc(tier="memory", result="duplicate")
+            return True
+        event_dedup_checks.inc(tier="memory", result="new")
+        return False
+
+    def remember(self, event_ids: Iterable[str | None]) -> None:
+        """Record handled events in the memory tier."""
+        for event_id in event_ids:
+            if event_id is not None:
+                self.recent.set(event_id, True)
+
+    async def claim(
+        self,
+        session: AsyncSession,
+        event_ids: list[str | None],
+    ) -> list[bool]:
+        """
+        Claim the events whose side effects this transaction will commit.
+
+        Returns, per id, False if it was already processed (database tier).
+        Claimed ids are added to the session, so they commit (or roll back)
+        with the side effects.
+        """
+        ids = {event_id for event_id in event_ids if event_id is not None}
+        done = set()
+        if ids:
+            result = await session.execute(
+                select(ProcessedEvent.event_id).where(ProcessedEvent.event_id.in_(ids))
+            )
+            done = set(result.scalars().all())
+
+        claimed = []
+        for event_id in event_ids:
+            if event_id is None:
+                claimed.append(True)
+            elif event_id in done:
+                event_dedup_checks.inc(tier="db", result="duplicate")
+                claimed.append(False)
+            else:
+                done.add(event_id)  # A repeat later in the batch is a duplicate
+                session.add(ProcessedEvent(event_id=event_id))
+                event_dedup_checks.inc(tier="db", result="new")
+                claimed.append(True)
+        return claimed
+
+
+async def purge_processed_events(session: AsyncSession, older_than: datetime) -> int:
+    """Delete processed-event ids older than the retention cutoff."""
+    result = await session.execute(
+        delete(ProcessedEvent).where(ProcessedEvent.processed_at < older_than)
+    )
+    await session.commit()
+    return result.rowcount or 0
+
+
+# Global instance shared by the event handlers
+event_dedup = EventDeduplicator(
+    maxsize=settings.event_dedup_cache_size,
+    ttl=settings.event_dedup_cache_ttl,
+)
@@ -12,13 +12,21 @@ CRITICAL: Uses Dapr sidecar HTTP API, NOT direct Kafka.
 import os
 from datetime import datetime
 from typing import Any
+from uuid import uuid4
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.http_clients import get_dapr_client
+
+
+def _event_id() -> str:
+    return uuid4().hex
 
 
 class TaskEvent(BaseModel):
     """Event schema for task operations."""
+    event_id: str = Field(default_factory=_event_id)  # For consumer dedup
     event_type: str  # TaskCreated, TaskUpdated, TaskDeleted, TaskCompleted
     task_id: int
     user_id: str
@@ -27,8 +35,19 @@ class TaskEvent(BaseModel):
     timestamp: datetime
 
 
+class TasksImportedEvent(BaseModel):
+    """Summary event for a bulk import (one per import, not per task)."""
+    event_id: str = Field(default_factory=_event_id)
+    event_type: str = "TasksImported"
+    user_id: str
+    imported: int
+    failed: int
+    timestamp: datetime
+
+
 class ReminderEvent(BaseModel):
     """Event schema for reminders."""
+    event_id: str = Field(default_factory=_event_id)
     event_type: str = "ReminderDue"
     task_id: int
     user_id: str
@@ -62,92 +81,57 @@ class DaprEventPublisher:
         """
         url = f"{self.base_url}/publish/{self.pubsub_name}/{topic}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers={"Content-Type": "application/json"},
-                )
-                return response.status_code == 204
-            except httpx.RequestError:
-                # Dapr sidecar not available (local dev without Dapr)
-                print(f"[Dapr] Sidecar not available, event not published: {data}")
-                return False
-
-    async def publish_task_event(
-        self,
-        event_type: str,
-        task_id: int,
-        user_id: str,
-        title: str,
-        recurrence: str = "none",
-    ) -> bool:
-        """Publish task event to task-events topic."""
-        event = TaskEvent(
-            event_type=event_type,
-            task_id=task_id,
-            user_id=user_id,
-            title=title,
-            recurrence=recurrence,
-            timestamp=datetime.utcnow(),
-        )
-        return await self.publish("task-events", event.model_dump(mode="json"))
-
-    async def publish_task_created(
-        self,
-        task_id: int,
-        user_id: str,
-        title: str,
-    ) -> bool:
-        """Publish TaskCreated event."""
-        return await self.publish_task_event("TaskCreated", task_id, user_id, title)
-
-    async def publish_task_updated(
+        client = get_dapr_client()
+        try:
+            response = await client.post(
+                url,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
+            return response.status_code == 204
+        except httpx.RequestError:
+            # Dapr sidecar not available (local dev without Dapr)
+            print(f"[Dapr] Sidecar not available, event not published: {data}")
+            return False
+
+    async def publish_bulk(
         self,
-        task_id: int,
-        user_id: str,
-        title: str,
-    ) -> bool:
-        """Publish TaskUpdated event."""
-        return await self.publish_task_event("TaskUpdated", task_id, user_id, title)
-
-    async def publish_task_deleted(
-        self,
-        task_id: int,
-        user_id: str,
-        title: str,
-    ) -> bool:
-        """Publish TaskDeleted event."""
-        return await self.publish_task_event("TaskDeleted", task_id, user_id, title)
-
-    async def publish_task_completed(
-        self,
-        task_id: int,
-        user_id: str,
-        title: str,
-        recurrence: str = "none",
-    ) -> bool:
-        """Publish TaskCompleted event (includes recurrence for recurring task handler)."""
-        return await self.publish_task_event(
-            "TaskCompleted", task_id, user_id, title, recurrence
-        )
+        topic: str,
+        events: list[dict[str, Any]],
+    ) -> list[int]:
+        """
+        Publish several events to one topic in a single request.
 
-    async def publish_reminder(
-        self,
-        task_id: int,
-        user_id: str,
-        title: str,
-        due_at: datetime,
-    ) -> bool:
-        """Publish ReminderDue event to reminders topic."""
-        event = ReminderEvent(
-            task_id=task_id,
-            user_id=user_id,
-            title=title,
-            due_at=due_at,
+        Uses: POST /v1.0-alpha1/publish/bulk/{pubsub-name}/{topic}
+        Returns the positions of the events that were not published.
+        """
+        url = (
+            f"http://localhost:{self.dapr_port}/v1.0-alpha1"
+            f"/publish/bulk/{self.pubsub_name}/{topic}"
         )
-        return await self.publish("reminders", event.model_dump(mode="json"))
+        entries = [
+            {"entryId": str(i), "event": event, "contentType": "application/json"}
+            for i, event in enumerate(events)
+        ]
+        everything = list(range(len(events)))
+
+        client = get_dapr_client()
+        try:
+            response = await client.post(url, json=entries)
+        except httpx.RequestError:
+            print(f"[Dapr] Sidecar not available, {len(events)} events not published")
+            return everything
+        if response.is_success:
+            return []
+        try:
+            # Partial failure: the sidecar lists the entries it couldn't publish
+            failed = sorted(
+                int(entry["entryId"]) for entry in response.json()["failedEntries"]
+            )
+        except (ValueError, KeyError, TypeError):
+            failed = everything
+        print(f"[Dapr] Bulk publish to {topic}: {len(failed)}/{len(events)} failed")
+        return failed
 
 
 # Global publisher instance
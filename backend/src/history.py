@@ -0,0 +1,128 @@
+"""Token-budgeted conversation history.
+
+Reference: @specs/features/chatbot.md
+Per AC-CHAT-002.3 each request fetches history from the database, but only
+the most recent messages that fit the token budget are sent to the model.
+Older messages are folded into a rolling summary stored on the
+Conversation, so each request reads the summary plus the unsummarized
+tail of the conversation instead of every message.
+"""
+
+from collections.abc import Sequence
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import get_settings
+from src.models import Conversation, Message
+
+settings = get_settings()
+
+SUMMARY_PROMPT = "Summary of the earlier conversation:\n{summary}"
+
+# Longest excerpt of a single message kept in the summary
+SUMMARY_LINE_CHARS = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 characters per token plus per-message overhead."""
+    return len(text) // 4 + 4
+
+
+def select_window(
+    messages: Sequence[Message],
+    token_budget: int,
+    max_messages: int,
+) -> int:
+    """
+    Index where the recent window starts in oldest-first `messages`.
+
+    The window is the longest suffix within both the token budget and the
+    message cap; everything before it is due to be summarized.
+    """
+    used = 0
+    start = len(messages)
+    while start > 0 and len(messages) - start < max_messages:
+        cost = estimate_tokens(messages[start - 1].content)
+        if used + cost > token_budget:
+            break
+        used += cost
+        start -= 1
+    return start
+
+
+def _summary_line(message: Message) -> str:
+    text = " ".join(message.content.split())
+    if len(text) > SUMMARY_LINE_CHARS:
+        text = text[:SUMMARY_LINE_CHARS - 1] + "…"
+    return f"- {message.role}: {text}"
+
+
+def fold_into_summary(
+    summary: str | None,
+    messages: Sequence[Message],
+    max_tokens: int,
+) -> str:
+    """
+    Append one excerpt line per message to the summary.
+
+    The oldest lines are dropped once the summary exceeds `max_tokens`, so
+    it stays a bounded digest of the most recently folded turns.
+    """
+    lines = summary.splitlines() if summary else []
+    lines.extend(_summary_line(message) for message in messages)
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+async def load_history(
+    session: AsyncSession,
+    conversation: Conversation,
+    *,
+    token_budget: int | None = None,
+    max_messages: int | None = None,
+    summary_max_tokens: int | None = None,
+) -> list[dict[str, str]]:
+    """
+    Build the LLM history for a conversation within the token budget.
+
+    Messages that fall out of the window are folded into
+    `conversation.summary`; the caller commits the session. The summary,
+    if any, is returned first as a system message.
+    """
+    token_budget = token_budget or settings.chat_history_token_budget
+    max_messages = max_messages or settings.chat_history_max_messages
+    summary_max_tokens = summary_max_tokens or settings.chat_summary_max_tokens
+
+    # Only the unsummarized tail: bounded because every turn folds overflow
+    result = await session.execute(
+        select(Message)
+        .where(
+            Message.conversation_id == conversation.id,
+            Message.id > (conversation.summarized_until_id or 0),
+        )
+        .order_by(Message.id)
+    )
+    messages = result.scalars().all()
+
+    start = select_window(messages, token_budget, max_messages)
+    if start:
+        folded = messages[:start]
+        conversation.summary = fold_into_summary(
+            conversation.summary, folded, summary_max_tokens
+        )
+        conversation.summarized_until_id = folded[-1].id
+        session.add(conversation)
+
+    history = []
+    if conversation.summary:
+        history.append({
+            "role": "system",
+            "content": SUMMARY_PROMPT.format(summary=conversation.summary),
+        })
+    history.extend(
+        {"role": message.role, "content": message.content}
+        for message in messages[start:]
+    )
+    return history
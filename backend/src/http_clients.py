@@ -0,0 +1,81 @@
+"""Shared, pooled HTTP clients.
+
+One keep-alive connection pool per upstream per process instead of a new
+httpx.AsyncClient (and TCP/TLS handshake) per call: the LLM API, and the
+Dapr sidecar (event publishing, service invocation, secrets, jobs).
+Clients are created lazily or by the app lifespan, and closed on shutdown.
+"""
+
+import httpx
+
+from src.config import get_settings
+
+settings = get_settings()
+
+_llm_client: httpx.AsyncClient | None = None
+_dapr_client: httpx.AsyncClient | None = None
+
+
+def create_llm_client() -> httpx.AsyncClient:
+    """Build the client used for LLM chat completions."""
+    return httpx.AsyncClient(
+        http2=settings.llm_http2,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.llm_connect_timeout,
+            read=settings.llm_read_timeout,
+            write=settings.llm_write_timeout,
+            pool=settings.llm_pool_timeout,
+        ),
+    )
+
+
+def get_llm_client() -> httpx.AsyncClient:
+    """Get the process-wide LLM client, creating it on first use."""
+    global _llm_client
+    if _llm_client is None or _llm_client.is_closed:
+        _llm_client = create_llm_client()
+    return _llm_client
+
+
+def create_dapr_client() -> httpx.AsyncClient:
+    """Build the client used for the Dapr sidecar's HTTP API."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.dapr_max_connections,
+            max_keepalive_connections=settings.dapr_max_connections,
+            keepalive_expiry=settings.dapr_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            settings.dapr_timeout, connect=settings.dapr_connect_timeout
+        ),
+    )
+
+
+def get_dapr_client() -> httpx.AsyncClient:
+    """Get the process-wide Dapr sidecar client, creating it on first use."""
+    global _dapr_client
+    if _dapr_client is None or _dapr_client.is_closed:
+        _dapr_client = create_dapr_client()
+    return _dapr_client
+
+
+async def init_http_clients() -> None:
+    """Open shared clients at startup so the first request doesn't pay for it."""
+    get_llm_client()
+    get_dapr_client()
+
+
+async def close_http_clients() -> None:
+    """Close shared clients and their pooled connections."""
+    global _llm_client, _dapr_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
+    if _dapr_client is not None:
+        await _dapr_client.aclose()
+        _dapr_client = None
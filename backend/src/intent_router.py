@@ -0,0 +1,129 @@
+"""Deterministic fast path for unambiguous chat commands.
+
+Reference: @specs/features/chatbot.md
+Messages such as "show my tasks", "what's pending?", "complete task 12" or
+"delete 4" map to exactly one MCP tool call (AC-CHAT-001.2 - 001.5). The
+router recognizes them with anchored patterns, so TodoAgent can run the
+tool directly and reply from a template without an LLM round trip.
+Anything the patterns don't match in full goes to the model.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.metrics import Counter
+
+intent_router_requests = Counter(
+    "chat_intent_router_total",
+    "Chat messages by fast-path outcome (hit answered without the LLM, miss)",
+)
+
+
+@dataclass(frozen=True)
+class Intent:
+    """A recognized command: the tool to call and its arguments."""
+    tool: str
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+_TASKS = r"(?:tasks?|todos?|to-dos?|(?:to-?do|to do) list|list)"
+_ID = r"(?:task |todo |number |no\.? )?#?(\d+)"
+
+# (tool, fixed args, pattern); patterns must match the whole message
+_RULES: list[tuple[str, dict[str, Any], re.Pattern[str]]] = [
+    ("list_tasks", {"status": "pending"}, re.compile(
+        r"(?:what(?: is|'s|s)? (?:still )?"
+        r"(?:pending|left(?: to do)?|open|outstanding)"
+        r"|what do i (?:still )?(?:have|need) to do"
+        r"|(?:show|list|display|view|get)(?: me)?(?: all)?(?: my)? "
+        rf"(?:pending|open|incomplete|unfinished|outstanding|remaining) {_TASKS}"
+        rf"|(?:my )?pending(?: {_TASKS})?)"
+    )),
+    ("list_tasks", {"status": "completed"}, re.compile(
+        r"(?:(?:show|list|display|view|get)(?: me)?(?: all)?(?: my)? "
+        rf"(?:completed|done|finished) {_TASKS}"
+        r"|what (?:have i|did i) (?:completed|complete|done|do|finished|finish))"
+    )),
+    ("list_tasks", {"status": "all"}, re.compile(
+        r"(?:(?:show|list|display|view|get|see)(?: me)?(?: all)?(?: of)?(?: my)? "
+        rf"{_TASKS}"
+        rf"|what are my {_TASKS}|(?:all )?my {_TASKS})"
+    )),
+    ("complete_task", {}, re.compile(
+        rf"(?:(?:complete|finish|check off|tick off|close) {_ID}"
+        rf"|mark {_ID} (?:as )?(?:done|complete|completed|finished)"
+        rf"|{_ID} (?:is )?(?:done|complete|completed|finished)"
+        rf"|i (?:finished|completed|did) {_ID})"
+    )),
+    ("delete_task", {}, re.compile(
+        rf"(?:delete|remove|drop|trash|erase) {_ID}"
+    )),
+]
+
+
+def normalize(message: str) -> str:
+    """Lowercase, unify apostrophes, collapse whitespace, drop end punctuation."""
+    text = message.lower().replace("’", "'")
+    text = re.sub(r"\s+", " ", text).strip()
+    text = re.sub(r"^(?:please |pls |can you |could you )+", "", text)
+    return re.sub(r"(?: please)?[\s.!?]*$", "", text)
+
+
+def route(message: str) -> Intent | None:
+    """Return the intent if the message is an unambiguous command, else None."""
+    text = normalize(message)
+    for tool, args, pattern in _RULES:
+        match = pattern.fullmatch(text)
+        if match is None:
+            continue
+        # The task id is the one group captured by the matching alternative
+        task_ids = [group for group in match.groups() if group is not None]
+        if not task_ids:
+            return Intent(tool, dict(args))
+        return Intent(tool, {"task_id": int(task_ids[0])})
+    return None
+
+
+def _format_task(task: dict[str, Any]) -> str:
+    line = f"{'✅' if task['done'] else '❌'} #{task['id']} {task['title']}"
+    line += f" 📌 {task['priority']}"
+    if task["due"]:
+        line += f" 📅 {task['due'][:10]}"
+    return line
+
+
+_EMPTY_LISTS = {
+    "pending": "You have no pending tasks. 🎉",
+    "completed": "You haven't completed any tasks yet.",
+    "all": "You don't have any tasks yet.",
+}
+
+_LIST_HEADINGS = {
+    "pending": "Your pending tasks:",
+    "completed": "Your completed tasks:",
+    "all": "Your tasks:",
+}
+
+
+def render_reply(intent: Intent, result: dict | list) -> str:
+    """Reply text for a fast-path tool result."""
+    if isinstance(result, dict) and "error" in result:
+        return f"Sorry, {result['error'][0].lower()}{result['error'][1:]}."
+    if intent.tool == "list_tasks":
+        status = intent.args.get("status", "all")
+        if not result["rows"]:
+            return _EMPTY_LISTS[status]
+        lines = [
+            _format_task(dict(zip(result["columns"], row)))
+            for row in result["rows"]
+        ]
+        more = result["total"] - len(result["rows"])
+        if more > 0:
+            lines.append(f"…and {more} more. Ask to see more.")
+        return "\n".join([_LIST_HEADINGS[status], *lines])
+    if intent.tool == "complete_task":
+        return f"✅ Marked task #{result['task_id']} '{result['title']}' as done."
+    if intent.tool == "delete_task":
+        return f"🗑️ Deleted task #{result['task_id']} '{result['title']}'."
+    return "Done."
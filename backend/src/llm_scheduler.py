@@ -0,0 +1,267 @@
+"""Rate-limit-aware admission for LLM requests.
+
+Groq limits each API key by tokens per minute (14,000 on the free tier).
+Instead of sending every request and turning a 429 into a user-facing
+error, each request's token cost is estimated and admitted through a token
+bucket refilled at that rate. Requests that have to wait queue per user
+and are admitted round-robin, so one busy user can't starve the others;
+queues are bounded. Rate limit (429) and server (5xx) responses are
+retried with jittered exponential backoff, honouring Retry-After.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from src.config import get_settings
+from src.metrics import Counter, Gauge, Histogram
+
+settings = get_settings()
+
+
+class LLMQueueFullError(Exception):
+    """Too many LLM requests are already waiting for admission."""
+
+
+def estimate_request_tokens(payload: dict[str, Any]) -> int:
+    """
+    Estimated token cost of a chat completion request.
+
+    Prompt tokens (~4 characters per token, including tool definitions)
+    plus the expected completion size.
+    """
+    prompt = json.dumps(payload.get("messages", [])) + json.dumps(
+        payload.get("tools", [])
+    )
+    expected = min(
+        payload.get("max_tokens", settings.llm_expected_completion_tokens),
+        settings.llm_expected_completion_tokens,
+    )
+    return len(prompt) // 4 + expected
+
+
+class TokenBucket:
+    """Tokens refill continuously at rate_per_minute, up to capacity."""
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        refilled = self.tokens + (now - self._updated) * self.rate
+        self.tokens = min(self.capacity, refilled)
+        self._updated = now
+
+    def delay_for(self, cost: float) -> float:
+        """Seconds until `cost` tokens are available (0 if they are now)."""
+        self._refill()
+        blocked = max(0.0, self._blocked_until - time.monotonic())
+        missing = min(cost, self.capacity) - self.tokens
+        return max(blocked, missing / self.rate if missing > 0 else 0.0)
+
+    def consume(self, cost: float) -> None:
+        self._refill()
+        self.tokens -= min(cost, self.capacity)
+
+    def credit(self, tokens: float) -> None:
+        """Return (or, if negative, charge) tokens once the real cost is known."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + tokens)
+
+    def block(self, seconds: float) -> None:
+        """Admit nothing for `seconds`, e.g. after the upstream said 429."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+@dataclass
+class _Ticket:
+    cost: float
+    future: asyncio.Future[None]
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+llm_queue_wait = Histogram(
+    "llm_queue_wait_seconds",
+    "Time LLM requests waited for token-bucket admission",
+)
+llm_retries = Counter(
+    "llm_retries_total",
+    "LLM requests retried after a rate-limit or server error, by status",
+)
+llm_rejected = Counter(
+    "llm_rejected_total",
+    "LLM requests rejected because the admission queue was full",
+)
+
+
+class LLMScheduler:
+    """Admit LLM requests through a token bucket with fair per-user queues."""
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        max_queue: int,
+        max_queue_per_user: int,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+    ):
+        self.bucket = TokenBucket(tokens_per_minute)
+        self.max_queue = max_queue
+        self.max_queue_per_user = max_queue_per_user
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # user_id -> waiting tickets; users are served round-robin
+        self._queues: OrderedDict[str, deque[_Ticket]] = OrderedDict()
+        self._serving: _Ticket | None = None
+        self._last_user: str | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    def depth(self) -> int:
+        """Number of requests waiting for admission."""
+        return sum(
+            1 for queue in self._queues.values()
+            for ticket in queue if not ticket.future.done()
+        )
+
+    async def admit(self, user_id: str, cost: int) -> None:
+        """
+        Wait until the request may be sent, charging `cost` tokens.
+
+        Raises LLMQueueFullError if the user (or everyone) already has too many
+        requests waiting.
+        """
+        self._ensure_worker()
+        idle = self._serving is None and self.depth() == 0
+        if idle and self.bucket.delay_for(cost) == 0:
+            self.bucket.consume(cost)
+            llm_queue_wait.observe(0.0)
+            return
+
+        queue = self._queues.get(user_id)
+        waiting = sum(1 for t in queue if not t.future.done()) if queue else 0
+        if self.depth() >= self.max_queue or waiting >= self.max_queue_per_user:
+            llm_rejected.inc()
+            raise LLMQueueFullError("Too many LLM requests are waiting")
+
+        ticket = _Ticket(cost, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(user_id, deque()).append(ticket)
+        self._wakeup.set()
+        try:
+            await ticket.future
+        finally:
+            llm_queue_wait.observe(time.monotonic() - ticket.enqueued)
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not loop
+        ):
+            # State from another (finished) event loop can't be served
+            self._queues.clear()
+            self._serving = None
+            self._wakeup = asyncio.Event()
+            self._worker = loop.create_task(self._run())
+
+    def _next(self) -> _Ticket | None:
+        """Head of the next user's queue, round-robin; skips abandoned tickets."""
+        while self._queues:
+            user_id = next(iter(self._queues))
+            if user_id == self._last_user and len(self._queues) > 1:
+                # Someone else queued while this user was being served
+                self._queues.move_to_end(user_id)
+                user_id = next(iter(self._queues))
+            queue = self._queues[user_id]
+            ticket = queue.popleft()
+            if queue:
+                self._queues.move_to_end(user_id)
+            else:
+                del self._queues[user_id]
+            if not ticket.future.done():
+                self._last_user = user_id
+                return ticket
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            ticket = self._next()
+            if ticket is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            self._serving = ticket
+            try:
+                while (delay := self.bucket.delay_for(ticket.cost)) > 0:
+                    await asyncio.sleep(delay)
+            finally:
+                self._serving = None
+            if ticket.future.done():
+                continue  # Caller gave up while we waited for tokens
+            self.bucket.consume(ticket.cost)
+            ticket.future.set_result(None)
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the bucket once the response reports the real token usage."""
+        self.bucket.credit(estimated - actual)
+
+    def retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """
+        Seconds to wait before retrying, or None if the response is final.
+
+        429 and 5xx are retried up to max_retries times. A 429 also pauses
+        admission for everyone, since the limit is per API key.
+        """
+        status = response.status_code
+        if (status != 429 and status < 500) or attempt >= self.max_retries:
+            return None
+        llm_retries.inc(status=status)
+
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            delay = min(retry_after, self.backoff_max) + random.uniform(
+                0, self.backoff_base
+            )
+        else:
+            cap = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+            delay = random.uniform(0, cap)
+        if status == 429:
+            self.bucket.block(delay)
+        return delay
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return max(0.0, float(response.headers["retry-after"]))
+    except (KeyError, ValueError):
+        return None
+
+
+# Global scheduler instance (limits are per API key, i.e. per process here)
+llm_scheduler = LLMScheduler(
+    tokens_per_minute=settings.llm_tokens_per_minute,
+    max_queue=settings.llm_queue_max,
+    max_queue_per_user=settings.llm_queue_max_per_user,
+    max_retries=settings.llm_max_retries,
+    backoff_base=settings.llm_backoff_base,
+    backoff_max=settings.llm_backoff_max,
+)
+
+llm_queue_depth = Gauge(
+    "llm_queue_depth",
+    "LLM requests waiting for token-bucket admission",
+    callback=llm_scheduler.depth,
+)
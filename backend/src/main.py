@@ -9,10 +9,14 @@ from collections.abc import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from src.config import get_settings
 from src.database import init_db
-from src.routes import tasks, chat, dapr_events
+from src.http_clients import close_http_clients, init_http_clients
+from src.metrics import render_metrics
+from src.outbox import outbox_relay
+from src.routes import tasks, tags, chat, conversations, dapr_events
 
 settings = get_settings()
 
@@ -24,10 +28,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print("📦 Initializing database...")
     await init_db()
     print("✅ Database ready!")
+    await init_http_clients()
+    outbox_relay.start()
     print("🤖 AI Chatbot enabled (Phase III)")
     print("📡 Dapr Event-Driven enabled (Phase V)")
     yield
     print("👋 Shutting down...")
+    await outbox_relay.stop()
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -50,7 +58,9 @@ app.add_middleware(
 
 # Include routers
 app.include_router(tasks.router)
+app.include_router(tags.router)
 app.include_router(chat.router)
+app.include_router(conversations.router)
 app.include_router(dapr_events.router)  # Phase V: Dapr events
 
 
@@ -71,6 +81,12 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "phase": "V"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> str:
+    """Application metrics in Prometheus text format."""
+    return render_metrics()
+
+
 def run_server() -> None:
     """Run the server with uvicorn."""
     uvicorn.run(
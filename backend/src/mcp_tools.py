@@ -2,17 +2,78 @@
 
 Reference: @specs/api/mcp-tools.md
 Implements 5 tools: add_task, list_tasks, complete_task, delete_task, update_task
+plus bulk variants add_tasks, complete_tasks, delete_tasks (one SQL statement
+per batch instead of one tool call per task).
 
 These are FUNCTION DEFINITIONS for OpenAI Agents SDK, not an MCP server.
 """
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlmodel import select
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, update
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.models import Task
+from src.bulk_import import format_validation_error
+from src.cache import user_tag_cache
+from src.metrics import Histogram
+from src.models import Priority, Task, TaskCreate, TaskTagLink, TaskTombstone
+
+
+# list_tasks pages (rows are sent to the LLM, so keep them small)
+LIST_PAGE_SIZE = 20
+LIST_MAX_PAGE_SIZE = 50
+LIST_TITLE_CHARS = 60
+LIST_COLUMNS = ["id", "title", "done", "priority", "due"]
+
+
+# Most items a bulk tool (add_tasks, complete_tasks, delete_tasks) accepts
+BULK_MAX_ITEMS = 50
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO datetime from the LLM as naive UTC; None if invalid."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_priority(value: str | None) -> Priority:
+    """Map a priority string to the enum, defaulting to medium."""
+    try:
+        return Priority((value or "medium").lower())
+    except ValueError:
+        return Priority.MEDIUM
+
+
+def _task_item(item: Any) -> Any:
+    """Normalize an add_tasks item from the LLM as add_task does."""
+    if not isinstance(item, dict):
+        return item
+    item = {**item, "description": item.get("description") or ""}
+    if isinstance(item.get("priority"), str):
+        item["priority"] = item["priority"].lower()
+    for field in ("due_date", "reminder_at"):
+        if isinstance(item.get(field), str):
+            item[field] = _parse_datetime(item[field])
+    return item
+
+
+def _task_ids(task_ids: list[int | str]) -> list[int]:
+    """Deduplicated integer ids (the LLM may pass strings)."""
+    ids = list(dict.fromkeys(int(task_id) for task_id in task_ids))
+    if len(ids) > BULK_MAX_ITEMS:
+        raise ValueError(f"at most {BULK_MAX_ITEMS} tasks per call")
+    return ids
 
 
 # ============================================================================
@@ -59,7 +120,11 @@ TOOL_DEFINITIONS = [
         "type": "function",
         "function": {
             "name": "list_tasks",
-            "description": "List all tasks or filter by status (all, pending, completed)",
+            "description": (
+                "List tasks, newest first, as a compact table: columns names the "
+                "fields of each row. Returns at most `limit` rows plus next_cursor "
+                "when more exist; only fetch the next page if the user asks for more"
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -68,6 +133,30 @@ TOOL_DEFINITIONS = [
                         "enum": ["all", "pending", "completed"],
                         "description": "Filter by status. Use 'pending' for incomplete tasks.",
                     },
+                    "priority": {
+                        "type": "string",
+                        "enum": ["high", "medium", "low"],
+                        "description": "Only tasks with this priority (optional)",
+                    },
+                    "due": {
+                        "type": "string",
+                        "enum": ["overdue", "today", "week", "none"],
+                        "description": (
+                            "Due date filter: overdue, due today, due within 7 days, "
+                            "or without a due date (optional)"
+                        ),
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": (
+                            f"Rows per page (default {LIST_PAGE_SIZE}, "
+                            f"max {LIST_MAX_PAGE_SIZE})"
+                        ),
+                    },
+                    "cursor": {
+                        "type": "integer",
+                        "description": "next_cursor of the previous page",
+                    },
                 },
                 "required": [],
             },
@@ -132,8 +221,95 @@ TOOL_DEFINITIONS = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "add_tasks",
+            "description": (
+                "Create several tasks in one call; use instead of repeated add_task"
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "maxItems": BULK_MAX_ITEMS,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "description": {"type": "string"},
+                                "priority": {
+                                    "type": "string",
+                                    "enum": ["high", "medium", "low"],
+                                },
+                                "due_date": {
+                                    "type": "string",
+                                    "description": "ISO format YYYY-MM-DDTHH:MM:SS",
+                                },
+                                "reminder_at": {
+                                    "type": "string",
+                                    "description": "ISO format",
+                                },
+                            },
+                            "required": ["title"],
+                        },
+                    },
+                },
+                "required": ["tasks"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "complete_tasks",
+            "description": "Mark several tasks complete in one call",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "task_ids": {
+                        "type": "array",
+                        "maxItems": BULK_MAX_ITEMS,
+                        "items": {"type": "integer"},
+                        "description": "IDs of the tasks to complete",
+                    },
+                },
+                "required": ["task_ids"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_tasks",
+            "description": "Delete several tasks in one call",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "task_ids": {
+                        "type": "array",
+                        "maxItems": BULK_MAX_ITEMS,
+                        "items": {"type": "integer"},
+                        "description": "IDs of the tasks to delete",
+                    },
+                },
+                "required": ["task_ids"],
+            },
+        },
+    },
 ]
 
+# Tools that never write; the agent may run these concurrently
+READ_ONLY_TOOLS = frozenset({"list_tasks"})
+
+TOOL_NAMES = frozenset(tool["function"]["name"] for tool in TOOL_DEFINITIONS)
+
+mcp_tool_seconds = Histogram(
+    "mcp_tool_seconds",
+    "Chat tool execution time, by tool",
+)
+
 
 class MCPToolExecutor:
     """Execute MCP tools against the database.
@@ -154,38 +330,13 @@ class MCPToolExecutor:
         reminder_at: str | None = None,
     ) -> dict[str, Any]:
         """Add a new task with Phase V fields."""
-        from src.models import Priority
-        
-        # Parse due_date and reminder_at if provided
-        parsed_due_date = None
-        parsed_reminder_at = None
-        
-        if due_date:
-            try:
-                parsed_due_date = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        
-        if reminder_at:
-            try:
-                parsed_reminder_at = datetime.fromisoformat(reminder_at.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        
-        # Map priority string to enum
-        priority_enum = Priority.MEDIUM
-        if priority.lower() == "high":
-            priority_enum = Priority.HIGH
-        elif priority.lower() == "low":
-            priority_enum = Priority.LOW
-        
         task = Task(
             title=title,
             description=description,
             user_id=self.user_id,
-            priority=priority_enum,
-            due_date=parsed_due_date,
-            reminder_at=parsed_reminder_at,
+            priority=_parse_priority(priority),
+            due_date=_parse_datetime(due_date),
+            reminder_at=_parse_datetime(reminder_at),
         )
         self.session.add(task)
         await self.session.flush()
@@ -207,38 +358,74 @@ class MCPToolExecutor:
     async def list_tasks(
         self,
         status: str = "all",
-    ) -> list[dict[str, Any]]:
+        priority: str | None = None,
+        due: str | None = None,
+        limit: int | str = LIST_PAGE_SIZE,
+        cursor: int | str | None = None,
+    ) -> dict[str, Any]:
         """
-        List tasks with optional status filter.
-        
+        List one page of tasks, newest first, in a compact tabular form.
+
         Per AC-CHAT-001.3: "What's pending?" → calls list_tasks(status="pending")
+        Rows follow LIST_COLUMNS; descriptions are left out and long titles
+        cut. `next_cursor` (the last id on the page) continues the listing.
         """
-        query = select(Task).where(Task.user_id == self.user_id)
+        limit = max(1, min(int(limit), LIST_MAX_PAGE_SIZE))
+        conditions = [Task.user_id == self.user_id]
 
         if status == "pending":
-            query = query.where(Task.completed == False)  # noqa: E712
+            conditions.append(Task.completed == False)  # noqa: E712
         elif status == "completed":
-            query = query.where(Task.completed == True)  # noqa: E712
-
-        result = await self.session.execute(query.order_by(Task.created_at.desc()))
-        tasks = result.scalars().all()
-
-        task_list = []
-        for t in tasks:
-            task_data = {
-                "id": t.id,
-                "title": t.title,
-                "completed": t.completed,
-                "description": t.description,
-                "priority": t.priority.value if t.priority else "medium",
-            }
-            if t.due_date:
-                task_data["due_date"] = t.due_date.isoformat()
-            if t.reminder_at:
-                task_data["reminder_at"] = t.reminder_at.isoformat()
-            task_list.append(task_data)
-        
-        return task_list
+            conditions.append(Task.completed == True)  # noqa: E712
+
+        if priority:
+            conditions.append(Task.priority == Priority(priority.lower()))
+
+        now = datetime.utcnow()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if due == "overdue":
+            conditions.append(Task.due_date < now)
+        elif due == "today":
+            conditions.append(Task.due_date >= today)
+            conditions.append(Task.due_date < today + timedelta(days=1))
+        elif due == "week":
+            conditions.append(Task.due_date >= today)
+            conditions.append(Task.due_date < today + timedelta(days=7))
+        elif due == "none":
+            conditions.append(Task.due_date.is_(None))
+
+        total = (await self.session.execute(
+            select(func.count()).select_from(Task).where(*conditions)
+        )).scalar_one()
+
+        query = select(
+            Task.id, Task.title, Task.completed, Task.priority, Task.due_date
+        ).where(*conditions)
+        if cursor is not None:
+            query = query.where(Task.id < int(cursor))
+        result = await self.session.execute(
+            query.order_by(Task.id.desc()).limit(limit + 1)
+        )
+        rows = result.all()
+
+        page = []
+        for task_id, title, completed, task_priority, due_date in rows[:limit]:
+            if len(title) > LIST_TITLE_CHARS:
+                title = title[:LIST_TITLE_CHARS - 1] + "…"
+            page.append([
+                task_id,
+                title,
+                completed,
+                task_priority.value if task_priority else "medium",
+                due_date.isoformat(timespec="minutes") if due_date else None,
+            ])
+
+        return {
+            "columns": LIST_COLUMNS,
+            "rows": page,
+            "total": total,
+            "next_cursor": page[-1][0] if len(rows) > limit else None,
+        }
 
     async def complete_task(
         self,
@@ -279,8 +466,13 @@ class MCPToolExecutor:
             return {"error": f"Task {task_id} not found"}
 
         title = task.title
+        await self.session.execute(
+            TaskTagLink.__table__.delete().where(TaskTagLink.task_id == task_id)
+        )
         await self.session.delete(task)
+        self.session.add(TaskTombstone(task_id=task_id, user_id=self.user_id))
         await self.session.flush()
+        user_tag_cache.pop(self.user_id)
 
         return {
             "task_id": task_id,
@@ -318,8 +510,108 @@ class MCPToolExecutor:
             "title": task.title,
         }
 
+    async def add_tasks(self, tasks: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Add several tasks with one multi-row INSERT.
+
+        Items are validated like POST /tasks; invalid ones are reported by
+        position in `errors` and the valid ones are still added.
+        """
+        if not tasks:
+            return {"error": "No tasks given"}
+        if len(tasks) > BULK_MAX_ITEMS:
+            return {"error": f"At most {BULK_MAX_ITEMS} tasks per call"}
+
+        now = datetime.utcnow()
+        rows, errors = [], []
+        for i, item in enumerate(tasks):
+            try:
+                task = TaskCreate.model_validate(_task_item(item))
+            except ValidationError as e:
+                errors.append({"item": i, "error": format_validation_error(e)})
+                continue
+            rows.append({
+                "title": task.title,
+                "description": task.description,
+                "priority": task.priority,
+                "due_date": task.due_date,
+                "reminder_at": task.reminder_at,
+                "user_id": self.user_id,
+                "created_at": now,
+                "updated_at": now,
+            })
+        if not rows:
+            return {"error": "No valid tasks", "errors": errors}
+
+        result = await self.session.execute(
+            insert(Task).returning(Task.id, Task.title, sort_by_parameter_order=True),
+            rows,
+        )
+        response = {
+            "status": "created",
+            "columns": ["task_id", "title"],
+            "tasks": [list(row) for row in result.all()],
+        }
+        if errors:
+            response["errors"] = errors
+        return response
+
+    async def complete_tasks(self, task_ids: list[int | str]) -> dict[str, Any]:
+        """Mark several tasks complete with one UPDATE."""
+        ids = _task_ids(task_ids)
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.user_id == self.user_id, Task.id.in_(ids))
+            .values(completed=True, updated_at=datetime.utcnow())
+            .returning(Task.id, Task.title)
+        )
+        done = sorted(result.all())
+        found = {task_id for task_id, _ in done}
+        return {
+            "status": "completed",
+            "columns": ["task_id", "title"],
+            "tasks": [list(row) for row in done],
+            "not_found": [task_id for task_id in ids if task_id not in found],
+        }
+
+    async def delete_tasks(self, task_ids: list[int | str]) -> dict[str, Any]:
+        """Delete several tasks (and their tag links) with set-based DELETEs."""
+        ids = _task_ids(task_ids)
+        owned = select(Task.id).where(Task.user_id == self.user_id, Task.id.in_(ids))
+        await self.session.execute(
+            delete(TaskTagLink).where(TaskTagLink.task_id.in_(owned))
+        )
+        result = await self.session.execute(
+            delete(Task)
+            .where(Task.user_id == self.user_id, Task.id.in_(ids))
+            .returning(Task.id, Task.title)
+        )
+        deleted = sorted(result.all())
+        if deleted:
+            await self.session.execute(insert(TaskTombstone), [
+                {"task_id": task_id, "user_id": self.user_id}
+                for task_id, _ in deleted
+            ])
+            user_tag_cache.pop(self.user_id)
+        found = {task_id for task_id, _ in deleted}
+        return {
+            "status": "deleted",
+            "columns": ["task_id", "title"],
+            "tasks": [list(row) for row in deleted],
+            "not_found": [task_id for task_id in ids if task_id not in found],
+        }
+
     async def execute_tool(self, name: str, arguments: dict[str, Any]) -> dict | list:
-        """Execute a tool by name with given arguments."""
+        """Execute a tool by name with given arguments, timing the call."""
+        start = time.perf_counter()
+        try:
+            return await self._dispatch(name, arguments)
+        finally:
+            # Names come from the model: don't let unknown ones mint labels
+            tool = name if name in TOOL_NAMES else "unknown"
+            mcp_tool_seconds.observe(time.perf_counter() - start, tool=tool)
+
+    async def _dispatch(self, name: str, arguments: dict[str, Any]) -> dict | list:
         if name == "add_task":
             return await self.add_task(**arguments)
         elif name == "list_tasks":
@@ -330,5 +622,11 @@ class MCPToolExecutor:
             return await self.delete_task(**arguments)
         elif name == "update_task":
             return await self.update_task(**arguments)
+        elif name == "add_tasks":
+            return await self.add_tasks(**arguments)
+        elif name == "complete_tasks":
+            return await self.complete_tasks(**arguments)
+        elif name == "delete_tasks":
+            return await self.delete_tasks(**arguments)
         else:
             return {"error": f"Unknown tool: {name}"}
@@ -0,0 +1,154 @@
+"""In-process application metrics.
+
+Reference: @docs/MONITORING.md
+Minimal counters, gauges and histograms rendered in the Prometheus text
+format at GET /metrics. Values are per worker process.
+"""
+
+from collections.abc import Callable
+from threading import Lock
+
+LabelKey = tuple[tuple[str, str], ...]
+
+REGISTRY: list["_Metric"] = []
+
+
+def _label_key(labels: dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._lock = Lock()
+        REGISTRY.append(self)
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        return "\n".join(header + self._samples())
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    kind = "counter"
+
+    def __init__(self, name: str, description: str):
+        self._values: dict[LabelKey, float] = {}
+        super().__init__(name, description)
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be read from a callback."""
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        callback: Callable[[], float] | None = None,
+    ):
+        self._values: dict[LabelKey, float] = {}
+        self._callback = callback
+        super().__init__(name, description)
+
+    def set(self, value: float, **labels: object) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        if self._callback is not None:
+            return self._callback()
+        return self._values.get(_label_key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        if self._callback is not None:
+            return [f"{self.name} {self._callback()}"]
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+# Seconds; covers fast DB reads through slow LLM completions
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = buckets
+        # label key -> (bucket counts, sum, count)
+        self._values: dict[LabelKey, tuple[list[int], float, int]] = {}
+        super().__init__(name, description)
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            counts, total, n = self._values.get(key) or ([0] * len(self.buckets), 0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, n + 1)
+
+    def count(self, **labels: object) -> int:
+        entry = self._values.get(_label_key(labels))
+        return entry[2] if entry else 0
+
+    def sum(self, **labels: object) -> float:
+        entry = self._values.get(_label_key(labels))
+        return entry[1] if entry else 0.0
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, (counts, total, n) in self._values.items():
+            bucket_counts = [*zip(map(str, self.buckets), counts), ("+Inf", n)]
+            for bound, c in bucket_counts:
+                labels = _format_labels(key, (("le", bound),))
+                lines.append(f"{self.name}_bucket{labels} {c}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {n}")
+        return lines
+
+
+def render_metrics() -> str:
+    """Render every registered metric in Prometheus text format."""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
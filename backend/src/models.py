@@ -7,7 +7,9 @@ Reference: @specs/database/schema.md
 
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -70,6 +72,21 @@ class Task(TaskBase, table=True):
     - AC-001.5: Task is associated with the logged-in user
     """
     __tablename__ = "task"
+    __table_args__ = (
+        # Per-user range scans: agenda windows and the default newest-first list
+        Index("ix_task_user_id_due_date", "user_id", "due_date"),
+        Index("ix_task_user_id_created_at", "user_id", "created_at"),
+        Index("ix_task_user_id_updated_at", "user_id", "updated_at"),
+        # Reminder cron scan: only tasks with a pending reminder are indexed
+        Index(
+            "ix_task_reminder_at_pending",
+            "reminder_at",
+            "id",
+            # Spelled as the cron's filter renders, so the planners match it
+            postgresql_where=text("reminder_at IS NOT NULL AND completed = false"),
+            sqlite_where=text("reminder_at IS NOT NULL AND completed = 0"),
+        ),
+    )
     
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)  # CRITICAL: User who owns this task
@@ -79,6 +96,64 @@ class Task(TaskBase, table=True):
     tags: list[Tag] = Relationship(back_populates="tasks", link_model=TaskTagLink)
 
 
+class TaskTombstone(SQLModel, table=True):
+    """Marker left by a deleted task so offline clients can sync deletes.
+
+    Removed after the retention window (settings.tombstone_retention_days).
+    """
+    __tablename__ = "task_tombstone"
+    __table_args__ = (
+        Index("ix_task_tombstone_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    task_id: int
+    user_id: str
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class OutboxEvent(SQLModel, table=True):
+    """Event written in the same transaction as the change it describes.
+
+    Published to Dapr by the outbox relay (see src/outbox.py), which sets
+    sent_at. next_attempt_at is cleared once an event has failed
+    settings.outbox_max_attempts times; it is then kept only for inspection.
+    """
+    __tablename__ = "outbox_event"
+    __table_args__ = (
+        # Relay claims: only unsent rows are indexed
+        Index(
+            "ix_outbox_event_pending",
+            "next_attempt_at",
+            "id",
+            postgresql_where=text("sent_at IS NULL"),
+            sqlite_where=text("sent_at IS NULL"),
+        ),
+        Index("ix_outbox_event_created_at", "created_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    topic: str = Field(max_length=100)
+    payload: str  # JSON
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    attempts: int = 0
+    next_attempt_at: datetime | None = Field(default_factory=datetime.utcnow)
+    sent_at: datetime | None = None
+
+
+class ProcessedEvent(SQLModel, table=True):
+    """Id of a consumed event whose side effects are committed.
+
+    Written in the same transaction as the side effects, so a redelivered
+    event is recognised (see src/event_dedup.py). Purged after
+    settings.event_dedup_retention_days.
+    """
+    __tablename__ = "processed_event"
+
+    event_id: str = Field(primary_key=True, max_length=64)
+    processed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
@@ -89,6 +164,11 @@ class TagRead(TagBase):
     id: int
 
 
+class TagUsage(TagRead):
+    """Tag with the number of the user's tasks carrying it."""
+    task_count: int
+
+
 class TagCreate(SQLModel):
     """Tag creation model."""
     name: str = Field(max_length=50)
@@ -108,6 +188,34 @@ class TaskReadWithTags(TaskRead):
     tags: list[TagRead] = []
 
 
+# Sort keys for task lists - restricted to indexed columns
+TaskSortField = Literal["created_at", "due_date", "priority", "title"]
+
+# "all": task has every requested tag, "any": task has at least one
+TagMatchMode = Literal["all", "any"]
+
+
+class AgendaBucket(SQLModel):
+    """Tasks due within one agenda window."""
+    tasks: list[TaskRead] = Field(default_factory=list)
+    count: int | None = None  # Total in window, only when counts requested
+
+
+class AgendaResponse(SQLModel):
+    """Pending tasks bucketed by due date.
+
+    overdue: due before `now`
+    today: due between `now` and `today_end`
+    upcoming: due between `today_end` and `window_end`
+    """
+    now: datetime
+    today_end: datetime
+    window_end: datetime
+    overdue: AgendaBucket
+    today: AgendaBucket
+    upcoming: AgendaBucket
+
+
 class TaskCreate(SQLModel):
     """Task creation model.
     
@@ -141,6 +249,36 @@ class TaskUpdate(SQLModel):
     tag_ids: list[int] | None = None
 
 
+class TaskChanges(SQLModel):
+    """Delta-sync page: tasks changed and task ids deleted after a cursor.
+
+    Pass `cursor` back as `since` to get the next page. `reset` means the
+    given cursor predates the tombstone retention window: drop local state
+    and rebuild from this (full) listing.
+    """
+    changed: list[TaskRead] = Field(default_factory=list)
+    deleted: list[int] = Field(default_factory=list)
+    cursor: str | None = None
+    has_more: bool = False
+    reset: bool = False
+
+
+class TaskImportLineError(SQLModel):
+    """A rejected row from a bulk import."""
+    line: int
+    error: str
+
+
+class TaskImportResult(SQLModel):
+    """Bulk import summary.
+
+    Only the first errors are reported; `failed` counts every rejected row.
+    """
+    imported: int = 0
+    failed: int = 0
+    errors: list[TaskImportLineError] = Field(default_factory=list)
+
+
 # ============================================================================
 # PHASE III: CONVERSATION MODELS
 # Per specs/features/chatbot.md AC-CHAT-002.2: Conversation history stored in DB
@@ -153,12 +291,21 @@ class Conversation(SQLModel, table=True):
     Per AC-CHAT-002.2: Conversation history stored in database.
     """
     __tablename__ = "conversation"
+    __table_args__ = (
+        # Conversation list, most recently active first
+        Index("ix_conversation_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Rolling summary of messages older than the history window, and the
+    # id of the last message folded into it (see src/history.py)
+    summary: str | None = None
+    summarized_until_id: int | None = None
+
     messages: list["Message"] = Relationship(back_populates="conversation")
 
 
@@ -168,9 +315,17 @@ class Message(SQLModel, table=True):
     Per AC-CHAT-002.3: Each request fetches history from DB.
     """
     __tablename__ = "message"
+    __table_args__ = (
+        # Keyset pages of a conversation's messages (also serves lookups
+        # by conversation_id alone)
+        Index(
+            "ix_message_conversation_id_created_at_id",
+            "conversation_id", "created_at", "id",
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    conversation_id: int = Field(foreign_key="conversation.id", index=True)
+    conversation_id: int = Field(foreign_key="conversation.id")
     user_id: str = Field(index=True)
     role: str = Field(max_length=20)  # "user" or "assistant"
     content: str  # No max_length for chat messages
@@ -196,3 +351,37 @@ class ChatResponse(SQLModel):
     conversation_id: int
     response: str
     tool_calls: list[str] = Field(default_factory=list)
+
+
+class ConversationRead(SQLModel):
+    """Conversation in the history list."""
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ConversationPage(SQLModel):
+    """One page of conversations, most recently active first.
+
+    Pass `next_cursor` as `before` to get the next page; null at the end.
+    """
+    conversations: list[ConversationRead] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class MessageRead(SQLModel):
+    """Stored chat message."""
+    id: int
+    role: str
+    content: str
+    created_at: datetime
+
+
+class MessagePage(SQLModel):
+    """One page of messages, oldest first.
+
+    Pages walk backwards through the conversation: pass `next_cursor` as
+    `before` to get the messages preceding this page; null at the start.
+    """
+    messages: list[MessageRead] = Field(default_factory=list)
+    next_cursor: str | None = None
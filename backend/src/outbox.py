@@ -0,0 +1,230 @@
+"""Transactional outbox for task and reminder events.
+
+Reference: @specs/features/event-driven.md
+Publishing after commit loses the event if the process dies in between,
+or if the sidecar is down. Instead, task changes in src/crud.py and bulk
+imports add an OutboxEvent row in the same transaction, and a relay task
+publishes committed rows:
+- claims the oldest due rows with FOR UPDATE SKIP LOCKED, so replicas
+  each take different rows (SQLite has no row locks, and one writer)
+- publishes them through Dapr bulk publish, one request per topic
+- marks the published rows sent in the same transaction
+- retries failed rows with capped exponential backoff and parks a row
+  after OUTBOX_MAX_ATTEMPTS, so failures can't grow an endless backlog
+Delivery is at least once. The relay polls every OUTBOX_POLL_INTERVAL,
+and commits in this process wake it at once.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import get_settings
+from src.database import async_session_maker
+from src.events import ReminderEvent, TaskEvent, TasksImportedEvent, event_publisher
+from src.metrics import Counter, Histogram
+from src.models import OutboxEvent, Task
+
+settings = get_settings()
+
+BACKOFF_BASE = timedelta(seconds=1)
+BACKOFF_MAX = timedelta(minutes=5)
+
+outbox_events = Counter(
+    "outbox_events_total",
+    "Outbox events by outcome: sent, retry (publish failed) or parked "
+    "(gave up after OUTBOX_MAX_ATTEMPTS)",
+)
+outbox_lag = Histogram(
+    "outbox_lag_seconds",
+    "Time from commit of an outbox event to its publication",
+)
+
+
+def add_event(session: AsyncSession, topic: str, data: dict[str, Any]) -> None:
+    """Stage an event to be published once the session commits."""
+    session.add(OutboxEvent(topic=topic, payload=json.dumps(data)))
+
+
+def add_task_event(session: AsyncSession, event_type: str, task: Task) -> None:
+    """Stage a task-events event for `task` (which must have an id)."""
+    event = TaskEvent(
+        event_type=event_type,
+        task_id=task.id,
+        user_id=task.user_id,
+        title=task.title,
+        recurrence=task.recurrence.value if task.recurrence else "none",
+        timestamp=datetime.utcnow(),
+    )
+    add_event(session, "task-events", event.model_dump(mode="json"))
+
+
+def add_tasks_imported_event(
+    session: AsyncSession,
+    user_id: str,
+    imported: int,
+    failed: int,
+) -> None:
+    """Stage the TasksImported summary event of a bulk import."""
+    event = TasksImportedEvent(
+        user_id=user_id,
+        imported=imported,
+        failed=failed,
+        timestamp=datetime.utcnow(),
+    )
+    add_event(session, "task-events", event.model_dump(mode="json"))
+
+
+def add_reminder_event(
+    session: AsyncSession,
+    task_id: int,
+    user_id: str,
+    title: str,
+    due_at: datetime,
+) -> None:
+    """Stage a ReminderDue event."""
+    event = ReminderEvent(task_id=task_id, user_id=user_id, title=title, due_at=due_at)
+    add_event(session, "reminders", event.model_dump(mode="json"))
+
+
+def _backoff(attempts: int) -> timedelta:
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1))
+
+
+class OutboxRelay:
+    """Background task that publishes committed outbox rows."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        publish: Callable[[str, list[dict[str, Any]]], Awaitable[list[int]]],
+        *,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+    ):
+        self.session_factory = session_factory
+        self.publish = publish
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._worker: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop relaying; unsent rows stay in the table for the next start."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def notify(self) -> None:
+        """Wake the relay after committing outbox rows."""
+        if self._worker is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.relay_once()
+            except Exception as e:
+                # Database unavailable and the like: try again next poll
+                print(f"[OUTBOX] Relay pass failed: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                # Caught up; wait for a commit or the next poll
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.poll_interval
+                    )
+                except TimeoutError:
+                    pass
+
+    async def relay_once(self, now: datetime | None = None) -> int:
+        """Publish one batch of due events; returns how many were claimed."""
+        async with self.session_factory() as session:
+            now = now or datetime.utcnow()
+            result = await session.execute(
+                select(OutboxEvent)
+                .where(
+                    OutboxEvent.sent_at.is_(None),
+                    OutboxEvent.next_attempt_at <= now,
+                )
+                .order_by(OutboxEvent.next_attempt_at, OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = list(result.scalars().all())
+            if not rows:
+                return 0
+
+            by_topic: dict[str, list[OutboxEvent]] = {}
+            for row in rows:
+                by_topic.setdefault(row.topic, []).append(row)
+            for topic, topic_rows in by_topic.items():
+                events = [json.loads(row.payload) for row in topic_rows]
+                try:
+                    failed = set(await self.publish(topic, events))
+                except Exception as e:
+                    print(f"[OUTBOX] Publish to {topic} failed: {e}")
+                    failed = set(range(len(topic_rows)))
+                for i, row in enumerate(topic_rows):
+                    if i in failed:
+                        self._failed(row, now)
+                    else:
+                        row.sent_at = now
+                        outbox_events.inc(outcome="sent")
+                        outbox_lag.observe((now - row.created_at).total_seconds())
+            await session.commit()
+        return len(rows)
+
+    def _failed(self, row: OutboxEvent, now: datetime) -> None:
+        row.attempts += 1
+        if row.attempts >= self.max_attempts:
+            row.next_attempt_at = None
+            outbox_events.inc(outcome="parked")
+            print(f"[OUTBOX] Gave up on event #{row.id} after {row.attempts} attempts")
+        else:
+            row.next_attempt_at = now + _backoff(row.attempts)
+            outbox_events.inc(outcome="retry")
+
+
+async def purge_outbox(session: AsyncSession, older_than: datetime) -> int:
+    """Delete sent and parked events created before the cutoff."""
+    result = await session.execute(
+        delete(OutboxEvent).where(
+            OutboxEvent.created_at < older_than,
+            or_(
+                OutboxEvent.sent_at.is_not(None),
+                OutboxEvent.next_attempt_at.is_(None),
+            ),
+        )
+    )
+    await session.commit()
+    return result.rowcount or 0
+
+
+# Global relay instance, started by the app lifespan
+outbox_relay = OutboxRelay(
+    async_session_maker,
+    event_publisher.publish_bulk,
+    batch_size=settings.outbox_batch_size,
+    poll_interval=settings.outbox_poll_interval,
+    max_attempts=settings.outbox_max_attempts,
+)
@@ -7,7 +7,8 @@ Reference: @specs/features/chatbot.md
 
 Flow per hackathon spec:
 1. Receive user message
-2. Fetch conversation history from database
+2. Fetch conversation history from database (recent turns within the
+   token budget plus a rolling summary, see src/history.py)
 3. Build message array for agent (history + new message)
 4. Store user message in database
 5. Run agent with MCP tools
@@ -15,44 +16,48 @@ Flow per hackathon spec:
 7. Store assistant response in database
 8. Return response to client
 9. Server holds NO state (ready for next request)
+
+Steps 2-4, each round of tool calls, and step 7 are separate short
+transactions. No pooled connection is held while waiting for the model,
+which can take many seconds.
+
+Every request is timed per phase (see src/chat_trace.py); with
+CHAT_SERVER_TIMING, POST /chat returns the breakdown in a Server-Timing
+header.
 """
 
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.agent import TodoAgent
 from src.auth import CurrentUser, get_current_user, verify_user_access
-from src.database import get_session
+from src.chat_trace import phase, record_history, start_trace
+from src.config import get_settings
+from src.database import async_session_maker, get_session
+from src.history import load_history
+from src.http_clients import get_llm_client
 from src.models import ChatRequest, ChatResponse, Conversation, Message
 
 router = APIRouter(prefix="/api/{user_id}", tags=["Chat"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+settings = get_settings()
 
-@router.post("/chat", response_model=ChatResponse)
-async def chat(
+
+async def _start_turn(
+    session: AsyncSession,
     user_id: str,
-    session: SessionDep,
     request: ChatRequest,
-    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
-) -> ChatResponse:
-    """
-    Send a message to the AI Todo assistant.
-    
-    THIS IS A STATELESS ENDPOINT per AC-CHAT-002:
-    - Server holds NO state between requests
-    - Conversation history is fetched from database
-    - Messages are persisted to database
-    
-    Flow:
-    1. Receive message → 2. Load History from DB → 3. Run Agent → 
-    4. Store Response → 5. Return
-    """
+) -> tuple[Conversation, list[dict[str, str]]]:
+    """Get or create the conversation, load its history and store the user message."""
     # Step 1: Get or create conversation
     if request.conversation_id:
         result = await session.execute(
@@ -70,19 +75,9 @@ async def chat(
         session.add(conversation)
         await session.flush()
 
-    # Step 2: Fetch conversation history from database (STATELESS)
-    result = await session.execute(
-        select(Message)
-        .where(Message.conversation_id == conversation.id)
-        .order_by(Message.created_at)
-    )
-    history_messages = result.scalars().all()
-
-    # Build history array for AI agent
-    history = [
-        {"role": msg.role, "content": msg.content}
-        for msg in history_messages
-    ]
+    # Step 2: Fetch recent history (within the token budget) from database
+    history = await load_history(session, conversation)
+    record_history(history)
 
     # Step 3: Store user message in database
     user_message = Message(
@@ -94,23 +89,59 @@ async def chat(
     session.add(user_message)
     await session.flush()
 
+    return conversation, history
+
+
+async def _finish_turn(conversation_id: int, user_id: str, response_text: str) -> None:
+    """Store the assistant response in its own short transaction."""
+    with phase("persist"):
+        async with async_session_maker() as session:
+            session.add(Message(
+                conversation_id=conversation_id,
+                user_id=user_id,
+                role="assistant",
+                content=response_text,
+            ))
+            conversation = await session.get(Conversation, conversation_id)
+            conversation.updated_at = datetime.utcnow()
+            await session.commit()
+
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(
+    user_id: str,
+    session: SessionDep,
+    request: ChatRequest,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+) -> ChatResponse:
+    """
+    Send a message to the AI Todo assistant.
+    
+    THIS IS A STATELESS ENDPOINT per AC-CHAT-002:
+    - Server holds NO state between requests
+    - Conversation history is fetched from database
+    - Messages are persisted to database
+    
+    Flow:
+    1. Receive message → 2. Load History from DB → 3. Run Agent → 
+    4. Store Response → 5. Return
+    """
+    trace = start_trace()
+    with phase("history"):
+        conversation, history = await _start_turn(session, user_id, request)
+        # Commit releases the connection before the (slow) LLM call
+        await session.commit()
+
     # Step 4: Run AI agent with MCP tools
-    agent = TodoAgent(session, user_id)
+    agent = TodoAgent(user_id, http_client=get_llm_client())
     response_text, tool_calls = await agent.chat(request.message, history)
 
     # Step 5: Store assistant response in database
-    assistant_message = Message(
-        conversation_id=conversation.id,
-        user_id=user_id,
-        role="assistant",
-        content=response_text,
-    )
-    session.add(assistant_message)
-
-    # Update conversation timestamp
-    conversation.updated_at = datetime.utcnow()
-
-    await session.commit()
+    await _finish_turn(conversation.id, user_id, response_text)
+    trace.finish()
+    if settings.chat_server_timing:
+        response.headers["Server-Timing"] = trace.server_timing()
 
     # Step 6: Return response - Server holds NO state now
     return ChatResponse(
@@ -118,3 +149,52 @@ async def chat(
         response=response_text,
         tool_calls=tool_calls,
     )
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    user_id: str,
+    session: SessionDep,
+    request: ChatRequest,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+) -> StreamingResponse:
+    """
+    Send a message to the AI Todo assistant and stream the reply (SSE).
+
+    Same flow as POST /chat, but the reply is sent as server-sent events:
+    `start` (conversation_id), `token` (text deltas), `tool_call`,
+    `tool_result`, optional `error`, then `done` once the assistant
+    message has been stored.
+    """
+    trace = start_trace()
+    with phase("history"):
+        conversation, history = await _start_turn(session, user_id, request)
+        await session.commit()
+    conversation_id = conversation.id
+
+    async def events() -> AsyncIterator[str]:
+        # The body is sent from another task: record into the same trace
+        start_trace(trace)
+        yield _sse("start", {"conversation_id": conversation_id})
+
+        agent = TodoAgent(user_id, http_client=get_llm_client())
+        async for event in agent.chat_stream(request.message, history):
+            name = event.pop("event")
+            if name != "done":
+                yield _sse(name, event)
+                continue
+
+            # Step 5: Store assistant response once the stream has ended
+            await _finish_turn(conversation_id, user_id, event["response"])
+            trace.finish()
+            yield _sse("done", {"conversation_id": conversation_id, **event})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,74 @@
+"""Conversation history API routes.
+
+Reference: @specs/api/rest-endpoints.md
+Read-only views of stored chat history, paged with keyset cursors (see
+src/conversations.py).
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.auth import CurrentUser, verify_user_access
+from src.conversations import PageCursor, get_conversations, get_messages
+from src.database import get_session
+from src.models import Conversation, ConversationPage, MessagePage
+
+router = APIRouter(prefix="/api/{user_id}", tags=["Chat"])
+
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+
+def _decode_cursor(before: str | None) -> PageCursor | None:
+    if not before:
+        return None
+    try:
+        return PageCursor.decode(before)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid page cursor")
+
+
+@router.get("/conversations", response_model=ConversationPage)
+async def list_conversations(
+    user_id: str,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    before: str | None = Query(None, description="Cursor from a previous page"),
+    limit: int = Query(20, ge=1, le=100),
+) -> ConversationPage:
+    """List the user's conversations, most recently active first."""
+    return await get_conversations(
+        session, user_id, _decode_cursor(before), limit=limit
+    )
+
+
+@router.get(
+    "/conversations/{conversation_id}/messages",
+    response_model=MessagePage,
+)
+async def list_messages(
+    user_id: str,
+    conversation_id: int,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    before: str | None = Query(None, description="Cursor from a previous page"),
+    limit: int = Query(50, ge=1, le=200),
+) -> MessagePage:
+    """
+    Scroll back through a conversation's messages.
+
+    Without `before` this is the latest page; each page is oldest first.
+    """
+    cursor = _decode_cursor(before)
+    result = await session.execute(
+        select(Conversation.id).where(
+            Conversation.id == conversation_id,
+            Conversation.user_id == user_id,
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    return await get_messages(session, conversation_id, cursor, limit=limit)
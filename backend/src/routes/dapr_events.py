@@ -10,26 +10,43 @@ Implements ALL 5 Dapr Building Blocks:
 4. Service Invocation - Call other services via Dapr
 5. Secrets Management - Retrieve secrets via Dapr API
 
-Event handlers (POST /events/task-events)
+Event handlers (POST /events/task-events, bulk: /events/task-events/bulk)
 Audit logging
 Recurring task creation
 Jobs API handler (POST /jobs/callback)
 """
 
+import asyncio
+import json
 from datetime import datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Request
+from sqlalchemy import update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.config import get_settings
 from src.database import async_session_maker
-from src.events import event_publisher
 from src.models import Task, RecurrenceType
+from src.outbox import (
+    add_reminder_event,
+    add_task_event,
+    outbox_relay,
+    purge_outbox,
+)
 from src.dapr_client import service_client, secrets_client, jobs_client
+from src.conversations import compact_conversations, prune_conversations
+from src.event_dedup import event_dedup, purge_processed_events
+from src.sync import purge_tombstones
 
 router = APIRouter(tags=["Dapr Events"])
 
+settings = get_settings()
+
+# Bounds the database work of concurrently delivered bulk batches
+consumer_slots = asyncio.Semaphore(settings.event_consumer_concurrency)
+
 
 # ============================================================================
 # DAPR SUBSCRIPTION DECLARATION
@@ -38,18 +55,26 @@ router = APIRouter(tags=["Dapr Events"])
 
 
 @router.get("/dapr/subscribe")
-async def dapr_subscribe() -> list[dict[str, str]]:
+async def dapr_subscribe() -> list[dict[str, Any]]:
     """
     Declare subscriptions for Dapr.
     
     Dapr will call this endpoint on startup to discover
     which topics this service wants to subscribe to.
+
+    task-events are bulk subscribed: Dapr delivers up to
+    EVENT_BULK_MAX_MESSAGES events per request.
     """
     return [
         {
             "pubsubname": "kafka-pubsub",
             "topic": "task-events",
-            "route": "/events/task-events",
+            "route": "/events/task-events/bulk",
+            "bulkSubscribe": {
+                "enabled": True,
+                "maxMessagesCount": settings.event_bulk_max_messages,
+                "maxAwaitDurationMs": settings.event_bulk_max_await_ms,
+            },
         },
         {
             "pubsubname": "kafka-pubsub",
@@ -64,6 +89,35 @@ async def dapr_subscribe() -> list[dict[str, str]]:
 # ============================================================================
 
 
+def _event_data(event: Any) -> Any:
+    """Our event payload, unwrapped from a CloudEvent envelope if needed."""
+    if isinstance(event, str):
+        try:
+            event = json.loads(event)
+        except ValueError:
+            return None
+    if isinstance(event, dict) and "specversion" in event:
+        return _event_data(event.get("data"))
+    return event
+
+
+def _audit(event: dict[str, Any]) -> None:
+    """AUDIT LOG (Required by hackathon)."""
+    print(
+        f"[AUDIT] {event.get('timestamp')} | {event.get('event_type', 'Unknown')} | "
+        f"Task #{event.get('task_id')} | User: {event.get('user_id')} | "
+        f"Title: {event.get('title')}"
+    )
+
+
+def _spawns_next_task(event: dict[str, Any]) -> bool:
+    """RECURRING TASK SERVICE: a completed recurring task has a next instance."""
+    return (
+        event.get("event_type") == "TaskCompleted"
+        and event.get("recurrence", "none") != "none"
+    )
+
+
 @router.post("/events/task-events")
 async def handle_task_events(request: Request) -> dict[str, str]:
     """
@@ -72,44 +126,95 @@ async def handle_task_events(request: Request) -> dict[str, str]:
     This handler implements:
     1. AUDIT LOG - Logs all events (per hackathon requirement)
     2. RECURRING TASKS - Creates next instance on TaskCompleted
+
+    A redelivered event (same event_id) is acknowledged without effect.
     """
     try:
-        event = await request.json()
+        event = _event_data(await request.json())
     except Exception:
         return {"status": "ERROR", "message": "Invalid JSON"}
+    if not isinstance(event, dict):
+        return {"status": "ERROR", "message": "Invalid event"}
+    event_id = event.get("event_id")
+    if event_dedup.seen(event_id):
+        return {"status": "SUCCESS"}
 
-    event_type = event.get("event_type", "Unknown")
-    task_id = event.get("task_id")
-    user_id = event.get("user_id")
-    title = event.get("title")
-    recurrence = event.get("recurrence", "none")
-    timestamp = event.get("timestamp")
-
-    # ==========================================
-    # AUDIT LOG (Required by hackathon)
-    # ==========================================
-    print(f"[AUDIT] {timestamp} | {event_type} | Task #{task_id} | User: {user_id} | Title: {title}")
-
-    # ==========================================
-    # RECURRING TASK SERVICE
-    # ==========================================
-    if event_type == "TaskCompleted" and recurrence != "none":
-        await create_next_recurring_task(
-            user_id=user_id,
-            title=title,
-            recurrence=recurrence,
-        )
+    _audit(event)
+    if _spawns_next_task(event):
+        await create_next_recurring_tasks([event])
+    event_dedup.remember([event_id])
 
     return {"status": "SUCCESS"}
 
 
+@router.post("/events/task-events/bulk")
+async def handle_task_events_bulk(request: Request) -> dict[str, list[dict[str, str]]]:
+    """
+    Handle a bulk delivery from the task-events topic.
+
+    Same work as POST /events/task-events, with every recurring task of the
+    batch created in one transaction. Each entry gets a status: SUCCESS,
+    DROP (unreadable, never redelivered) or RETRY (its recurring task could
+    not be created; Dapr redelivers it). Duplicates (by event_id, also
+    within the batch) succeed without effect.
+    """
+    try:
+        body = await request.json()
+        entries = body["entries"]
+    except Exception:
+        return {"statuses": []}
+
+    statuses: dict[str, str] = {}
+    event_ids: dict[str, str | None] = {}
+    batch_ids: set[str] = set()
+    completions: list[tuple[str, dict[str, Any]]] = []
+    for entry in entries:
+        entry_id = str(entry.get("entryId"))
+        event = _event_data(entry.get("event"))
+        if not isinstance(event, dict):
+            statuses[entry_id] = "DROP"
+            continue
+        event_id = event.get("event_id")
+        if event_id in batch_ids or event_dedup.seen(event_id):
+            statuses[entry_id] = "SUCCESS"
+            continue
+        event_ids[entry_id] = event_id
+        if event_id is not None:
+            batch_ids.add(event_id)
+        _audit(event)
+        statuses[entry_id] = "SUCCESS"
+        if _spawns_next_task(event):
+            completions.append((entry_id, event))
+
+    if completions:
+        try:
+            await create_next_recurring_tasks([event for _, event in completions])
+        except Exception as e:
+            print(f"[RECURRING] Batch failed, {len(completions)} to retry: {e}")
+            for entry_id, _ in completions:
+                statuses[entry_id] = "RETRY"
+    event_dedup.remember(
+        event_id for entry_id, event_id in event_ids.items()
+        if statuses[entry_id] == "SUCCESS"
+    )
+
+    return {
+        "statuses": [
+            {"entryId": entry_id, "status": status}
+            for entry_id, status in statuses.items()
+        ]
+    }
+
+
 @router.post("/events/reminders")
 async def handle_reminder_events(request: Request) -> dict[str, str]:
-    """Handle events from reminders topic."""
+    """Handle events from reminders topic (a redelivery is not re-sent)."""
     try:
         event = await request.json()
     except Exception:
         return {"status": "ERROR", "message": "Invalid JSON"}
+    if event_dedup.seen(event.get("event_id")):
+        return {"status": "SUCCESS"}
 
     task_id = event.get("task_id")
     user_id = event.get("user_id")
@@ -118,6 +223,7 @@ async def handle_reminder_events(request: Request) -> dict[str, str]:
 
     # Log the reminder (in production, this would send push notification)
     print(f"[REMINDER] Task #{task_id} for {user_id}: '{title}' is due at {due_at}")
+    event_dedup.remember([event.get("event_id")])
 
     return {"status": "SUCCESS"}
 
@@ -136,38 +242,110 @@ async def reminder_cron_handler() -> dict[str, str]:
     Per specs/api/async-events.md:
     - Queries tasks where reminder_at <= now()
     - Publishes ReminderDue events
+
+    Safe to run on every replica at once: see process_due_reminders.
     """
-    now = datetime.utcnow()
-    reminder_count = 0
+    reminder_count, more = await process_due_reminders(
+        datetime.utcnow(),
+        chunk_size=settings.reminder_chunk_size,
+        max_reminders=settings.reminder_max_per_run,
+    )
 
-    async with async_session_maker() as session:
-        # Find tasks with reminders due
-        result = await session.execute(
-            select(Task).where(
-                Task.reminder_at <= now,
-                Task.completed == False,  # noqa: E712
+    print(f"[CRON] Processed {reminder_count} reminder(s)")
+    if more:
+        print("[CRON] More reminders due; left for the next run")
+    return {"status": "SUCCESS", "reminders_sent": str(reminder_count)}
+
+
+async def process_due_reminders(
+    now: datetime,
+    *,
+    chunk_size: int,
+    max_reminders: int,
+) -> tuple[int, bool]:
+    """
+    Emit ReminderDue for tasks whose reminder is due, oldest first.
+
+    Each chunk is one transaction: the due rows are claimed with FOR UPDATE
+    SKIP LOCKED (replicas running the cron at once take different rows),
+    their reminders cleared, and the events written to the outbox, which
+    bulk publishes them. Returns (reminders emitted, whether the cap left
+    some due).
+    """
+    emitted = 0
+    while emitted < max_reminders:
+        limit = min(chunk_size, max_reminders - emitted)
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(Task.id, Task.user_id, Task.title, Task.reminder_at)
+                .where(
+                    Task.reminder_at <= now,
+                    Task.completed == False,  # noqa: E712
+                )
+                .order_by(Task.reminder_at, Task.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
             )
-        )
-        tasks_due = result.scalars().all()
-
-        for task in tasks_due:
-            # Publish reminder event
-            await event_publisher.publish_reminder(
-                task_id=task.id,
-                user_id=task.user_id,
-                title=task.title,
-                due_at=task.reminder_at,
+            due = result.all()
+            if not due:
+                return emitted, False
+
+            for task_id, user_id, title, reminder_at in due:
+                add_reminder_event(session, task_id, user_id, title, reminder_at)
+            # Clear the reminders (so they don't fire again); delta sync
+            # reports the cleared reminder as an update
+            await session.execute(
+                update(Task)
+                .where(Task.id.in_([row.id for row in due]))
+                .values(reminder_at=None, updated_at=now)
             )
-            reminder_count += 1
+            await session.commit()
 
-            # Clear the reminder (so it doesn't fire again)
-            task.reminder_at = None
+        outbox_relay.notify()
+        emitted += len(due)
+        if len(due) < limit:
+            return emitted, False
+    return emitted, True
 
-        if tasks_due:
-            await session.commit()
 
-    print(f"[CRON] Processed {reminder_count} reminder(s)")
-    return {"status": "SUCCESS", "reminders_sent": str(reminder_count)}
+@router.post("/maintenance-cron")
+async def maintenance_cron_handler() -> dict[str, str]:
+    """
+    Cron binding handler - triggered hourly by Dapr.
+
+    Removes delta-sync tombstones older than the retention window, deletes
+    long-idle conversations and compacts summarized ones, and deletes old
+    sent or parked outbox events.
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=settings.tombstone_retention_days)
+
+    async with async_session_maker() as session:
+        purged = await purge_tombstones(session, cutoff)
+        pruned = await prune_conversations(
+            session, now - timedelta(days=settings.conversation_retention_days)
+        )
+        compacted = await compact_conversations(
+            session, now - timedelta(days=settings.conversation_compact_days)
+        )
+        outbox_purged = await purge_outbox(
+            session, now - timedelta(days=settings.outbox_retention_days)
+        )
+        dedup_purged = await purge_processed_events(
+            session, now - timedelta(days=settings.event_dedup_retention_days)
+        )
+
+    print(f"[CRON] Purged {purged} tombstone(s)")
+    print(f"[CRON] Pruned {pruned} conversation(s), compacted {compacted} message(s)")
+    print(f"[CRON] Purged {outbox_purged} outbox event(s), {dedup_purged} event id(s)")
+    return {
+        "status": "SUCCESS",
+        "tombstones_purged": str(purged),
+        "conversations_pruned": str(pruned),
+        "messages_compacted": str(compacted),
+        "outbox_purged": str(outbox_purged),
+        "event_ids_purged": str(dedup_purged),
+    }
 
 
 # ============================================================================
@@ -176,21 +354,14 @@ async def reminder_cron_handler() -> dict[str, str]:
 # ============================================================================
 
 
-async def create_next_recurring_task(
+def _next_instance(
     user_id: str,
     title: str,
     recurrence: str,
-) -> None:
-    """
-    Create the next instance of a recurring task.
-    
-    Per specs/features/event-driven.md:
-    When TaskCompleted event is received for a recurring task,
-    automatically create the next task instance.
-    """
+    now: datetime,
+) -> Task | None:
+    """The next instance of a recurring task, or None if not recurring."""
     # Calculate next due date based on recurrence
-    now = datetime.utcnow()
-    
     if recurrence == "daily":
         next_due = now + timedelta(days=1)
     elif recurrence == "weekly":
@@ -198,29 +369,59 @@ async def create_next_recurring_task(
     elif recurrence == "monthly":
         next_due = now + timedelta(days=30)
     else:
-        return  # Unknown recurrence, skip
+        return None  # Unknown recurrence, skip
 
-    async with async_session_maker() as session:
-        new_task = Task(
-            user_id=user_id,
-            title=title,
-            description=f"Recurring from: {now.date()}",
-            completed=False,
-            recurrence=RecurrenceType(recurrence),
-            due_date=next_due,
+    return Task(
+        user_id=user_id,
+        title=title,
+        description=f"Recurring from: {now.date()}",
+        completed=False,
+        recurrence=RecurrenceType(recurrence),
+        due_date=next_due,
+    )
+
+
+async def create_next_recurring_tasks(completed: list[dict[str, Any]]) -> list[Task]:
+    """
+    Create the next instance of each completed recurring task.
+
+    Per specs/features/event-driven.md:
+    When TaskCompleted event is received for a recurring task,
+    automatically create the next task instance.
+
+    All instances (and their TaskCreated outbox events) are written in
+    one transaction, with the ids of the events, so an event already
+    processed (on any replica) creates nothing.
+    """
+    now = datetime.utcnow()
+    async with consumer_slots, async_session_maker() as session:
+        claimed = await event_dedup.claim(
+            session, [event.get("event_id") for event in completed]
         )
-        session.add(new_task)
+        new_tasks = [
+            task for event, fresh in zip(completed, claimed)
+            if fresh and (task := _next_instance(
+                event.get("user_id"), event.get("title"), event.get("recurrence"), now
+            )) is not None
+        ]
+        if not new_tasks:
+            await session.commit()  # Claims only (unknown recurrence)
+            return []
+
+        session.add_all(new_tasks)
+        await session.flush()
+        # Events for the new tasks, committed with them
+        for task in new_tasks:
+            add_task_event(session, "TaskCreated", task)
         await session.commit()
-        await session.refresh(new_task)
-
-        print(f"[RECURRING] Created next task #{new_task.id}: '{title}' due {next_due.date()}")
+    outbox_relay.notify()
 
-        # Publish event for the new task
-        await event_publisher.publish_task_created(
-            task_id=new_task.id,
-            user_id=user_id,
-            title=title,
+    for task in new_tasks:
+        print(
+            f"[RECURRING] Created next task #{task.id}: "
+            f"'{task.title}' due {task.due_date.date()}"
         )
+    return new_tasks
 
 
 # ============================================================================
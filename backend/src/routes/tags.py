@@ -0,0 +1,31 @@
+"""Tag API routes.
+
+Reference: @specs/api/rest-endpoints.md
+Tags are shared; usage counts are scoped to the authenticated user's tasks.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import crud
+from src.auth import CurrentUser, verify_user_access
+from src.database import get_session
+from src.models import TagUsage
+
+router = APIRouter(prefix="/api/{user_id}", tags=["Tags"])
+
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+
+@router.get("/tags", response_model=list[TagUsage])
+async def list_tags(
+    user_id: str,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+) -> list[TagUsage]:
+    """List tags on the user's tasks with usage counts, most used first."""
+    return await crud.get_user_tags(session, user_id, skip=skip, limit=limit)
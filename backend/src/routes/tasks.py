@@ -7,61 +7,120 @@ Reference: @specs/features/task-crud.md
 User isolation enforced on all operations.
 
 Reference: @specs/features/event-driven.md (Phase V)
-Every Create, Update, Delete publishes event via Dapr.
+Every Create, Update, Delete, Complete emits an event via the outbox
+(see src/outbox.py).
 """
 
+import json
+from datetime import datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src import crud
 from src.auth import CurrentUser, get_current_user, verify_user_access
-from src.database import get_session
-from src.events import event_publisher  # Phase V: Dapr events
+from src.bulk_import import ImportFormat, import_tasks
+from src.config import get_settings
+from src.database import async_session_maker, get_session
 from src.models import (
+    AgendaBucket,
+    AgendaResponse,
     Priority,
+    TagMatchMode,
     Task,
+    TaskChanges,
     TaskCreate,
+    TaskImportResult,
     TaskRead,
+    TaskSortField,
     TaskUpdate,
 )
+from src.singleflight import read_flight
+from src.sync import ChangeCursor, get_task_changes
 
 router = APIRouter(prefix="/api/{user_id}", tags=["Tasks"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+settings = get_settings()
+
+_task_list_adapter = TypeAdapter(list[TaskRead])
+
 
 @router.get("/tasks", response_model=list[TaskRead])
 async def list_tasks(
     user_id: str,
-    session: SessionDep,
     current_user: Annotated[CurrentUser, Depends(verify_user_access)],
     completed: bool | None = Query(None, description="Filter by completion status"),
     priority: Priority | None = Query(None, description="Filter by priority"),
     search: str | None = Query(None, description="Search in title/description"),
-    sort_by: str = Query("created_at", description="Sort field"),
+    tags: str | None = Query(None, description="Comma-separated tag names"),
+    tag_mode: TagMatchMode = Query("any", description="Match all or any of tags"),
+    sort_by: TaskSortField = Query("created_at", description="Sort field"),
     sort_desc: bool = Query(True, description="Sort descending"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> list[Task]:
+) -> Response:
     """
     List all tasks for the authenticated user.
     
     Per AC-002.1: Display all tasks belonging to current user.
     Per AC-002.4: Tasks are sorted by creation date (newest first).
+
+    Identical concurrent requests share one query (see src/singleflight.py).
     """
-    return await crud.get_tasks(
+    async def query() -> bytes:
+        async with async_session_maker() as session:
+            tasks = await _filter_tasks(
+                session,
+                user_id,
+                completed=completed,
+                priority=priority,
+                search=search,
+                tags=tags,
+                tag_mode=tag_mode,
+                sort_by=sort_by,
+                sort_desc=sort_desc,
+                skip=skip,
+                limit=limit,
+            )
+        return _task_list_adapter.dump_json(tasks)
+
+    key = (
+        "list_tasks", user_id, completed, priority, search, tags, tag_mode,
+        sort_by, sort_desc, skip, limit,
+    )
+    body = await read_flight.do(key, query)
+    return Response(content=body, media_type="application/json")
+
+
+async def _filter_tasks(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    tags: str | None,
+    tag_mode: TagMatchMode,
+    **filters,
+) -> list[TaskRead]:
+    tag_ids = None
+    if tags:
+        # An unknown name can't match any task
+        names = {name.strip() for name in tags.split(",") if name.strip()}
+        ids_by_name = await crud.get_tag_ids_by_name(session, names)
+        tag_ids = [ids_by_name[name] for name in names if name in ids_by_name]
+        if not tag_ids or (tag_mode == "all" and len(tag_ids) < len(names)):
+            return []
+
+    tasks = await crud.get_tasks(
         session=session,
         user_id=user_id,
-        completed=completed,
-        priority=priority,
-        search=search,
-        sort_by=sort_by,
-        sort_desc=sort_desc,
-        skip=skip,
-        limit=limit,
+        tag_ids=tag_ids,
+        tag_mode=tag_mode,
+        **filters,
     )
+    return [TaskRead.model_validate(t) for t in tasks]
 
 
 @router.post("/tasks", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
@@ -79,18 +138,116 @@ async def create_task(
     Per AC-001.5: Task is associated with the logged-in user.
     Per AC-001.6: System confirms successful creation.
     
-    Phase V: Publishes TaskCreated event via Dapr.
+    Phase V: Emits a TaskCreated event via the outbox.
     """
-    task = await crud.create_task(session, task_in, user_id=user_id)
-    
-    # Phase V: Publish event via Dapr sidecar
-    await event_publisher.publish_task_created(
-        task_id=task.id,
-        user_id=user_id,
-        title=task.title,
+    return await crud.create_task(session, task_in, user_id=user_id)
+
+
+@router.post("/tasks/import", response_model=TaskImportResult)
+async def import_tasks_endpoint(
+    user_id: str,
+    request: Request,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    format: ImportFormat | None = Query(
+        None, description="ndjson or csv (default: from Content-Type)"
+    ),
+) -> TaskImportResult:
+    """
+    Bulk import tasks from an NDJSON or CSV request body.
+
+    The body is parsed as it streams in and every row is validated like
+    POST /tasks. Invalid rows are reported by line number and skipped.
+
+    Phase V: Emits a single TasksImported event via the outbox instead of
+    one per task.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "csv" if "csv" in content_type else "ndjson"
+
+    try:
+        result = await import_tasks(session, user_id, request.stream(), format)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Body must be UTF-8")
+
+    return result
+
+
+@router.get("/tasks/agenda", response_model=AgendaResponse)
+async def get_agenda(
+    user_id: str,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    days: int = Query(7, ge=1, le=31, description="Upcoming window after today"),
+    tz_offset: int = Query(
+        0, ge=-840, le=840, description="Client UTC offset in minutes"
+    ),
+    limit: int = Query(50, ge=1, le=100, description="Max tasks per bucket"),
+    counts: bool = Query(False, description="Include total count per bucket"),
+) -> AgendaResponse:
+    """
+    Pending tasks that are overdue, due today, or due in the next `days`.
+
+    "Today" ends at the client's local midnight (from tz_offset).
+    """
+    now = datetime.utcnow()
+    offset = timedelta(minutes=tz_offset)
+    local_midnight = (now + offset).replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = local_midnight + timedelta(days=1) - offset
+    window_end = today_end + timedelta(days=days)
+
+    buckets = await crud.get_agenda(
+        session,
+        user_id,
+        now=now,
+        today_end=today_end,
+        window_end=window_end,
+        limit=limit,
+        include_counts=counts,
+    )
+    return AgendaResponse(
+        now=now,
+        today_end=today_end,
+        window_end=window_end,
+        **{
+            name: AgendaBucket(
+                tasks=[TaskRead.model_validate(t) for t in tasks],
+                count=count,
+            )
+            for name, (tasks, count) in buckets.items()
+        },
+    )
+
+
+@router.get("/tasks/changes", response_model=TaskChanges)
+async def get_changes(
+    user_id: str,
+    session: SessionDep,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+    since: str | None = Query(None, description="Cursor from a previous response"),
+    limit: int = Query(500, ge=1, le=1000),
+) -> TaskChanges:
+    """
+    Delta sync: tasks created, updated or deleted after `since`.
+
+    Omit `since` for the initial full sync. Keep paging while `has_more`.
+    """
+    cursor = None
+    if since:
+        try:
+            cursor = ChangeCursor.decode(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid sync cursor")
+
+    return await get_task_changes(
+        session,
+        user_id,
+        cursor,
+        limit=limit,
+        retention=timedelta(days=settings.tombstone_retention_days),
+        safety_window=timedelta(seconds=settings.sync_safety_window),
     )
-    
-    return task
 
 
 @router.get("/tasks/{task_id}", response_model=TaskRead)
@@ -124,19 +281,11 @@ async def update_task(
     Per AC-003.4: Cannot update another user's task.
     Per AC-003.5: System confirms successful update.
     
-    Phase V: Publishes TaskUpdated event via Dapr.
+    Phase V: Emits a TaskUpdated event via the outbox.
     """
     task = await crud.update_task(session, task_id, task_in, user_id=user_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Phase V: Publish event via Dapr sidecar
-    await event_publisher.publish_task_updated(
-        task_id=task.id,
-        user_id=user_id,
-        title=task.title,
-    )
-    
     return task
 
 
@@ -155,23 +304,10 @@ async def delete_task(
     Per AC-004.3: Cannot delete another user's task.
     Per AC-004.4: System confirms successful deletion.
     
-    Phase V: Publishes TaskDeleted event via Dapr.
+    Phase V: Emits a TaskDeleted event via the outbox.
     """
-    # Get task title before deletion for event
-    task = await crud.get_task(session, task_id, user_id=user_id)
-    if not task:
+    if not await crud.delete_task(session, task_id, user_id=user_id):
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    title = task.title
-    success = await crud.delete_task(session, task_id, user_id=user_id)
-    
-    if success:
-        # Phase V: Publish event via Dapr sidecar
-        await event_publisher.publish_task_deleted(
-            task_id=task_id,
-            user_id=user_id,
-            title=title,
-        )
 
 
 @router.patch("/tasks/{task_id}/complete", response_model=TaskRead)
@@ -188,6 +324,9 @@ async def toggle_task_complete(
     Per AC-005.3: Cannot toggle task that doesn't exist.
     Per AC-005.4: Cannot toggle another user's task.
     Per AC-005.5: System confirms status change.
+
+    Phase V: Emits a TaskCompleted (or, when reopened, TaskUpdated) event
+    via the outbox.
     """
     task = await crud.toggle_task_complete(session, task_id, user_id=user_id)
     if not task:
@@ -195,11 +334,20 @@ async def toggle_task_complete(
     return task
 
 
-@router.get("/stats")
+@router.get("/stats", response_model=dict[str, int])
 async def get_stats(
     user_id: str,
-    session: SessionDep,
     current_user: Annotated[CurrentUser, Depends(verify_user_access)],
-) -> dict[str, int]:
-    """Get task statistics for the authenticated user."""
-    return await crud.get_task_stats(session, user_id=user_id)
+) -> Response:
+    """
+    Get task statistics for the authenticated user.
+
+    Identical concurrent requests share one query (see src/singleflight.py).
+    """
+    async def query() -> bytes:
+        async with async_session_maker() as session:
+            stats = await crud.get_task_stats(session, user_id=user_id)
+        return json.dumps(stats).encode()
+
+    body = await read_flight.do(("get_stats", user_id), query)
+    return Response(content=body, media_type="application/json")
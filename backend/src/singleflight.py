@@ -0,0 +1,54 @@
+"""Request coalescing (single-flight) for identical concurrent reads.
+
+When several requests for the same key arrive while one is already being
+served, they wait for that one call and share its result instead of each
+querying the database. Nothing is cached: once the call finishes the next
+request starts a fresh one.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+from src.metrics import Counter
+
+singleflight_requests = Counter(
+    "singleflight_requests_total",
+    "Coalesced read requests by role (leader ran the call, follower shared it)",
+)
+
+
+class SingleFlight[T]:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already in flight for key.
+
+        The call runs as its own task, so a leader whose client disconnects
+        does not cancel it for the followers.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            singleflight_requests.inc(flight=self.name, role="follower")
+            return await asyncio.shield(task)
+
+        singleflight_requests.inc(flight=self.name, role="leader")
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def hit_ratio(self) -> float:
+        """Fraction of requests that shared another request's call."""
+        followers = singleflight_requests.value(flight=self.name, role="follower")
+        leaders = singleflight_requests.value(flight=self.name, role="leader")
+        total = followers + leaders
+        return followers / total if total else 0.0
+
+
+# Serialized JSON bodies of read endpoints (see routes/tasks.py)
+read_flight: SingleFlight[bytes] = SingleFlight("reads")
@@ -0,0 +1,224 @@
+"""Delta sync for offline clients.
+
+Reference: @specs/api/rest-endpoints.md
+Changes are read as one stream ordered by (timestamp, kind, id): tasks by
+updated_at and deletes by tombstone deleted_at, both served from
+(user_id, timestamp) indexes. Paging continues from the position of the
+last item returned, so it never skips or repeats rows with equal
+timestamps.
+
+Timestamps are taken when a row is written, not when it commits, and by
+each replica's own clock. A change can therefore become visible after a
+client has already read past its timestamp. The cursor also carries a
+settled position: everything at or before it was visible when read.
+Changes between it and the last item returned are re-read once the
+client has caught up, and the settled position never moves past
+now - SYNC_SAFETY_WINDOW. The window must exceed the longest task write
+transaction plus the clock skew between replicas. Re-read changes may
+repeat ones the client already has; applying a change is an upsert or a
+delete, so that is harmless.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models import Task, TaskChanges, TaskRead, TaskTombstone
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Stream order between a task change and a delete with the same timestamp
+_KIND_TASK = 0
+_KIND_TOMBSTONE = 1
+
+
+@dataclass(frozen=True, order=True)
+class StreamPosition:
+    """Position of one change in a user's change stream."""
+    at: datetime
+    kind: int
+    id: int
+
+
+@dataclass(frozen=True)
+class ChangeCursor:
+    """Where a client is in its change stream.
+
+    `position` is the last change returned; `settled` is at or before it,
+    and changes after `settled` may still be missing.
+    """
+    position: StreamPosition
+    settled: StreamPosition
+
+    def encode(self) -> str:
+        return ".".join(
+            f"{(p.at - _EPOCH) // _MICROSECOND}.{p.kind}.{p.id}"
+            for p in (self.position, self.settled)
+        )
+
+    @classmethod
+    def decode(cls, value: str) -> "ChangeCursor":
+        """Parse a cursor; raises ValueError if malformed."""
+        parts = [int(part) for part in value.split(".")]
+        if len(parts) != 6:
+            raise ValueError("Invalid cursor length")
+        positions = []
+        for micros, kind, id in (parts[:3], parts[3:]):
+            if kind not in (_KIND_TASK, _KIND_TOMBSTONE):
+                raise ValueError(f"Invalid cursor kind: {kind}")
+            try:
+                at = _EPOCH + micros * _MICROSECOND
+            except OverflowError:
+                raise ValueError(f"Invalid cursor timestamp: {micros}") from None
+            positions.append(StreamPosition(at, kind, id))
+        position, settled = positions
+        if settled > position:
+            raise ValueError("Settled position is after the cursor")
+        return cls(position, settled)
+
+
+def _after(at: Any, id: Any, kind: int, position: StreamPosition) -> Any:
+    """SQL condition: rows of `kind` come after `position` in the stream."""
+    if kind < position.kind:
+        return at > position.at
+    if kind > position.kind:
+        return at >= position.at
+    return or_(at > position.at, and_(at == position.at, id > position.id))
+
+
+async def _read_stream(
+    session: AsyncSession,
+    user_id: str,
+    after: StreamPosition | None,
+    until: StreamPosition | None,
+    limit: int,
+) -> list[tuple[StreamPosition, Task | TaskTombstone]]:
+    """Up to `limit` changes in (after, until], in stream order.
+
+    Without `after` this is the current tasks only: a full listing has
+    nothing to delete.
+    """
+    task_query = select(Task).where(Task.user_id == user_id)
+    tombstone_query = select(TaskTombstone).where(TaskTombstone.user_id == user_id)
+    if after is not None:
+        task_query = task_query.where(
+            _after(Task.updated_at, Task.id, _KIND_TASK, after)
+        )
+        tombstone_query = tombstone_query.where(_after(
+            TaskTombstone.deleted_at, TaskTombstone.id, _KIND_TOMBSTONE, after
+        ))
+    if until is not None:
+        task_query = task_query.where(
+            ~_after(Task.updated_at, Task.id, _KIND_TASK, until)
+        )
+        tombstone_query = tombstone_query.where(~_after(
+            TaskTombstone.deleted_at, TaskTombstone.id, _KIND_TOMBSTONE, until
+        ))
+
+    result = await session.execute(
+        task_query.order_by(Task.updated_at, Task.id).limit(limit)
+    )
+    stream: list[tuple[StreamPosition, Task | TaskTombstone]] = [
+        (StreamPosition(t.updated_at, _KIND_TASK, t.id), t)
+        for t in result.scalars().all()
+    ]
+    if after is not None:
+        result = await session.execute(
+            tombstone_query
+            .order_by(TaskTombstone.deleted_at, TaskTombstone.id)
+            .limit(limit)
+        )
+        stream += [
+            (StreamPosition(d.deleted_at, _KIND_TOMBSTONE, d.id), d)
+            for d in result.scalars().all()
+        ]
+    stream.sort(key=lambda item: item[0])
+    return stream[:limit]
+
+
+def _settle(
+    settled: StreamPosition | None,
+    position: StreamPosition | None,
+    horizon: StreamPosition,
+) -> StreamPosition | None:
+    """Settled position once everything up to `position` has been read.
+
+    Changes older than the horizon had committed before this read, so
+    were visible to it; newer ones may still show up behind the cursor.
+    """
+    if position is None:
+        return settled
+    candidate = min(position, horizon)
+    return candidate if settled is None else max(settled, candidate)
+
+
+async def get_task_changes(
+    session: AsyncSession,
+    user_id: str,
+    since: ChangeCursor | None,
+    *,
+    limit: int,
+    retention: timedelta,
+    safety_window: timedelta,
+    now: datetime | None = None,
+) -> TaskChanges:
+    """
+    Get tasks created/updated and deleted after `since` for a user.
+
+    Without a cursor (or with one older than the tombstone retention) this
+    is a full listing of current tasks with no deletes.
+    """
+    now = now or datetime.utcnow()
+    reset = since is not None and since.settled.at < now - retention
+    if reset:
+        since = None
+    horizon = StreamPosition(now - safety_window, _KIND_TASK, 0)
+
+    after = since.position if since is not None else None
+    stream = await _read_stream(session, user_id, after, None, limit + 1)
+    has_more = len(stream) > limit
+    page = stream[:limit]
+    position = page[-1][0] if page else after
+
+    settled = since.settled if since is not None else None
+    if settled == after:
+        settled = _settle(settled, position, horizon)
+    elif not has_more:
+        # Caught up: re-read what may have committed late behind the cursor
+        room = limit - len(page)
+        recheck = await _read_stream(session, user_id, settled, after, room + 1)
+        if len(recheck) > room:
+            recheck = recheck[:room]
+            has_more = True
+            if recheck:
+                settled = recheck[-1][0]
+        else:
+            settled = _settle(settled, position, horizon)
+        page += recheck
+
+    changes = TaskChanges(has_more=has_more, reset=reset)
+    for _, row in page:
+        if isinstance(row, Task):
+            changes.changed.append(TaskRead.model_validate(row))
+        else:
+            changes.deleted.append(row.task_id)
+
+    if position is None:
+        # Nothing yet: start from the horizon so late first changes show up
+        position = settled = horizon
+    changes.cursor = ChangeCursor(position, settled).encode()
+    return changes
+
+
+async def purge_tombstones(session: AsyncSession, older_than: datetime) -> int:
+    """Delete tombstones older than the retention cutoff."""
+    result = await session.execute(
+        delete(TaskTombstone).where(TaskTombstone.deleted_at < older_than)
+    )
+    await session.commit()
+    return result.rowcount or 0
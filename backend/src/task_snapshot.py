@@ -0,0 +1,124 @@
+"""Pending-task snapshot for the chat agent's context.
+
+Reference: @specs/features/chatbot.md
+Without it, a question about the user's tasks costs two completions: one
+that asks for list_tasks and one that answers from the result. With
+CHAT_TASK_SNAPSHOT on, a compact listing of pending tasks (overdue first,
+then by due date) is sent with the system prompt, so the model can answer
+in a single completion. The snapshot is capped at CHAT_SNAPSHOT_MAX_TOKENS
+and cached per task state as read from the database, so a write on any
+replica invalidates it.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import case, func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import crud
+from src.cache import LRUCache
+from src.config import get_settings
+from src.history import estimate_tokens
+from src.mcp_tools import LIST_TITLE_CHARS
+from src.models import Task
+
+settings = get_settings()
+
+# Never read more rows than this, whatever the token cap
+SNAPSHOT_MAX_ROWS = 50
+
+SNAPSHOT_PROMPT = (
+    "The user's pending tasks as of {now} UTC: {total} pending, {overdue} "
+    "overdue{shown}. One per line as id | title | priority | due.\n"
+    "{rows}\n"
+    "Answer questions about pending tasks from this list without calling "
+    "list_tasks. Call list_tasks for completed tasks or for pending tasks "
+    "not shown here."
+)
+
+# (user_id, task state) -> snapshot text. The TTL bounds how stale the
+# "overdue" marks get while the tasks themselves don't change.
+task_snapshot_cache: LRUCache[tuple[str, str], str] = LRUCache(maxsize=2048, ttl=60)
+
+
+def _row(
+    task_id: int,
+    title: str,
+    priority: str,
+    due: datetime | None,
+    now: datetime,
+) -> str:
+    if len(title) > LIST_TITLE_CHARS:
+        title = title[:LIST_TITLE_CHARS - 1] + "…"
+    due_text = "-"
+    if due is not None:
+        due_text = due.isoformat(timespec="minutes")
+        if due < now:
+            due_text += " (overdue)"
+    return f"{task_id} | {title} | {priority} | {due_text}"
+
+
+async def build_snapshot(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    max_tokens: int,
+    now: datetime | None = None,
+) -> str:
+    """Render the user's pending tasks, dropping rows beyond `max_tokens`."""
+    now = now or datetime.utcnow()
+    pending = [Task.user_id == user_id, Task.completed == False]  # noqa: E712
+
+    total, overdue = (await session.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((Task.due_date < now, 1), else_=0)), 0),
+        ).select_from(Task).where(*pending)
+    )).one()
+
+    result = await session.execute(
+        select(Task.id, Task.title, Task.priority, Task.due_date)
+        .where(*pending)
+        # Overdue and soonest due first; undated last, newest first
+        .order_by(Task.due_date.is_(None), Task.due_date, Task.id.desc())
+        .limit(SNAPSHOT_MAX_ROWS)
+    )
+    rows = []
+    used = 0
+    for task_id, title, priority, due_date in result.all():
+        label = priority.value if priority else "medium"
+        line = _row(task_id, title, label, due_date, now)
+        cost = estimate_tokens(line)
+        if used + cost > max_tokens:
+            break
+        used += cost
+        rows.append(line)
+
+    shown = f"; the first {len(rows)} are shown" if len(rows) < total else ""
+    return SNAPSHOT_PROMPT.format(
+        now=now.isoformat(timespec="minutes"),
+        total=total,
+        overdue=overdue,
+        shown=shown,
+        rows="\n".join(rows) or "(none)",
+    )
+
+
+async def get_snapshot(
+    session: AsyncSession,
+    user_id: str,
+    *,
+    max_tokens: int | None = None,
+) -> str:
+    """Cached snapshot for the user's current task state."""
+    key = (user_id, await crud.get_task_state(session, user_id))
+    snapshot = task_snapshot_cache.get(key)
+    if snapshot is None:
+        snapshot = await build_snapshot(
+            session,
+            user_id,
+            max_tokens=max_tokens or settings.chat_snapshot_max_tokens,
+        )
+        task_snapshot_cache.set(key, snapshot)
+    return snapshot
@@ -0,0 +1,162 @@
+"""Shared fixtures for backend API tests.
+
+Tests run against a throwaway SQLite database. The Dapr sidecar is not
+needed: publishing fails soft when the sidecar is unavailable.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="todo-backend-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/test.db")
+os.environ.setdefault("BETTER_AUTH_SECRET", "test-secret")
+# Tests that need rate limiting build their own LLMScheduler
+os.environ.setdefault("LLM_TOKENS_PER_MINUTE", "100000000")
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+import pytest  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src import http_clients  # noqa: E402
+from src.cache import chat_reply_cache, user_tag_cache  # noqa: E402
+from src.database import engine  # noqa: E402
+from src.event_dedup import event_dedup  # noqa: E402
+from src.main import app  # noqa: E402
+from src.task_snapshot import task_snapshot_cache  # noqa: E402
+
+USER_ID = "user-1"
+
+
+def auth_headers(user_id: str = USER_ID) -> dict[str, str]:
+    """Build a Better Auth style bearer token for user_id."""
+    token = jwt.encode(
+        {"sub": user_id, "exp": int(time.time()) + 3600},
+        os.environ["BETTER_AUTH_SECRET"],
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def db():
+    """Fresh schema and empty in-process caches for every test."""
+    user_tag_cache.clear()
+    chat_reply_cache.clear()
+    task_snapshot_cache.clear()
+    event_dedup.recent.clear()
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(db):
+    """HTTP client for the app, authenticated as USER_ID."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers=auth_headers(),
+    ) as c:
+        yield c
+
+
+class ScriptedLLM:
+    """Stand-in for the chat completions API that replies from a script.
+
+    Each request pops the next reply from `replies`: either text, or a list
+    of (tool name, args) pairs answered as native tool calls. Requests are
+    recorded. Streamed replies are split into word and argument chunks,
+    with token usage in a final chunk.
+    An httpx.Response in `replies` is returned as is (e.g. a 429). While
+    `gate` is set to an unset event, replies wait for it, like a slow model.
+    """
+
+    def __init__(self) -> None:
+        self.replies: list[str | list[tuple[str, dict]] | httpx.Response] = []
+        self.requests: list[dict] = []
+        self.gate: asyncio.Event | None = None
+
+    @staticmethod
+    def _tool_calls(calls: list[tuple[str, dict]]) -> list[dict]:
+        return [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(args)},
+            }
+            for i, (name, args) in enumerate(calls)
+        ]
+
+    def _chunks(self, reply: str | list[tuple[str, dict]]) -> list[dict]:
+        if isinstance(reply, str):
+            return [{"content": word + " "} for word in reply.split(" ")]
+        chunks = []
+        for i, call in enumerate(self._tool_calls(reply)):
+            name, arguments = call["function"]["name"], call["function"]["arguments"]
+            half = len(arguments) // 2
+            chunks.append({"tool_calls": [{
+                "index": i,
+                "id": call["id"],
+                "function": {"name": name, "arguments": arguments[:half]},
+            }]})
+            chunks.append({"tool_calls": [{
+                "index": i, "function": {"arguments": arguments[half:]},
+            }]})
+        return chunks
+
+    @staticmethod
+    def _usage(body: dict, reply: str | list[tuple[str, dict]]) -> dict:
+        prompt = len(json.dumps(body["messages"])) // 4
+        completion = len(json.dumps(reply)) // 4
+        return {
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "total_tokens": prompt + completion,
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if self.gate is not None:
+            await self.gate.wait()
+        reply = self.replies.pop(0)
+        if isinstance(reply, httpx.Response):
+            return reply
+        if not body.get("stream"):
+            if isinstance(reply, str):
+                message = {"role": "assistant", "content": reply}
+            else:
+                message = {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": self._tool_calls(reply),
+                }
+            return httpx.Response(200, json={
+                "choices": [{"message": message}],
+                "usage": self._usage(body, reply),
+            })
+        chunks = [{"choices": [{"delta": delta}]} for delta in self._chunks(reply)]
+        chunks.append({"choices": [], "usage": self._usage(body, reply)})
+        sse = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks)
+        return httpx.Response(
+            200,
+            content=(sse + "data: [DONE]\n\n").encode(),
+            headers={"Content-Type": "text/event-stream"},
+        )
+
+
+@pytest.fixture
+async def llm(monkeypatch):
+    """Route the agent's LLM calls to a ScriptedLLM."""
+    scripted = ScriptedLLM()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(scripted.handler))
+    monkeypatch.setattr(http_clients, "_llm_client", client)
+    yield scripted
+    await client.aclose()
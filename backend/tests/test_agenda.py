@@ -0,0 +1,57 @@
+"""Tests for the agenda view and indexed sort keys."""
+
+from datetime import datetime, timedelta
+
+from tests.conftest import USER_ID
+
+TASKS_URL = f"/api/{USER_ID}/tasks"
+
+
+async def _create(client, title: str, due: datetime | None) -> dict:
+    payload = {"title": title, "due_date": due.isoformat() if due else None}
+    response = await client.post(TASKS_URL, json=payload)
+    assert response.status_code == 201
+    return response.json()
+
+
+async def test_agenda_buckets_pending_tasks_by_due_date(client) -> None:
+    now = datetime.utcnow()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    await _create(client, "late", now - timedelta(days=2))
+    await _create(client, "tonight", now + (midnight + timedelta(days=1) - now) / 2)
+    await _create(client, "next week", midnight + timedelta(days=3))
+    await _create(client, "far away", midnight + timedelta(days=40))
+    await _create(client, "no date", None)
+    done = await _create(client, "done late", now - timedelta(days=1))
+    await client.patch(f"{TASKS_URL}/{done['id']}/complete")
+
+    response = await client.get(f"{TASKS_URL}/agenda", params={"counts": True})
+
+    assert response.status_code == 200
+    agenda = response.json()
+    assert [t["title"] for t in agenda["overdue"]["tasks"]] == ["late"]
+    assert [t["title"] for t in agenda["today"]["tasks"]] == ["tonight"]
+    assert [t["title"] for t in agenda["upcoming"]["tasks"]] == ["next week"]
+    assert [agenda[b]["count"] for b in ("overdue", "today", "upcoming")] == [1, 1, 1]
+
+
+async def test_agenda_limit_caps_tasks_but_not_counts(client) -> None:
+    now = datetime.utcnow()
+    for i in range(3):
+        await _create(client, f"late {i}", now - timedelta(days=3 - i))
+
+    agenda = (await client.get(
+        f"{TASKS_URL}/agenda", params={"limit": 2, "counts": True}
+    )).json()
+
+    assert [t["title"] for t in agenda["overdue"]["tasks"]] == ["late 0", "late 1"]
+    assert agenda["overdue"]["count"] == 3
+    assert agenda["today"]["count"] == 0
+
+
+async def test_list_tasks_rejects_unindexed_sort_key(client) -> None:
+    response = await client.get(TASKS_URL, params={"sort_by": "description"})
+    assert response.status_code == 422
+
+    response = await client.get(TASKS_URL, params={"sort_by": "due_date"})
+    assert response.status_code == 200
@@ -0,0 +1,89 @@
+"""Tests for native tool calling in TodoAgent."""
+
+import json
+
+from src.agent import TodoAgent
+from src.cache import LRUCache
+from src.database import async_session_maker
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+
+
+def _tool_results(request: dict) -> list:
+    return [
+        json.loads(m["content"]) for m in request["messages"] if m["role"] == "tool"
+    ]
+
+
+async def test_several_tool_calls_cost_one_round_trip(client, llm) -> None:
+    llm.replies = [
+        [
+            ("add_task", {"title": "milk"}),
+            ("add_task", {"title": "eggs", "priority": "high"}),
+            ("add_task", {"title": "bread"}),
+            ("list_tasks", {"status": "pending"}),
+        ],
+        "Added three tasks; you have 3 pending.",
+    ]
+
+    response = (await client.post(CHAT_URL, json={
+        "message": "Add milk, eggs (high) and bread, then show pending",
+    })).json()
+
+    assert len(llm.requests) == 2
+    assert llm.requests[0]["tools"] and llm.requests[0]["tool_choice"] == "auto"
+    assert response["tool_calls"] == ["add_task"] * 3 + ["list_tasks"]
+    assert response["response"] == "Added three tasks; you have 3 pending."
+
+    # The list runs after the adds, so it sees them
+    results = _tool_results(llm.requests[1])
+    assert sorted(row[1] for row in results[3]["rows"]) == ["bread", "eggs", "milk"]
+    tasks = (await client.get(f"/api/{USER_ID}/tasks")).json()
+    assert len(tasks) == 3
+
+
+async def test_independent_reads_run_on_their_own_sessions(db, llm) -> None:
+    opened = []
+
+    def session_factory():
+        opened.append(True)
+        return async_session_maker()
+
+    llm.replies = [
+        [
+            ("list_tasks", {"status": "pending"}),
+            ("list_tasks", {"status": "completed"}),
+        ],
+        "Nothing yet.",
+    ]
+    agent = TodoAgent(
+        USER_ID,
+        session_factory=session_factory,
+        reply_cache=LRUCache(maxsize=0),  # No task-state lookup
+    )
+    _, tool_calls = await agent.chat("pending and done?", [])
+
+    assert tool_calls == ["list_tasks", "list_tasks"]
+    # The round's own session plus one per concurrent read
+    assert len(opened) == 3
+    assert [r["rows"] for r in _tool_results(llm.requests[1])] == [[], []]
+
+
+async def test_tool_rounds_are_capped(db, llm) -> None:
+    llm.replies = [[("list_tasks", {})], [("list_tasks", {})], "Giving up."]
+    agent = TodoAgent(USER_ID)
+    agent.max_tool_rounds = 2
+    text, tool_calls = await agent.chat("loop", [])
+
+    assert text == "Giving up."
+    assert tool_calls == ["list_tasks", "list_tasks"]
+    assert [r["tool_choice"] for r in llm.requests] == ["auto", "auto", "none"]
+
+
+async def test_bad_arguments_are_reported_to_the_model(db, llm) -> None:
+    llm.replies = [[("complete_task", {"id": 1})], "Which task?"]
+    text, _ = await TodoAgent(USER_ID).chat("complete it", [])
+
+    assert text == "Which task?"
+    assert "Invalid arguments" in _tool_results(llm.requests[1])[0]["error"]
@@ -0,0 +1,90 @@
+"""Tests for POST /api/{user_id}/tasks/import."""
+
+import json
+
+from src.bulk_import import iter_lines
+from tests.conftest import USER_ID
+
+IMPORT_URL = f"/api/{USER_ID}/tasks/import"
+
+
+async def test_ndjson_import_reports_bad_lines(client) -> None:
+    body = "\n".join([
+        json.dumps({"title": "Buy milk", "priority": "high"}),
+        "",
+        "{not json",
+        json.dumps({"title": ""}),
+        json.dumps({"title": "Pay rent", "due_date": "2025-01-31T09:00:00Z"}),
+    ])
+
+    response = await client.post(
+        IMPORT_URL,
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["failed"] == 2
+    assert [e["line"] for e in result["errors"]] == [3, 4]
+    assert result["errors"][1]["error"].startswith("title:")
+
+    tasks = (await client.get(f"/api/{USER_ID}/tasks")).json()
+    assert {t["title"] for t in tasks} == {"Buy milk", "Pay rent"}
+
+
+async def test_csv_import_handles_multiline_fields(client) -> None:
+    body = (
+        "title,description,priority\r\n"
+        'Call mom,"line one\nline two",low\r\n'
+        "Broken,row\r\n"
+        "Water plants,,\r\n"
+    )
+
+    response = await client.post(
+        IMPORT_URL,
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["errors"] == [{"line": 4, "error": "Expected 3 columns, got 2"}]
+
+    tasks = (await client.get(f"/api/{USER_ID}/tasks")).json()
+    by_title = {t["title"]: t for t in tasks}
+    assert by_title["Call mom"]["description"] == "line one\nline two"
+    assert by_title["Call mom"]["priority"] == "low"
+    assert by_title["Water plants"]["priority"] == "medium"
+
+
+async def test_import_rejects_unknown_tag_ids(client) -> None:
+    body = json.dumps({"title": "Tagged", "tag_ids": [999]})
+
+    response = await client.post(IMPORT_URL, params={"format": "ndjson"}, content=body)
+
+    result = response.json()
+    assert result["imported"] == 0
+    assert result["errors"][0]["line"] == 1
+    assert "unknown tag" in result["errors"][0]["error"]
+
+
+async def test_import_rejects_non_utf8_body(client) -> None:
+    response = await client.post(
+        IMPORT_URL,
+        content=b"\xff\xfe\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Body must be UTF-8"
+
+
+async def test_iter_lines_joins_lines_split_across_chunks() -> None:
+    async def chunks():
+        # BOM, a CRLF line split over two chunks, "é" split mid-character
+        for chunk in (b"\xef\xbb\xbfab", b"c\r\nd", b"\xc3", b"\xa9\n", b"x"):
+            yield chunk
+
+    assert [line async for line in iter_lines(chunks())] == ["abc", "dé", "x"]
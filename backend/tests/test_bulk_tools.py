@@ -0,0 +1,91 @@
+"""Tests for the bulk chat tools."""
+
+import json
+
+from sqlmodel import select
+
+from src.database import async_session_maker
+from src.mcp_tools import BULK_MAX_ITEMS, MCPToolExecutor
+from src.models import Task, TaskTombstone
+from tests.conftest import USER_ID
+
+
+async def _add_tasks(user_id: str, titles: list[str]) -> list[int]:
+    async with async_session_maker() as session:
+        tasks = [Task(title=title, user_id=user_id) for title in titles]
+        session.add_all(tasks)
+        await session.commit()
+        return [task.id for task in tasks]
+
+
+async def test_add_tasks_in_one_tool_call(client, llm) -> None:
+    llm.replies = [
+        [("add_tasks", {"tasks": [
+            {"title": "milk"},
+            {"title": "eggs", "priority": "high"},
+            {"title": "bread", "due_date": "2030-01-01T10:00:00Z"},
+        ]})],
+        "Added milk, eggs and bread.",
+    ]
+
+    response = (await client.post(f"/api/{USER_ID}/chat", json={
+        "message": "add milk, eggs and bread",
+    })).json()
+
+    assert response["tool_calls"] == ["add_tasks"]
+    result = json.loads(llm.requests[1]["messages"][-1]["content"])
+    assert [title for _, title in result["tasks"]] == ["milk", "eggs", "bread"]
+
+    tasks = {t["title"]: t for t in (await client.get(f"/api/{USER_ID}/tasks")).json()}
+    assert tasks["eggs"]["priority"] == "high"
+    assert tasks["bread"]["due_date"].startswith("2030-01-01T10:00")
+
+
+async def test_complete_and_delete_many(db) -> None:
+    mine = await _add_tasks(USER_ID, ["a", "b", "c"])
+    (theirs,) = await _add_tasks("someone-else", ["not yours"])
+
+    async with async_session_maker() as session:
+        tools = MCPToolExecutor(session, USER_ID)
+        completed = await tools.complete_tasks([mine[0], str(mine[1]), theirs])
+        deleted = await tools.delete_tasks([mine[1], mine[2], theirs, 999])
+        await session.commit()
+
+        assert completed["tasks"] == [[mine[0], "a"], [mine[1], "b"]]
+        assert completed["not_found"] == [theirs]
+        assert [task_id for task_id, _ in deleted["tasks"]] == mine[1:]
+        assert deleted["not_found"] == [theirs, 999]
+
+        remaining = (await session.execute(select(Task.title))).scalars().all()
+        assert sorted(remaining) == ["a", "not yours"]
+        tombstones = (await session.execute(select(TaskTombstone.task_id))).scalars()
+        assert sorted(tombstones.all()) == mine[1:]
+
+
+async def test_bulk_tools_reject_oversized_batches(db) -> None:
+    async with async_session_maker() as session:
+        tools = MCPToolExecutor(session, USER_ID)
+        too_many = [{"title": str(i)} for i in range(BULK_MAX_ITEMS + 1)]
+        assert "error" in await tools.add_tasks(too_many)
+
+
+async def test_add_tasks_reports_invalid_items_and_adds_the_rest(db) -> None:
+    async with async_session_maker() as session:
+        tools = MCPToolExecutor(session, USER_ID)
+        result = await tools.add_tasks([
+            {"description": "no title"},
+            {"title": "x" * 201},
+            {"title": "ok", "priority": "High"},
+            {"title": "bad priority", "priority": "urgent"},
+        ])
+        await session.commit()
+
+        assert [title for _, title in result["tasks"]] == ["ok"]
+        assert [error["item"] for error in result["errors"]] == [0, 1, 3]
+        assert result["errors"][1]["error"].startswith("title:")
+
+        none_valid = await tools.add_tasks([{"description": "x"}])
+        assert none_valid["error"] == "No valid tasks"
+
+        tasks = (await session.execute(select(Task))).scalars().all()
+        assert [(t.title, t.priority.value) for t in tasks] == [("ok", "high")]
@@ -0,0 +1,39 @@
+"""The chat endpoint must not hold pooled DB connections while the LLM runs."""
+
+import asyncio
+
+from src.database import engine
+from tests.conftest import USER_ID
+
+
+async def test_task_api_stays_responsive_under_chat_load(client, llm) -> None:
+    # More chats than the pool has connections (pool_size + max_overflow)
+    chats = engine.pool.size() + engine.pool._max_overflow + 1
+    llm.gate = asyncio.Event()
+    llm.replies = [[("add_task", {"title": "from chat"})]] + ["ok"] * chats
+
+    pending = [
+        asyncio.create_task(client.post(f"/api/{USER_ID}/chat", json={
+            "message": f"hello {i}",
+        }))
+        for i in range(chats)
+    ]
+
+    async def all_waiting_on_model() -> None:
+        while len(llm.requests) < chats:
+            await asyncio.sleep(0.01)
+
+    # With connections held across the LLM call, the pool runs dry first
+    await asyncio.wait_for(all_waiting_on_model(), timeout=10)
+
+    # Every chat is waiting on the model, none holds a connection
+    assert engine.pool.checkedout() == 0
+    tasks = await asyncio.wait_for(client.get(f"/api/{USER_ID}/tasks"), timeout=5)
+    assert tasks.status_code == 200
+
+    llm.gate.set()
+    responses = await asyncio.gather(*pending)
+    assert all(r.status_code == 200 for r in responses)
+    # The tool round ran in its own transaction and was committed
+    titles = [t["title"] for t in (await client.get(f"/api/{USER_ID}/tasks")).json()]
+    assert titles == ["from chat"]
@@ -0,0 +1,58 @@
+"""Tests for the SSE chat endpoint."""
+
+import json
+
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+async def test_stream_emits_tool_events_tokens_and_persists_reply(client, llm) -> None:
+    llm.replies = [
+        [("add_task", {"title": "buy milk"})],
+        "Added buy milk to your list!",
+    ]
+
+    response = await client.post(f"{CHAT_URL}/stream", json={"message": "add buy milk"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    names = [name for name, _ in events]
+    assert names[:3] == ["start", "tool_call", "tool_result"]
+    assert names[-1] == "done" and "token" in names
+    assert events[1][1] == {"name": "add_task", "args": {"title": "buy milk"}}
+    text = "".join(data["text"] for name, data in events if name == "token")
+    assert text.strip() == "Added buy milk to your list!"
+
+    done = events[-1][1]
+    assert done["tool_calls"] == ["add_task"]
+    tasks = (await client.get(f"/api/{USER_ID}/tasks")).json()
+    assert [t["title"] for t in tasks] == ["buy milk"]
+
+    # The stored history includes the streamed reply
+    llm.replies = ["Anything else?"]
+    await client.post(CHAT_URL, json={
+        "conversation_id": done["conversation_id"], "message": "thanks",
+    })
+    history = llm.requests[-1]["messages"]
+    assert [m["role"] for m in history[1:]] == ["user", "assistant", "user"]
+    assert history[2]["content"].strip() == "Added buy milk to your list!"
+
+
+async def test_stream_plain_reply_without_tools(client, llm) -> None:
+    llm.replies = ["Hello there, how can I help?"]
+
+    response = await client.post(f"{CHAT_URL}/stream", json={"message": "hi"})
+
+    names = [name for name, _ in _parse_sse(response.text)]
+    assert names[0] == "start" and names[-1] == "done"
+    assert set(names[1:-1]) == {"token"}
@@ -0,0 +1,45 @@
+"""Tests for chat latency breakdown and token accounting."""
+
+from src.chat_trace import chat_history_messages, chat_llm_tokens, chat_phase_seconds
+from src.mcp_tools import mcp_tool_seconds
+from src.routes import chat as chat_routes
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+
+
+def _timings(header: str) -> dict[str, float]:
+    entries = (entry.split(";dur=") for entry in header.split(", "))
+    return {name: float(ms) for name, ms in entries}
+
+
+async def test_phases_and_tokens_are_recorded(client, llm, monkeypatch) -> None:
+    monkeypatch.setattr(chat_routes.settings, "chat_server_timing", True)
+    llm_count = chat_phase_seconds.count(phase="llm")
+    tool_count = mcp_tool_seconds.count(tool="add_task")
+    history_count = chat_history_messages.count()
+    prompt_tokens = chat_llm_tokens.value(kind="prompt")
+    llm.replies = [[("add_task", {"title": "stretch"})], "Added."]
+
+    response = await client.post(CHAT_URL, json={"message": "remember to stretch"})
+
+    timings = _timings(response.headers["Server-Timing"])
+    assert {"history", "llm_queue", "llm", "tools", "persist", "total"} <= set(timings)
+    assert timings["total"] >= timings["llm"] + timings["tools"]
+    assert chat_phase_seconds.count(phase="llm") == llm_count + 1
+    assert mcp_tool_seconds.count(tool="add_task") == tool_count + 1
+    assert chat_history_messages.count() == history_count + 1
+    assert chat_llm_tokens.value(kind="prompt") > prompt_tokens
+
+
+async def test_streamed_usage_is_counted(client, llm) -> None:
+    completion_tokens = chat_llm_tokens.value(kind="completion")
+    total_count = chat_phase_seconds.count(phase="total")
+    llm.replies = ["Hello there, how can I help?"]
+
+    response = await client.post(f"{CHAT_URL}/stream", json={"message": "hey"})
+
+    assert "event: done" in response.text
+    assert "Server-Timing" not in response.headers
+    assert chat_llm_tokens.value(kind="completion") > completion_tokens
+    assert chat_phase_seconds.count(phase="total") == total_count + 1
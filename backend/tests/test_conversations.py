@@ -0,0 +1,107 @@
+"""Tests for the conversation history API and retention."""
+
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from src.conversations import compact_conversations, prune_conversations
+from src.database import async_session_maker
+from src.models import Conversation, Message
+from tests.conftest import USER_ID
+
+CONVERSATIONS_URL = f"/api/{USER_ID}/conversations"
+START = datetime(2026, 1, 1)
+
+
+async def _conversation(
+    user_id: str = USER_ID,
+    messages: int = 0,
+    updated_at: datetime = START,
+    **fields,
+) -> int:
+    async with async_session_maker() as session:
+        conversation = Conversation(user_id=user_id, updated_at=updated_at, **fields)
+        session.add(conversation)
+        await session.flush()
+        session.add_all(
+            Message(
+                conversation_id=conversation.id,
+                user_id=user_id,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"message {i}",
+                # Pairs share a timestamp: the cursor must break ties by id
+                created_at=START + timedelta(seconds=i // 2),
+            )
+            for i in range(messages)
+        )
+        await session.commit()
+        return conversation.id
+
+
+async def test_scroll_back_through_messages(client) -> None:
+    conversation_id = await _conversation(messages=7)
+    url = f"{CONVERSATIONS_URL}/{conversation_id}/messages"
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 3} | ({"before": cursor} if cursor else {})
+        page = (await client.get(url, params=params)).json()
+        pages.append([m["content"] for m in page["messages"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [
+        ["message 4", "message 5", "message 6"],
+        ["message 1", "message 2", "message 3"],
+        ["message 0"],
+    ]
+
+    other = await _conversation(user_id="someone-else", messages=1)
+    response = await client.get(f"{CONVERSATIONS_URL}/{other}/messages")
+    assert response.status_code == 404
+    for bogus in ("nonsense", "99999999999999999999.1"):
+        response = await client.get(url, params={"before": bogus})
+        assert response.status_code == 400
+
+
+async def test_conversations_most_recently_active_first(client) -> None:
+    ids = [
+        await _conversation(updated_at=START + timedelta(hours=i % 2))
+        for i in range(4)
+    ]
+    await _conversation(user_id="someone-else")
+
+    first = (await client.get(CONVERSATIONS_URL, params={"limit": 3})).json()
+    rest = (await client.get(CONVERSATIONS_URL, params={
+        "limit": 3, "before": first["next_cursor"],
+    })).json()
+
+    seen = [c["id"] for c in first["conversations"] + rest["conversations"]]
+    assert seen == [ids[3], ids[1], ids[2], ids[0]]
+    assert rest["next_cursor"] is None
+
+
+async def test_retention_prunes_idle_and_compacts_summarized(db) -> None:
+    now = datetime.utcnow()
+    stale = await _conversation(messages=2, updated_at=now - timedelta(days=400))
+    async with async_session_maker() as session:
+        first_id = (await session.execute(select(Message.id))).scalars().first()
+    quiet = await _conversation(
+        messages=4,
+        updated_at=now - timedelta(days=60),
+        summary="- user: message 0",
+        summarized_until_id=first_id + 3,  # The first two messages of `quiet`
+    )
+    active = await _conversation(messages=2, updated_at=now)
+
+    async with async_session_maker() as session:
+        assert await prune_conversations(session, now - timedelta(days=180)) == 1
+        cutoff = now - timedelta(days=30)
+        assert await compact_conversations(session, cutoff, batch_size=1) == 2
+        assert await compact_conversations(session, cutoff) == 0
+
+        result = await session.execute(select(Message.conversation_id))
+        remaining = sorted(result.scalars().all())
+        assert remaining == [quiet, quiet, active, active]
+        assert await session.get(Conversation, stale) is None
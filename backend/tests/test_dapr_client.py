@@ -0,0 +1,28 @@
+"""Tests for the shared Dapr sidecar client."""
+
+import httpx
+
+from src import http_clients
+from src.events import DaprEventPublisher
+
+
+async def test_publishes_share_one_client(monkeypatch) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_clients, "_dapr_client", client)
+    publisher = DaprEventPublisher()
+
+    assert await publisher.publish("task-events", {"n": 1})
+    assert await publisher.publish("reminders", {"n": 2})
+
+    assert [r.url.path for r in requests] == [
+        "/v1.0/publish/kafka-pubsub/task-events",
+        "/v1.0/publish/kafka-pubsub/reminders",
+    ]
+    assert http_clients.get_dapr_client() is client
+    await client.aclose()
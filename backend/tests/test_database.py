@@ -0,0 +1,51 @@
+"""Tests for upgrading an already-deployed database schema."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from src.database import upgrade_schema
+
+
+def _schema(conn) -> tuple[set[str], set[str]]:
+    inspector = inspect(conn)
+    columns = {c["name"] for c in inspector.get_columns("conversation")}
+    indexes = {
+        index["name"]
+        for table in ("task", "conversation", "message")
+        for index in inspector.get_indexes(table)
+    }
+    return columns, indexes
+
+
+async def test_upgrade_adds_columns_and_indexes_to_old_tables(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/old.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        # Shape of a database created before these were added
+        for statement in (
+            "DROP INDEX ix_task_reminder_at_pending",
+            "DROP INDEX ix_message_conversation_id_created_at_id",
+            "CREATE INDEX ix_message_conversation_id ON message (conversation_id)",
+            "ALTER TABLE conversation DROP COLUMN summary",
+            "ALTER TABLE conversation DROP COLUMN summarized_until_id",
+        ):
+            await conn.execute(text(statement))
+
+    for _ in range(2):  # Idempotent
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
+
+    async with engine.connect() as conn:
+        columns, indexes = await conn.run_sync(_schema)
+    await engine.dispose()
+
+    assert {"summary", "summarized_until_id"} <= columns
+    assert {
+        "ix_task_reminder_at_pending",
+        "ix_task_user_id_updated_at",
+        "ix_conversation_user_id_updated_at",
+        "ix_message_conversation_id_created_at_id",
+    } <= indexes
+    assert "ix_message_conversation_id" not in indexes
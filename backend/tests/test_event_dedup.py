@@ -0,0 +1,53 @@
+"""Tests for idempotent consumption of redelivered events."""
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from src.database import async_session_maker
+from src.event_dedup import event_dedup, event_dedup_checks
+from src.models import Task
+
+COMPLETED = {
+    "event_id": "5f0c0e7a",
+    "event_type": "TaskCompleted",
+    "task_id": 1,
+    "user_id": "user-1",
+    "title": "water plants",
+    "recurrence": "weekly",
+    "timestamp": "2026-01-01T00:00:00",
+}
+
+
+async def _task_count() -> int:
+    async with async_session_maker() as session:
+        return (await session.execute(select(func.count()).select_from(Task))).scalar()
+
+
+async def test_redelivered_event_creates_one_task(client) -> None:
+    db_duplicates = event_dedup_checks.value(tier="db", result="duplicate")
+
+    await client.post("/events/task-events", json=COMPLETED)
+    await client.post("/events/task-events", json=COMPLETED)  # Caught in memory
+    assert await _task_count() == 1
+
+    event_dedup.recent.clear()  # As if redelivered to another replica
+    response = await client.post("/events/task-events/bulk", json={"entries": [
+        {"entryId": "a", "event": COMPLETED},
+    ]})
+
+    assert response.json()["statuses"] == [{"entryId": "a", "status": "SUCCESS"}]
+    assert await _task_count() == 1
+    assert event_dedup_checks.value(tier="db", result="duplicate") == db_duplicates + 1
+
+
+async def test_duplicates_within_a_batch(client) -> None:
+    other = {**COMPLETED, "event_id": "77aa01", "title": "stretch"}
+    response = await client.post("/events/task-events/bulk", json={"entries": [
+        {"entryId": "a", "event": COMPLETED},
+        {"entryId": "b", "event": other},
+        {"entryId": "c", "event": COMPLETED},
+    ]})
+
+    statuses = [s["status"] for s in response.json()["statuses"]]
+    assert statuses == ["SUCCESS", "SUCCESS", "SUCCESS"]
+    assert await _task_count() == 2
@@ -0,0 +1,78 @@
+"""Tests for token-budgeted chat history."""
+
+from src import history
+from src.database import async_session_maker
+from src.history import estimate_tokens, load_history
+from src.models import Conversation, Message
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+
+
+async def _conversation_with(contents: list[str]) -> int:
+    async with async_session_maker() as session:
+        conversation = Conversation(user_id=USER_ID)
+        session.add(conversation)
+        await session.flush()
+        for i, content in enumerate(contents):
+            session.add(Message(
+                conversation_id=conversation.id,
+                user_id=USER_ID,
+                role="user" if i % 2 == 0 else "assistant",
+                content=content,
+            ))
+        await session.commit()
+        return conversation.id
+
+
+async def test_old_messages_fold_into_summary(db) -> None:
+    conversation_id = await _conversation_with([f"message {i}" for i in range(6)])
+
+    async with async_session_maker() as session:
+        conversation = await session.get(Conversation, conversation_id)
+        result = await load_history(session, conversation, max_messages=2)
+        await session.commit()
+
+    assert [m["content"] for m in result[1:]] == ["message 4", "message 5"]
+    assert result[0]["role"] == "system"
+    assert "- user: message 0" in result[0]["content"]
+    assert "- assistant: message 3" in result[0]["content"]
+
+    async with async_session_maker() as session:
+        conversation = await session.get(Conversation, conversation_id)
+        # Already-summarized messages are not re-read or re-folded
+        again = await load_history(session, conversation, max_messages=2)
+    assert again == result
+
+
+async def test_window_respects_token_budget(db) -> None:
+    long = "x" * 400
+    conversation_id = await _conversation_with([long, long, "short"])
+
+    async with async_session_maker() as session:
+        conversation = await session.get(Conversation, conversation_id)
+        budget = estimate_tokens(long) + estimate_tokens("short")
+        result = await load_history(
+            session, conversation, token_budget=budget, summary_max_tokens=60
+        )
+
+    assert [m["content"] for m in result[1:]] == [long, "short"]
+    # Excerpts are truncated so the summary stays small
+    assert estimate_tokens(result[0]["content"]) <= 60 + 10
+
+
+async def test_chat_sends_summary_and_recent_window(client, llm, monkeypatch) -> None:
+    monkeypatch.setattr(history.settings, "chat_history_max_messages", 2)
+    llm.replies = ["reply 1", "reply 2", "reply 3"]
+
+    first = (await client.post(CHAT_URL, json={"message": "turn 1"})).json()
+    for turn in (2, 3):
+        await client.post(CHAT_URL, json={
+            "conversation_id": first["conversation_id"], "message": f"turn {turn}",
+        })
+
+    sent = llm.requests[-1]["messages"]
+    roles = [m["role"] for m in sent]
+    assert roles == ["system", "system", "user", "assistant", "user"]
+    assert "- user: turn 1" in sent[1]["content"]
+    assert [m["content"] for m in sent[2:]] == ["turn 2", "reply 2", "turn 3"]
@@ -0,0 +1,48 @@
+"""Tests for the fast-path intent router."""
+
+from benchmarks.intent_corpus import CORPUS
+from src.intent_router import route
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+
+
+def test_corpus_routes_as_expected() -> None:
+    mismatches = [
+        (phrase, route(phrase), intent)
+        for phrase, intent in CORPUS
+        if route(phrase) != intent
+    ]
+    assert mismatches == []
+
+
+async def test_routed_commands_skip_the_llm(client, llm) -> None:
+    tasks_url = f"/api/{USER_ID}/tasks"
+    task = (await client.post(tasks_url, json={"title": "buy milk"})).json()
+
+    listed = (await client.post(CHAT_URL, json={"message": "What's pending?"})).json()
+    assert listed["tool_calls"] == ["list_tasks"]
+    assert f"❌ #{task['id']} buy milk" in listed["response"]
+
+    done = (await client.post(CHAT_URL, json={
+        "conversation_id": listed["conversation_id"],
+        "message": f"mark task {task['id']} as done",
+    })).json()
+    assert done["tool_calls"] == ["complete_task"]
+    assert "buy milk" in done["response"]
+
+    missing = (await client.post(CHAT_URL, json={"message": "delete 999"})).json()
+    assert missing["response"] == "Sorry, task 999 not found."
+
+    assert llm.requests == []
+    tasks = (await client.get(tasks_url)).json()
+    assert tasks[0]["completed"] is True
+
+
+async def test_unmatched_messages_go_to_the_llm(client, llm) -> None:
+    llm.replies = ["Sure - what should the task be called?"]
+
+    response = (await client.post(CHAT_URL, json={"message": "add a task"})).json()
+
+    assert response["response"] == "Sure - what should the task be called?"
+    assert len(llm.requests) == 1
@@ -0,0 +1,77 @@
+"""Tests for the compact, paginated list_tasks chat tool."""
+
+import json
+from datetime import datetime, timedelta
+
+from src.database import async_session_maker
+from src.history import estimate_tokens
+from src.mcp_tools import LIST_PAGE_SIZE, MCPToolExecutor
+from src.models import Priority, Task
+from tests.conftest import USER_ID
+
+# Prompt size (system prompt, message and one page of tasks) for the
+# second LLM round of "show my tasks", however many tasks the user has
+PROMPT_TOKEN_CEILING = 1500
+
+
+async def _add_tasks(tasks: list[Task]) -> None:
+    async with async_session_maker() as session:
+        session.add_all(tasks)
+        await session.commit()
+
+
+async def test_pages_follow_cursor_without_gaps(db) -> None:
+    await _add_tasks([Task(title=f"task {i}", user_id=USER_ID) for i in range(45)])
+
+    seen, cursor = [], None
+    async with async_session_maker() as session:
+        tools = MCPToolExecutor(session, USER_ID)
+        while True:
+            page = await tools.list_tasks(cursor=cursor)
+            assert page["total"] == 45
+            seen += [row[1] for row in page["rows"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+    assert len(seen) == 45 and len(set(seen)) == 45
+    assert seen[0] == "task 44"
+
+
+async def test_priority_and_due_filters(db) -> None:
+    now = datetime.utcnow()
+    await _add_tasks([
+        Task(title="late", user_id=USER_ID, due_date=now - timedelta(days=2)),
+        Task(title="soon", user_id=USER_ID, due_date=now + timedelta(days=3),
+             priority=Priority.HIGH),
+        Task(title="someday", user_id=USER_ID, priority=Priority.HIGH),
+    ])
+
+    async with async_session_maker() as session:
+        tools = MCPToolExecutor(session, USER_ID)
+
+        async def titles(**filters) -> list[str]:
+            return [row[1] for row in (await tools.list_tasks(**filters))["rows"]]
+
+        assert await titles(due="overdue") == ["late"]
+        assert await titles(due="week") == ["soon"]
+        assert await titles(due="none") == ["someday"]
+        assert await titles(priority="high") == ["someday", "soon"]
+        assert await titles(priority="high", due="week") == ["soon"]
+
+
+async def test_listing_many_tasks_stays_within_token_ceiling(client, llm) -> None:
+    await _add_tasks([
+        Task(title=f"task {i} " + "with a rather long title " * 5,
+             description="lots of detail " * 40, user_id=USER_ID)
+        for i in range(300)
+    ])
+    llm.replies = [[("list_tasks", {})], "Here are your newest tasks."]
+
+    await client.post(f"/api/{USER_ID}/chat", json={"message": "list everything"})
+
+    messages = llm.requests[1]["messages"]
+    assert sum(estimate_tokens(json.dumps(m)) for m in messages) < PROMPT_TOKEN_CEILING
+    page = json.loads(messages[-1]["content"])
+    assert len(page["rows"]) == LIST_PAGE_SIZE
+    assert page["total"] == 300 and page["next_cursor"] is not None
@@ -0,0 +1,97 @@
+"""Tests for token-bucket admission of LLM requests."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.agent import BUSY_MESSAGE, TodoAgent
+from src.llm_scheduler import LLMQueueFullError, LLMScheduler, llm_retries
+from tests.conftest import USER_ID
+
+
+def _scheduler(tokens_per_minute: int = 60_000, **overrides) -> LLMScheduler:
+    options = {
+        "max_queue": 100,
+        "max_queue_per_user": 5,
+        "max_retries": 2,
+        "backoff_base": 0.01,
+        "backoff_max": 0.05,
+    } | overrides
+    return LLMScheduler(tokens_per_minute=tokens_per_minute, **options)
+
+
+async def test_requests_wait_for_tokens() -> None:
+    scheduler = _scheduler(tokens_per_minute=60_000)  # 1000 tokens/s
+    await scheduler.admit("a", 60_000)
+
+    start = time.monotonic()
+    await scheduler.admit("a", 100)
+    assert time.monotonic() - start >= 0.08
+
+
+async def test_waiting_users_are_served_round_robin() -> None:
+    scheduler = _scheduler(tokens_per_minute=6_000)  # 10 tokens per 0.1 s
+    await scheduler.admit("busy", 6_000)  # Drain the bucket
+    order = []
+
+    async def request(user: str, n: int) -> None:
+        await scheduler.admit(user, 10)
+        order.append(f"{user}{n}")
+
+    busy = [asyncio.create_task(request("busy", n)) for n in range(3)]
+    await asyncio.sleep(0)
+    other = asyncio.create_task(request("other", 0))
+    await asyncio.gather(*busy, other)
+
+    assert order == ["busy0", "other0", "busy1", "busy2"]
+
+
+async def test_queue_per_user_is_bounded() -> None:
+    scheduler = _scheduler(max_queue_per_user=2)
+    await scheduler.admit("a", 60_000)
+    waiting = [asyncio.create_task(scheduler.admit("a", 10)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    assert scheduler.depth() == 2
+    with pytest.raises(LLMQueueFullError):
+        await scheduler.admit("a", 10)
+    await scheduler.admit("b", 10)  # Other users still get in line
+    await asyncio.gather(*waiting)
+
+
+async def test_rate_limited_requests_are_retried(db, llm) -> None:
+    before = llm_retries.value(status=429)
+    llm.replies = [
+        httpx.Response(429, headers={"Retry-After": "0"}, text="slow down"),
+        httpx.Response(503, text="unavailable"),
+        "Hello!",
+    ]
+
+    agent = TodoAgent(USER_ID, scheduler=_scheduler())
+    text, _ = await agent.chat("hi there", [])
+
+    assert text == "Hello!"
+    assert len(llm.requests) == 3
+    assert llm_retries.value(status=429) == before + 1
+
+
+async def test_gives_up_after_max_retries(db, llm) -> None:
+    llm.replies = [httpx.Response(500, text="boom")] * 3
+
+    agent = TodoAgent(USER_ID, scheduler=_scheduler(max_retries=2))
+    text, _ = await agent.chat("hi there", [])
+
+    assert text.startswith("Sorry, I encountered an error")
+    assert len(llm.requests) == 3
+
+
+async def test_full_queue_gets_a_busy_reply(db, llm) -> None:
+    scheduler = _scheduler(max_queue=0)
+    await scheduler.admit(USER_ID, 60_000)
+
+    text, _ = await TodoAgent(USER_ID, scheduler=scheduler).chat("hi there", [])
+
+    assert text == BUSY_MESSAGE
+    assert llm.requests == []
@@ -0,0 +1,25 @@
+"""The bundled mock LLM drives the real agent through a tool round."""
+
+import httpx
+
+from benchmarks.mock_llm import create_app
+from src.agent import TodoAgent
+from tests.conftest import USER_ID
+
+
+async def test_agent_runs_scripted_tool_calls_against_mock(db) -> None:
+    mock = create_app()
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=mock))
+    agent = TodoAgent(USER_ID, http_client=http_client)
+    agent.api_url = "http://mock-llm/v1/chat/completions"
+
+    async with http_client:
+        added = await agent.chat("please add a task to water the plants", [])
+        chatted = await agent.chat("how are you?", [])
+
+    assert added[1] == ["add_task"]
+    assert chatted[1] == []
+    # One request for the tool call, one for the answer, one for the chat
+    assert mock.state.requests == 3
+    listed = await agent._run_intent(agent._route("show my tasks"))
+    assert [row[1] for row in listed["rows"]] == ["water the plants"]
@@ -0,0 +1,96 @@
+"""Tests for the transactional task-event outbox."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from src.database import async_session_maker
+from src.models import OutboxEvent
+from src.outbox import OutboxRelay
+from tests.conftest import USER_ID
+
+TASKS_URL = f"/api/{USER_ID}/tasks"
+
+
+class Sidecar:
+    """Bulk publisher that fails the events listed in `fail`."""
+
+    def __init__(self) -> None:
+        self.published: list[dict] = []
+        self.fail: set[str] = set()
+
+    async def publish(self, topic: str, events: list[dict]) -> list[int]:
+        failed = [i for i, e in enumerate(events) if e["event_type"] in self.fail]
+        self.published += [e for i, e in enumerate(events) if i not in failed]
+        return failed
+
+
+def _relay(sidecar: Sidecar, max_attempts: int = 3) -> OutboxRelay:
+    return OutboxRelay(
+        async_session_maker,
+        sidecar.publish,
+        batch_size=10,
+        poll_interval=60,
+        max_attempts=max_attempts,
+    )
+
+
+async def _outbox() -> list[OutboxEvent]:
+    async with async_session_maker() as session:
+        result = await session.execute(select(OutboxEvent).order_by(OutboxEvent.id))
+        return list(result.scalars().all())
+
+
+async def test_task_changes_are_written_to_the_outbox(client) -> None:
+    task = (await client.post(TASKS_URL, json={
+        "title": "water plants", "recurrence": "weekly",
+    })).json()
+    await client.patch(f"{TASKS_URL}/{task['id']}/complete")
+    await client.delete(f"{TASKS_URL}/{task['id']}")
+    await client.delete(f"{TASKS_URL}/{task['id']}")  # 404: nothing written
+
+    rows = await _outbox()
+    events = [json.loads(row.payload) for row in rows]
+    assert [e["event_type"] for e in events] == [
+        "TaskCreated", "TaskCompleted", "TaskDeleted",
+    ]
+    assert {row.topic for row in rows} == {"task-events"}
+    assert events[1]["recurrence"] == "weekly"
+    assert all(row.sent_at is None for row in rows)
+
+
+async def test_relay_marks_sent_and_retries_failures(client) -> None:
+    sidecar = Sidecar()
+    sidecar.fail = {"TaskUpdated"}
+    relay = _relay(sidecar, max_attempts=2)
+    task = (await client.post(TASKS_URL, json={"title": "a"})).json()
+    await client.put(f"{TASKS_URL}/{task['id']}", json={"title": "b"})
+
+    now = datetime.utcnow()
+    assert await relay.relay_once(now) == 2
+    created, updated = await _outbox()
+    assert created.sent_at == now
+    assert (updated.sent_at, updated.attempts) == (None, 1)
+    assert await relay.relay_once(now) == 0  # Backing off
+
+    later = now + timedelta(minutes=1)
+    assert await relay.relay_once(later) == 1
+    _, updated = await _outbox()
+    assert updated.next_attempt_at is None  # Parked after max_attempts
+    assert await relay.relay_once(later + timedelta(hours=1)) == 0
+    assert [e["event_type"] for e in sidecar.published] == ["TaskCreated"]
+
+
+async def test_bulk_import_writes_one_summary_event(client) -> None:
+    body = "\n".join(json.dumps({"title": t}) for t in ("a", "b", "")).encode()
+    await client.post(
+        f"{TASKS_URL}/import",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    (row,) = await _outbox()
+    event = json.loads(row.payload)
+    assert (row.topic, event["event_type"]) == ("task-events", "TasksImported")
+    assert (event["imported"], event["failed"]) == (2, 1)
@@ -0,0 +1,53 @@
+"""Tests for the reminder cron."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from src.database import async_session_maker
+from src.models import OutboxEvent, Task
+from src.routes.dapr_events import process_due_reminders
+
+NOW = datetime(2026, 3, 1, 9, 0)
+
+
+def _task(title: str, hours: int, completed: bool = False) -> Task:
+    return Task(
+        title=title,
+        user_id="user-1",
+        completed=completed,
+        reminder_at=NOW + timedelta(hours=hours),
+    )
+
+
+async def _seed() -> None:
+    async with async_session_maker() as session:
+        session.add_all(_task(f"due {i}", -i) for i in range(7))
+        session.add(_task("later", 1))
+        session.add(_task("done", -1, completed=True))
+        await session.commit()
+
+
+async def test_due_reminders_are_chunked_and_capped(db) -> None:
+    await _seed()
+
+    assert await process_due_reminders(NOW, chunk_size=3, max_reminders=5) == (5, True)
+    assert await process_due_reminders(NOW, chunk_size=3, max_reminders=5) == (2, False)
+    assert await process_due_reminders(NOW, chunk_size=3, max_reminders=5) == (0, False)
+
+    async with async_session_maker() as session:
+        result = await session.execute(select(OutboxEvent).order_by(OutboxEvent.id))
+        rows = result.scalars().all()
+        pending = (await session.execute(
+            select(Task.title).where(Task.reminder_at.is_not(None)).order_by(Task.title)
+        )).scalars().all()
+        cleared = (await session.execute(
+            select(Task.updated_at).where(Task.reminder_at.is_(None))
+        )).scalars().all()
+
+    titles = [json.loads(row.payload)["title"] for row in rows]
+    assert titles == [f"due {i}" for i in range(6, -1, -1)]  # Oldest first
+    assert {row.topic for row in rows} == {"reminders"}
+    assert pending == ["done", "later"]
+    assert cleared == [NOW] * 7  # Picked up by delta sync
@@ -0,0 +1,95 @@
+"""Tests for the task-state-aware chat reply cache."""
+
+from src.agent import TodoAgent
+from src.cache import chat_reply_cache_requests
+from src.database import async_session_maker
+from src.models import Task
+from tests.conftest import USER_ID
+
+CHAT_URL = f"/api/{USER_ID}/chat"
+QUESTION = "How am I doing this week?"
+
+
+def _list_then_reply(text: str) -> list:
+    return [[("list_tasks", {"status": "pending", "due": "week"})], text]
+
+
+async def test_repeat_question_is_served_until_tasks_change(client, llm) -> None:
+    hits = chat_reply_cache_requests.value(outcome="hit")
+    llm.replies = _list_then_reply("Nothing due.") + _list_then_reply("One task due.")
+
+    first = (await client.post(CHAT_URL, json={"message": QUESTION})).json()
+    repeat = {"message": "how am i doing this week"}
+    again = (await client.post(CHAT_URL, json=repeat)).json()
+
+    assert again["response"] == first["response"] == "Nothing due."
+    assert again["tool_calls"] == ["list_tasks"]
+    assert len(llm.requests) == 2
+    assert chat_reply_cache_requests.value(outcome="hit") == hits + 1
+
+    await client.post(f"/api/{USER_ID}/tasks", json={"title": "file taxes"})
+    after = (await client.post(CHAT_URL, json={"message": QUESTION})).json()
+
+    assert after["response"] == "One task due."
+    assert len(llm.requests) == 4
+
+
+async def test_turns_that_write_are_not_cached(client, llm) -> None:
+    message = "I need to remember the dentist"
+    llm.replies = [
+        [("add_task", {"title": "dentist"})], "Added.",
+        [("add_task", {"title": "dentist"})], "Added again.",
+    ]
+
+    await client.post(CHAT_URL, json={"message": message})
+    second = (await client.post(CHAT_URL, json={"message": message})).json()
+
+    assert second["response"] == "Added again."
+    assert len(llm.requests) == 4
+
+
+async def test_other_users_do_not_share_replies(client, llm) -> None:
+    llm.replies = _list_then_reply("Mine.") + _list_then_reply("Theirs.")
+
+    mine, _ = await TodoAgent(USER_ID).chat(QUESTION, [])
+    theirs, _ = await TodoAgent("someone-else").chat(QUESTION, [])
+
+    assert (mine, theirs) == ("Mine.", "Theirs.")
+
+
+async def test_follow_ups_are_keyed_by_recent_history(db, llm) -> None:
+    llm.replies = _list_then_reply("Task 4.") + _list_then_reply("Task 9.")
+    agent = TodoAgent(USER_ID)
+
+    first, _ = await agent.chat("the second one", [
+        {"role": "user", "content": "show tasks due today"},
+    ])
+    second, _ = await agent.chat("the second one", [
+        {"role": "user", "content": "show high priority tasks"},
+    ])
+
+    assert (first, second) == ("Task 4.", "Task 9.")
+
+
+async def test_replies_without_task_reads_are_not_cached(db, llm) -> None:
+    llm.replies = ["Which list do you mean?", "The pending one?"]
+    agent = TodoAgent(USER_ID)
+    agent.task_snapshot = True  # The model could answer from the snapshot
+
+    first, _ = await agent.chat(QUESTION, [])
+    second, _ = await agent.chat(QUESTION, [])
+
+    assert (first, second) == ("Which list do you mean?", "The pending one?")
+
+
+async def test_writes_on_another_replica_invalidate(db, llm) -> None:
+    llm.replies = _list_then_reply("Nothing due.") + _list_then_reply("One due.")
+    agent = TodoAgent(USER_ID)
+    await agent.chat(QUESTION, [])
+
+    async with async_session_maker() as session:
+        # Written straight to the database, as another replica would
+        session.add(Task(title="file taxes", user_id=USER_ID))
+        await session.commit()
+
+    assert (await agent.chat(QUESTION, []))[0] == "One due."
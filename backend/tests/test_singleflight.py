@@ -0,0 +1,61 @@
+"""Tests for request coalescing of identical concurrent reads."""
+
+import asyncio
+
+import pytest
+
+from src.singleflight import SingleFlight
+from tests.conftest import USER_ID
+
+
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight: SingleFlight[int] = SingleFlight("test-share")
+    calls = 0
+
+    async def slow_query() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    results = await asyncio.gather(*(flight.do("k", slow_query) for _ in range(10)))
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert flight.hit_ratio() == pytest.approx(0.9)
+
+    # Not a cache: a later call runs again
+    assert await flight.do("k", slow_query) == 42
+    assert calls == 2
+
+
+async def test_different_keys_and_errors_are_not_shared() -> None:
+    flight: SingleFlight[str] = SingleFlight("test-errors")
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    async def ok() -> str:
+        return "ok"
+
+    results = await asyncio.gather(
+        flight.do("a", fail), flight.do("a", fail), flight.do("b", ok),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results[:2]] == [RuntimeError, RuntimeError]
+    assert results[2] == "ok"
+
+
+async def test_list_and_stats_endpoints_serve_coalesced_json(client) -> None:
+    await client.post(f"/api/{USER_ID}/tasks", json={"title": "one"})
+
+    url = f"/api/{USER_ID}/tasks"
+    lists = await asyncio.gather(*(client.get(url) for _ in range(5)))
+    stats = await client.get(f"/api/{USER_ID}/stats")
+
+    assert all(r.json()[0]["title"] == "one" for r in lists)
+    assert stats.json() == {"total": 1, "complete": 0, "pending": 1}
+    metrics = (await client.get("/metrics")).text
+    assert 'singleflight_requests_total{flight="reads",role="leader"}' in metrics
@@ -0,0 +1,153 @@
+"""Tests for the delta-sync change feed."""
+
+from datetime import datetime, timedelta
+
+from src import crud
+from src.database import async_session_maker
+from src.models import TagCreate, Task, TaskTombstone
+from src.routes import tasks as task_routes
+from src.sync import ChangeCursor, StreamPosition, get_task_changes, purge_tombstones
+from tests.conftest import USER_ID
+
+TASKS_URL = f"/api/{USER_ID}/tasks"
+CHANGES_URL = f"{TASKS_URL}/changes"
+
+
+async def test_changes_since_cursor_include_updates_and_deletes(
+    client, monkeypatch
+) -> None:
+    monkeypatch.setattr(task_routes.settings, "sync_safety_window", 0.0)
+    ids = [
+        (await client.post(TASKS_URL, json={"title": f"task {i}"})).json()["id"]
+        for i in range(3)
+    ]
+    initial = (await client.get(CHANGES_URL)).json()
+    assert [t["id"] for t in initial["changed"]] == ids
+    assert initial["deleted"] == []
+
+    await client.put(f"{TASKS_URL}/{ids[0]}", json={"title": "renamed"})
+    await client.delete(f"{TASKS_URL}/{ids[1]}")
+
+    delta = (await client.get(CHANGES_URL, params={"since": initial["cursor"]})).json()
+    assert [t["title"] for t in delta["changed"]] == ["renamed"]
+    assert delta["deleted"] == [ids[1]]
+    assert not delta["has_more"]
+
+    empty = (await client.get(CHANGES_URL, params={"since": delta["cursor"]})).json()
+    assert empty["changed"] == [] and empty["deleted"] == []
+    assert empty["cursor"] == delta["cursor"]
+
+
+async def test_changes_page_through_stream_without_gaps(client, monkeypatch) -> None:
+    monkeypatch.setattr(task_routes.settings, "sync_safety_window", 0.0)
+    for i in range(5):
+        await client.post(TASKS_URL, json={"title": f"task {i}"})
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} | ({"since": cursor} if cursor else {})
+        page = (await client.get(CHANGES_URL, params=params)).json()
+        seen += [t["title"] for t in page["changed"]]
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            break
+
+    assert seen == [f"task {i}" for i in range(5)]
+
+    # With the safety window, a caught-up client re-reads the changes made
+    # inside it once (in pages), then settles
+    monkeypatch.undo()
+    seen, cursor = [], None
+    for _ in range(10):
+        params = {"limit": 2} | ({"since": cursor} if cursor else {})
+        page = (await client.get(CHANGES_URL, params=params)).json()
+        seen += [t["title"] for t in page["changed"]]
+        cursor = page["cursor"]
+        if not page["has_more"]:
+            break
+
+    assert seen == [f"task {i}" for i in range(5)] * 2
+    assert not page["has_more"]
+
+
+async def test_deleting_a_tag_reports_its_tasks_as_changed(
+    client, monkeypatch
+) -> None:
+    monkeypatch.setattr(task_routes.settings, "sync_safety_window", 0.0)
+    async with async_session_maker() as session:
+        tag = await crud.create_tag(session, TagCreate(name="home"))
+    await client.post(TASKS_URL, json={"title": "tagged", "tag_ids": [tag.id]})
+    await client.post(TASKS_URL, json={"title": "untagged"})
+    cursor = (await client.get(CHANGES_URL)).json()["cursor"]
+
+    async with async_session_maker() as session:
+        assert await crud.delete_tag(session, tag.id)
+
+    delta = (await client.get(CHANGES_URL, params={"since": cursor})).json()
+    assert [t["title"] for t in delta["changed"]] == ["tagged"]
+
+
+async def test_expired_or_invalid_cursor(client) -> None:
+    await client.post(TASKS_URL, json={"title": "kept"})
+    position = StreamPosition(datetime.utcnow() - timedelta(days=365), 0, 0)
+    stale = ChangeCursor(position, position).encode()
+
+    response = (await client.get(CHANGES_URL, params={"since": stale})).json()
+    assert response["reset"] is True
+    assert [t["title"] for t in response["changed"]] == ["kept"]
+
+    for bogus in ("bogus", "99999999999999999999.0.1.0.0.1"):
+        response = await client.get(CHANGES_URL, params={"since": bogus})
+        assert response.status_code == 400
+
+
+async def test_late_commit_behind_cursor_is_reread(db) -> None:
+    now = datetime(2026, 3, 1, 9, 0)
+
+    async def changes(since: str | None, at: datetime) -> tuple[list[str], str]:
+        async with async_session_maker() as session:
+            page = await get_task_changes(
+                session,
+                USER_ID,
+                ChangeCursor.decode(since) if since else None,
+                limit=10,
+                retention=timedelta(days=30),
+                safety_window=timedelta(seconds=30),
+                now=at,
+            )
+        return sorted(t.title for t in page.changed), page.cursor
+
+    async with async_session_maker() as session:
+        session.add(Task(
+            title="early", user_id=USER_ID, updated_at=now - timedelta(seconds=1)
+        ))
+        await session.commit()
+    seen, cursor = await changes(None, now)
+    assert seen == ["early"]
+
+    # Stamped before "early" but committed after the client read past it
+    async with async_session_maker() as session:
+        session.add(Task(
+            title="late", user_id=USER_ID, updated_at=now - timedelta(seconds=2)
+        ))
+        await session.commit()
+    seen, cursor = await changes(cursor, now + timedelta(seconds=1))
+    assert seen == ["early", "late"]
+
+    # Once the window has passed the cursor settles and stops re-reading
+    seen, cursor = await changes(cursor, now + timedelta(minutes=1))
+    assert seen == ["early", "late"]
+    seen, cursor = await changes(cursor, now + timedelta(minutes=2))
+    assert seen == []
+
+
+async def test_purge_tombstones_respects_retention(db) -> None:
+    now = datetime.utcnow()
+    async with async_session_maker() as session:
+        session.add(TaskTombstone(task_id=1, user_id=USER_ID, deleted_at=now))
+        session.add(TaskTombstone(
+            task_id=2, user_id=USER_ID, deleted_at=now - timedelta(days=60)
+        ))
+        await session.commit()
+
+        assert await purge_tombstones(session, now - timedelta(days=30)) == 1
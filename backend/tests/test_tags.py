@@ -0,0 +1,83 @@
+"""Tests for tag filtering, tag usage counts and the per-user tag cache."""
+
+from src import crud
+from src.cache import user_tag_cache
+from src.database import async_session_maker
+from src.models import TagCreate, TaskTagLink
+from tests.conftest import USER_ID
+
+TASKS_URL = f"/api/{USER_ID}/tasks"
+
+
+async def _create_tags(*names: str) -> dict[str, int]:
+    async with async_session_maker() as session:
+        return {
+            name: (await crud.create_tag(session, TagCreate(name=name))).id
+            for name in names
+        }
+
+
+async def _add(client, title: str, *tag_ids: int) -> dict:
+    response = await client.post(TASKS_URL, json={"title": title, "tag_ids": tag_ids})
+    assert response.status_code == 201
+    return response.json()
+
+
+async def _titles(client, **params) -> set[str]:
+    response = await client.get(TASKS_URL, params=params)
+    assert response.status_code == 200
+    return {t["title"] for t in response.json()}
+
+
+async def test_filter_by_tags_all_and_any(client) -> None:
+    tags = await _create_tags("home", "urgent", "work")
+    await _add(client, "fix sink", tags["home"], tags["urgent"])
+    await _add(client, "laundry", tags["home"])
+    await _add(client, "report", tags["work"])
+    await _add(client, "untagged")
+
+    assert await _titles(client, tags="home,urgent", tag_mode="all") == {"fix sink"}
+    assert await _titles(client, tags="home,work") == {"fix sink", "laundry", "report"}
+    assert await _titles(client, tags="home,nope", tag_mode="all") == set()
+    assert await _titles(client, tags="nope") == set()
+
+
+async def test_tag_usage_counts_are_per_user_and_ordered(client) -> None:
+    tags = await _create_tags("home", "work")
+    await _add(client, "a", tags["work"])
+    await _add(client, "b", tags["work"], tags["home"])
+
+    response = await client.get(f"/api/{USER_ID}/tags")
+
+    assert response.status_code == 200
+    assert [(t["name"], t["task_count"]) for t in response.json()] == [
+        ("work", 2),
+        ("home", 1),
+    ]
+    page = (await client.get(f"/api/{USER_ID}/tags", params={"skip": 1})).json()
+    assert [t["name"] for t in page] == ["home"]
+
+
+async def test_tag_cache_is_invalidated_by_tag_writes(client) -> None:
+    tags = await _create_tags("home")
+    await client.get(f"/api/{USER_ID}/tags")
+    assert user_tag_cache.get(USER_ID) == {(0, 50): []}
+
+    created = await _add(client, "a", tags["home"])
+    assert user_tag_cache.get(USER_ID) is None
+    assert await _titles(client, tags="home") == {"a"}
+
+    await client.delete(f"{TASKS_URL}/{created['id']}")
+    assert (await client.get(f"/api/{USER_ID}/tags")).json() == []
+
+
+async def test_tag_filter_sees_tags_linked_on_another_replica(client) -> None:
+    tags = await _create_tags("new")
+    created = await _add(client, "a")
+    await client.get(f"/api/{USER_ID}/tags")  # Caches an empty usage list
+    async with async_session_maker() as session:
+        # Written without touching this process's cache
+        session.add(TaskTagLink(task_id=created["id"], tag_id=tags["new"]))
+        await session.commit()
+
+    assert await _titles(client, tags="new") == {"a"}
@@ -0,0 +1,64 @@
+"""Tests for the task-events consumer (single and bulk delivery)."""
+
+from sqlmodel import select
+
+from src.database import async_session_maker
+from src.models import OutboxEvent, Task
+from src.routes import dapr_events
+
+
+def _completed(task_id: int, title: str, recurrence: str = "daily") -> dict:
+    return {
+        "event_type": "TaskCompleted",
+        "task_id": task_id,
+        "user_id": "user-1",
+        "title": title,
+        "recurrence": recurrence,
+        "timestamp": "2026-01-01T00:00:00",
+    }
+
+
+def _cloud_event(data: dict) -> dict:
+    return {"specversion": "1.0", "type": "com.dapr.event.sent", "data": data}
+
+
+async def _titles() -> list[str]:
+    async with async_session_maker() as session:
+        result = await session.execute(select(Task.title).order_by(Task.id))
+        return list(result.scalars().all())
+
+
+async def test_bulk_delivery_reports_per_entry_status(client) -> None:
+    subscriptions = (await client.get("/dapr/subscribe")).json()
+    assert subscriptions[0]["bulkSubscribe"]["enabled"] is True
+
+    response = await client.post(subscriptions[0]["route"], json={"entries": [
+        {"entryId": "a", "event": _cloud_event(_completed(1, "stretch"))},
+        {"entryId": "b", "event": _completed(2, "one-off", recurrence="none")},
+        {"entryId": "c", "event": "not json"},
+        {"entryId": "d", "event": _cloud_event(_completed(3, "review", "weekly"))},
+    ]})
+
+    assert response.json()["statuses"] == [
+        {"entryId": "a", "status": "SUCCESS"},
+        {"entryId": "b", "status": "SUCCESS"},
+        {"entryId": "c", "status": "DROP"},
+        {"entryId": "d", "status": "SUCCESS"},
+    ]
+    assert await _titles() == ["stretch", "review"]
+    async with async_session_maker() as session:
+        outbox = (await session.execute(select(OutboxEvent))).scalars().all()
+    assert len(outbox) == 2
+
+
+async def test_failed_batch_is_retried(client, monkeypatch) -> None:
+    async def unavailable(completed: list[dict]) -> list[Task]:
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(dapr_events, "create_next_recurring_tasks", unavailable)
+    response = await client.post("/events/task-events/bulk", json={"entries": [
+        {"entryId": "a", "event": _completed(1, "stretch")},
+        {"entryId": "b", "event": {**_completed(2, "x"), "event_type": "TaskUpdated"}},
+    ]})
+
+    assert [s["status"] for s in response.json()["statuses"]] == ["RETRY", "SUCCESS"]
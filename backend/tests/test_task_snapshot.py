@@ -0,0 +1,64 @@
+"""Tests for the pending-task snapshot in the agent's context."""
+
+from datetime import datetime, timedelta
+
+from src.agent import TodoAgent
+from src.database import async_session_maker
+from src.models import Priority, Task
+from src.task_snapshot import build_snapshot, get_snapshot
+from tests.conftest import USER_ID
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+async def test_snapshot_lists_overdue_first_within_the_cap(db) -> None:
+    async with async_session_maker() as session:
+        session.add_all([
+            Task(title="someday", user_id=USER_ID),
+            Task(title="next week", user_id=USER_ID, due_date=NOW + timedelta(days=7)),
+            Task(title="late", user_id=USER_ID, priority=Priority.HIGH,
+                 due_date=NOW - timedelta(days=1)),
+            Task(title="done", user_id=USER_ID, completed=True),
+            Task(title="not yours", user_id="someone-else"),
+        ])
+        await session.commit()
+
+        snapshot = await build_snapshot(session, USER_ID, max_tokens=400, now=NOW)
+        rows = [line for line in snapshot.splitlines() if " | " in line][1:]
+        assert [row.split(" | ")[1] for row in rows] == ["late", "next week", "someday"]
+        assert rows[0].endswith("| high | 2026-03-09T12:00 (overdue)")
+        assert "3 pending, 1 overdue." in snapshot
+
+        capped = await build_snapshot(session, USER_ID, max_tokens=15, now=NOW)
+        assert "the first 1 are shown" in capped
+        assert "next week" not in capped
+
+
+async def test_questions_are_answered_in_one_completion(client, llm) -> None:
+    await client.post(f"/api/{USER_ID}/tasks", json={"title": "water plants"})
+    llm.replies = ["Just one: water plants.", "Water plants and pay rent."]
+
+    agent = TodoAgent(USER_ID)
+    agent.task_snapshot = True
+    text, tool_calls = await agent.chat("Anything left for me?", [])
+
+    assert (text, tool_calls) == ("Just one: water plants.", [])
+    assert len(llm.requests) == 1
+    assert "water plants" in llm.requests[0]["messages"][1]["content"]
+
+    # A write invalidates both the snapshot and the cached reply
+    await client.post(f"/api/{USER_ID}/tasks", json={"title": "pay rent"})
+    text, _ = await agent.chat("Anything left for me?", [])
+    assert text == "Water plants and pay rent."
+    assert "pay rent" in llm.requests[1]["messages"][1]["content"]
+
+
+async def test_snapshot_follows_writes_on_another_replica(db) -> None:
+    async with async_session_maker() as session:
+        assert "0 pending" in await get_snapshot(session, USER_ID)
+
+        # Written straight to the database, as another replica would
+        session.add(Task(title="file taxes", user_id=USER_ID))
+        await session.commit()
+
+        assert "file taxes" in await get_snapshot(session, USER_ID)